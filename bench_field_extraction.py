@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Time extract_fields on adversarial inputs (the multi-MB single-line text MinerU sometimes
+emits, and line-rich text whose keyword anchors all fail) for each available regex engine.
+
+  python bench_field_extraction.py --mb 4 --engines re,re2 --budget 30
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Callable, Dict, List
+
+from tender_radar import configure_field_extraction, extract_fields
+
+FILING_SNIPPET = (
+    "Independent auditor's report to the members of Example plc. "
+    "Auditor's remuneration £000 2023 2022 "
+    "Fees payable to the company's auditor for the audit of the annual accounts 245 230 "
+    "Tax advisory services 12 10 Total 257 240 "
+    "Signed for and on behalf of KPMG LLP, Statutory Auditor. For the year ended 31 March 2023. "
+)
+
+
+def adversarial_cases(size: int) -> Dict[str, Callable[[], str]]:
+    """Case name -> builder of roughly size characters of adversarial text."""
+
+    def repeat(chunk: str) -> str:
+        return chunk * max(1, size // len(chunk))
+
+    return {
+        "filing_as_one_line": lambda: repeat(FILING_SNIPPET),
+        "fee_sentences_without_amount": lambda: repeat("fees payable to the auditor for the audit of the accounts "),
+        "audit_fee_then_whitespace": lambda: "audit fees" + " " * size + "1",
+        "audit_words_without_digits": lambda: repeat("audit fees remuneration statutory audit "),
+        "blank_lines_before_auditor": lambda: "\n" * size + "Auditor: KPMG LLP",
+        "space_lines_before_auditor": lambda: " \n" * (size // 2) + "  Auditors - KPMG LLP",
+        "behalf_then_whitespace": lambda: "for and on behalf of" + " " * size + "KPMG LLP",
+        "report_headings_without_newline": lambda: repeat("independent auditors' report "),
+        "pound_then_whitespace": lambda: repeat("£" + " " * 1000),
+        "year_ended_without_year": lambda: repeat("for the year ended 31 march "),
+        "failed_anchors_on_many_lines": lambda: repeat(
+            "Independent auditor report for and on behalf of the board. Audit of the accounts noted.\n"
+        ),
+    }
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Benchmark field extraction on adversarial long-line inputs")
+    p.add_argument("--mb", type=float, default=4.0, help="Approximate size of each input in MB")
+    p.add_argument("--engines", default="re,re2", help="Comma-separated regex engines to compare")
+    p.add_argument("--budget", type=float, default=0.0, help="Per-document budget in seconds (0 = none)")
+    p.add_argument("--cases", default="", help="Comma-separated case names (default: all)")
+    args = p.parse_args()
+
+    size = int(args.mb * 1024 * 1024)
+    cases = adversarial_cases(size)
+    wanted = [c for c in args.cases.split(",") if c] or list(cases)
+    engines: List[str] = []
+    for engine in [e.strip() for e in args.engines.split(",") if e.strip()]:
+        active = configure_field_extraction(engine, budget_s=args.budget)
+        if active == engine:
+            engines.append(engine)
+
+    print(f"{'case':34} {'engine':6} {'chars':>10} {'seconds':>9}  auditor / fee")
+    for name in wanted:
+        text = cases[name]()
+        for engine in engines:
+            configure_field_extraction(engine, budget_s=args.budget)
+            t0 = time.perf_counter()
+            fields = extract_fields(text)
+            elapsed = time.perf_counter() - t0
+            print(
+                f"{name:34} {engine:6} {len(text):>10} {elapsed:>9.3f}  "
+                f"{fields['external_auditor'] or '-'} / {fields['audit_fee'] or '-'}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,40 +2,123 @@
 from __future__ import annotations
 
 import argparse
+import atexit
 import csv
+import gzip
+import hashlib
+import html
 import importlib
 import json
+import multiprocessing
 import os
 import platform
+import queue
 import re
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
 import zipfile
+from contextlib import closing
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import requests
 
 from tender_radar import (
+    AUDITOR_REGISTRY_PATH,
     account_filings,
     build_shortlist,
-    create_ch_session,
+    configure_auditor_registry,
+    configure_corpus,
+    configure_field_extraction,
+    configure_page_index,
+    configure_pdf_index,
     detect_currency_and_unit,
+    extract_fee_from_table_rows,
+    create_ch_session,
     document_pdf_url,
     download_pdf,
-    extract_audit_fee,
-    extract_external_auditor,
+    extract_fields_streaming,
+    find_candidate_pages,
+    iter_ocr_targeted_pages,
+    iter_pdf_pages_sampled,
     load_api_key_from_file,
+    load_corpus_index,
     load_dotenv_file,
     make_row,
+    new_field_state,
     parse_year,
+    pdf_document,
+    pdf_info,
+    pdf_page_count,
+    pdf_sha256,
+    parse_filing_stem,
+    pdf_text_coverage,
+    preferred_pdf_path,
+    read_corpus_pages,
+    record_filing_pages,
+    recorded_pages,
+    renormalize_auditors,
+    repair_pdf,
     search_companies,
     write_csv,
+    write_pdf_subset,
 )
 
 CH_BULK_INDEX_URL = "https://download.companieshouse.gov.uk/en_output.html"
+MINERU_WORKER_TIMEOUT = float(os.getenv("TENDER_MINERU_WORKER_TIMEOUT", "3600"))
+MINERU_SUBSET_MAX_RATIO = 0.6
+MINERU_MANIFEST = "mineru_manifest.json"
+# Running totals of slim retention (slim_mineru_output), reported at the end of run_cli.
+MINERU_RETENTION_TOTALS: Dict[str, int] = {"slots": 0, "bytes_saved": 0, "inodes_saved": 0}
+CASCADE_BACKENDS = ("text", "ocr", "mineru")
+_HTML_ROW = re.compile(r"(?is)<tr\b[^>]*>(.*?)</tr>")
+_HTML_CELL = re.compile(r"(?is)<t[dh]\b([^>]*)>(.*?)</t[dh]>")
+_HTML_TAG = re.compile(r"(?s)<[^>]+>")
+_HTML_COLSPAN = re.compile(r"(?i)colspan\s*=\s*[\"']?(\d+)")
+_HTML_TABLE = re.compile(r"(?is)<table\b.*?</table>")
+_MD_HEADING = re.compile(r"^(#{1,6})\s+(.*\S)\s*$", re.M)
+_MD_IMAGE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_AUDITOR_REPORT_HEADING = re.compile(r"(?i)independent auditor|auditors?['’]?s?['’]? report|report of the (?:independent )?auditor")
+_REPORT_END_HEADING = re.compile(
+    r"(?i)income statement|statement of comprehensive income|statement of financial position|balance sheet"
+    r"|statement of changes in equity|cash flow statement|notes to the"
+)
+MD_REPORT_MAX_CHARS = 60_000
+MINERU_TXT_MIN_COVERAGE = 0.9
+MINERU_OCR_MAX_COVERAGE = 0.1
+# Rough CPU pipeline footprint per MinerU process (models) plus per parsed page.
+MINERU_BASE_MEMORY_MB = float(os.getenv("TENDER_MINERU_BASE_MEMORY_MB", "3000"))
+MINERU_PAGE_MEMORY_MB = float(os.getenv("TENDER_MINERU_PAGE_MEMORY_MB", "25"))
+# Runs ending in transient failures (timeout, killed worker, OOM) before a PDF is marked poison,
+# and days a poison mark holds before the ladder is tried again (0 = forever).
+MINERU_MAX_TRANSIENT_FAILURES = int(os.getenv("TENDER_MINERU_MAX_TRANSIENT_FAILURES", "3"))
+MINERU_POISON_TTL_DAYS = float(os.getenv("TENDER_MINERU_POISON_TTL_DAYS", "30"))
+
+# Per-PDF MinerU outcome record; see configure_mineru_mode_cache.
+_MINERU_MODES: Dict[str, object] = {"path": None, "data": None}
+# Persistent MinerU worker state; see start_mineru_worker. pending holds results read off the
+# queue by another caller, keyed by job id; generation changes on every (re)start.
+_MINERU_WORKER: Dict[str, object] = {
+    "process": None,
+    "jobs": None,
+    "results": None,
+    "next_id": 0,
+    "pending": {},
+    "generation": 0,
+}
+# Guards job ids, the result exchange and worker restarts.
+_MINERU_WORKER_LOCK = threading.RLock()
+# Seconds a caller waits on the result queue before rechecking its stash and the worker.
+_MINERU_WORKER_POLL_S = 1.0
+# Parallel MinerU job pool; see start_mineru_pool.
+_MINERU_POOL: Dict[str, object] = {"executor": None, "threads": 0, "budget_mb": 0.0, "reserved_mb": 0.0}
+_MINERU_POOL_COND = threading.Condition()
+# Guards the mode record and retention totals when jobs run in parallel.
+_MINERU_STATE_LOCK = threading.RLock()
 
 
 def _normalize_company_number(raw: str) -> str:
@@ -205,6 +288,11 @@ def parse_args() -> argparse.Namespace:
         default=os.getenv("TENDER_DOWNLOAD_DIR", str(root / "uk_accounts_pdfs")),
         help="Local PDF folder",
     )
+    p.add_argument(
+        "--pdf-index",
+        default=os.getenv("TENDER_PDF_INDEX", str(root / "pdf_index.sqlite")),
+        help="SQLite index of downloaded PDF facts (size, sha256, pages, text coverage); empty disables",
+    )
     p.add_argument(
         "--history-csv",
         default=os.getenv("TENDER_HISTORY_CSV", str(root / "tender_history.csv")),
@@ -261,6 +349,108 @@ def parse_args() -> argparse.Namespace:
         default=os.getenv("TENDER_MINERU_SOURCE", ""),
         help="MinerU model source (huggingface/modelscope/local)",
     )
+    p.add_argument(
+        "--mineru-worker",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("TENDER_MINERU_WORKER", "false").lower() == "true",
+        help="Keep one warm MinerU process (Python API) with models loaded and reuse it for every filing",
+    )
+    p.add_argument(
+        "--mineru-subset",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("TENDER_MINERU_SUBSET", "false").lower() == "true",
+        help="Send MinerU only the auditor-report/remuneration candidate pages (text layer or low-zoom OCR scan)",
+    )
+    p.add_argument(
+        "--mineru-batch-size",
+        type=int,
+        default=int(os.getenv("TENDER_MINERU_BATCH_SIZE", "0")),
+        help="Download all filings first, then run MinerU once per chunk of N PDFs (0 = one MinerU call per PDF)",
+    )
+    p.add_argument(
+        "--mineru-mode-cache",
+        default=os.getenv("TENDER_MINERU_MODE_CACHE", str(root / "mineru_outputs" / "mineru_modes.json")),
+        help="JSON record of the MinerU mode that worked (or failed everywhere) per PDF sha256; empty disables",
+    )
+    p.add_argument(
+        "--mineru-clear-failures",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("TENDER_MINERU_CLEAR_FAILURES", "false").lower() == "true",
+        help="Drop poison/retry marks from the MinerU mode cache before the run (recorded working modes are kept)",
+    )
+    p.add_argument(
+        "--mineru-retention",
+        default=os.getenv("TENDER_MINERU_RETENTION", "full"),
+        choices=["full", "slim"],
+        help="slim: after each parse keep only the gzipped markdown + content_list (plus manifest) and delete the rest",
+    )
+    p.add_argument(
+        "--mineru-workers",
+        type=int,
+        default=int(os.getenv("TENDER_MINERU_WORKERS", "1")),
+        help="Parallel MinerU processes; jobs start while filings are still being downloaded",
+    )
+    p.add_argument(
+        "--mineru-threads-per-worker",
+        type=int,
+        default=int(os.getenv("TENDER_MINERU_THREADS_PER_WORKER", "0")),
+        help="torch/OpenMP/BLAS threads per MinerU process (0 = cores / workers; uncapped in batch mode)",
+    )
+    p.add_argument(
+        "--mineru-memory-budget-mb",
+        type=float,
+        default=float(os.getenv("TENDER_MINERU_MEMORY_BUDGET_MB", "0")),
+        help="Admit parallel MinerU jobs only while their estimated memory fits (0 = 80%% of available RAM)",
+    )
+    p.add_argument(
+        "--cascade",
+        default=os.getenv("TENDER_CASCADE", "mineru"),
+        help="Comma-separated backend order (text, ocr, mineru); a filing moves on only while fields are missing "
+        "or low confidence",
+    )
+    p.add_argument(
+        "--regex-engine",
+        choices=("re", "re2"),
+        default=os.getenv("TENDER_REGEX_ENGINE", "re"),
+        help="Engine for the field regexes; re2 (pip install google-re2) runs in linear time",
+    )
+    p.add_argument(
+        "--extract-budget",
+        type=float,
+        default=float(os.getenv("TENDER_EXTRACT_BUDGET_S", "30")),
+        help="Per-document field extraction budget in seconds; regex passes past it are skipped (0 = none)",
+    )
+    p.add_argument(
+        "--corpus-dir",
+        default=os.getenv("TENDER_CORPUS_DIR", str(root / "corpus")),
+        help="Directory for the per-run append-only corpus of extracted text (empty disables)",
+    )
+    p.add_argument(
+        "--page-index",
+        default=os.getenv("TENDER_PAGE_INDEX", str(root / "page_index.sqlite")),
+        help="SQLite FTS5 index of extracted page text by company, filing date and page (empty disables)",
+    )
+    p.add_argument(
+        "--auditor-registry",
+        default=os.getenv("TENDER_AUDITOR_REGISTRY", str(AUDITOR_REGISTRY_PATH)),
+        help="CSV of audit firms (name, ;-separated aliases) used to normalise auditor names (empty = built-in firms)",
+    )
+    p.add_argument(
+        "--renormalize-auditors",
+        action="store_true",
+        help="Re-resolve external_auditor in the history CSV against the firm registry and rewrite history/shortlist",
+    )
+    p.add_argument(
+        "--re-extract",
+        action="store_true",
+        help="Rebuild history/shortlist from stored text (corpus + cached MinerU outputs); no API calls, downloads or parsing",
+    )
+    p.add_argument(
+        "--re-extract-workers",
+        type=int,
+        default=int(os.getenv("TENDER_RE_EXTRACT_WORKERS", "0")),
+        help="Processes for --re-extract (0 = one per CPU core)",
+    )
     p.add_argument(
         "--mineru-force-refresh",
         action="store_true",
@@ -329,6 +519,161 @@ def build_mineru_cmd(
     return cmd
 
 
+def _mineru_worker_loop(jobs, results, device: str, source: str) -> None:
+    """
+    Warm worker process body: import MinerU's Python API once and parse queued jobs until a
+    None sentinel arrives. Layout/OCR/table models stay loaded between jobs.
+    """
+    import io
+    import traceback
+
+    if device:
+        os.environ.setdefault("MINERU_DEVICE_MODE", device)
+    if source:
+        os.environ.setdefault("MINERU_MODEL_SOURCE", source)
+    try:
+        from loguru import logger  # type: ignore
+        from mineru.cli.common import do_parse, read_fn  # type: ignore
+        startup_error = ""
+    except Exception:
+        startup_error = traceback.format_exc()
+
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        if startup_error:
+            results.put({"id": job["id"], "returncode": 1, "stdout": "", "stderr": startup_error})
+            continue
+        log = io.StringIO()
+        sink_id = logger.add(log, level="INFO")
+        rc = 0
+        try:
+            pdf_path = Path(job["pdf_path"])
+            do_parse(
+                output_dir=job["output_dir"],
+                pdf_file_names=[pdf_path.stem],
+                pdf_bytes_list=[read_fn(pdf_path)],
+                p_lang_list=[job["lang"] or "ch"],
+                backend=job["backend"],
+                parse_method=job["method"],
+                formula_enable=job["formula"],
+                table_enable=job["table"],
+            )
+        except Exception:
+            rc = 1
+            log.write(traceback.format_exc())
+        finally:
+            logger.remove(sink_id)
+        results.put({"id": job["id"], "returncode": rc, "stdout": "", "stderr": log.getvalue()})
+
+
+def start_mineru_worker(device: str = "", source: str = "") -> bool:
+    """
+    Start (once) a persistent MinerU worker process fed through a local queue.
+    run_mineru_extract routes jobs to it while it is alive; returns True when running.
+    """
+    with _MINERU_WORKER_LOCK:
+        if mineru_worker_running():
+            return True
+        ctx = multiprocessing.get_context("spawn")
+        jobs, results = ctx.Queue(), ctx.Queue()
+        proc = ctx.Process(target=_mineru_worker_loop, args=(jobs, results, device, source), daemon=True)
+        proc.start()
+        _MINERU_WORKER.update(
+            {
+                "process": proc,
+                "jobs": jobs,
+                "results": results,
+                "pending": {},
+                "generation": int(_MINERU_WORKER["generation"]) + 1,
+                "device": device,
+                "source": source,
+            }
+        )
+    atexit.register(stop_mineru_worker)
+    return True
+
+
+def mineru_worker_running() -> bool:
+    proc = _MINERU_WORKER.get("process")
+    return proc is not None and proc.is_alive()
+
+
+def stop_mineru_worker(timeout: float = 30.0) -> None:
+    with _MINERU_WORKER_LOCK:
+        proc = _MINERU_WORKER.get("process")
+        if proc is None:
+            return
+        if proc.is_alive():
+            _MINERU_WORKER["jobs"].put(None)
+            proc.join(timeout)
+            if proc.is_alive():
+                proc.terminate()
+        _MINERU_WORKER.update({"process": None, "jobs": None, "results": None, "pending": {}})
+
+
+def mineru_worker_parse(
+    pdf_path: Path,
+    output_dir: Path,
+    *,
+    backend: str,
+    method: str,
+    lang: str,
+    formula: bool,
+    table: bool,
+    timeout: float = MINERU_WORKER_TIMEOUT,
+) -> tuple[int, str, str]:
+    """
+    Run one parse on the warm worker; same (returncode, stdout, stderr) shape as the CLI path.
+    Safe to call from several threads: a result read for another caller's job is stashed in
+    _MINERU_WORKER["pending"] for that caller. Jobs lost to a worker restart (another job
+    timed out) fail with "worker exited" instead of waiting out their own timeout.
+    """
+    with _MINERU_WORKER_LOCK:
+        _MINERU_WORKER["next_id"] += 1
+        job_id = _MINERU_WORKER["next_id"]
+        generation = _MINERU_WORKER["generation"]
+        _MINERU_WORKER["jobs"].put(
+            {
+                "id": job_id,
+                "pdf_path": str(pdf_path),
+                "output_dir": str(output_dir),
+                "backend": backend,
+                "method": method,
+                "lang": lang,
+                "formula": bool(formula),
+                "table": bool(table),
+            }
+        )
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        with _MINERU_WORKER_LOCK:
+            if _MINERU_WORKER["generation"] != generation:
+                return 1, "", "MinerU worker exited (restarted while the job was queued)"
+            result = _MINERU_WORKER["pending"].pop(job_id, None)
+            if result is None:
+                wait = min(_MINERU_WORKER_POLL_S, max(0.0, deadline - time.time()))
+                try:
+                    result = _MINERU_WORKER["results"].get(timeout=wait)
+                except queue.Empty:
+                    if not mineru_worker_running():
+                        return 1, "", "MinerU worker exited"
+                    continue
+                if result.get("id") != job_id:
+                    _MINERU_WORKER["pending"][result.get("id")] = result
+                    continue
+        return int(result["returncode"]), result["stdout"], result["stderr"]
+    # A timed-out job may still be running; restart so the next filing starts clean.
+    with _MINERU_WORKER_LOCK:
+        if _MINERU_WORKER["generation"] == generation:
+            stop_mineru_worker(timeout=1)
+            start_mineru_worker(
+                device=str(_MINERU_WORKER.get("device", "")), source=str(_MINERU_WORKER.get("source", ""))
+            )
+    return 1, "", f"MinerU worker timed out after {timeout:.0f}s"
+
+
 def _save_mineru_logs(output_dir: Path, stdout: str, stderr: str) -> None:
     try:
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -343,67 +688,600 @@ def needs_reserialize(stdout: str, stderr: str) -> bool:
     return "unknown file suffix" in combined
 
 
-def reserialize_pdf(pdf_path: Path) -> Path | None:
-    if shutil.which("qpdf") is None:
-        return None
-    fd, temp_name = tempfile.mkstemp(prefix="mineru_reserialize_", suffix=".pdf")
-    os.close(fd)
-    out = Path(temp_name)
-    proc = subprocess.run(["qpdf", str(pdf_path), str(out)], capture_output=True, text=True)
-    if proc.returncode != 0:
-        out.unlink(missing_ok=True)
-        return None
-    return out
+MINERU_TRANSIENT_SIGNATURES = (
+    "timed out",
+    "worker exited",
+    "out of memory",
+    "memoryerror",
+    "cannot allocate memory",
+    "killed",
+)
 
 
-def _load_markdown_text(output_dir: Path) -> str:
-    md_files = sorted(output_dir.rglob("*.md"), key=lambda p: p.stat().st_size if p.exists() else 0, reverse=True)
-    for md in md_files:
+def classify_mineru_failure(returncode: int, stdout: str, stderr: str) -> str:
+    """
+    Map a failed MinerU attempt to a retry class from its stderr signature:
+    reserialize (bad suffix/structure), formula (MFR crash on image crops),
+    empty (ran but produced no text), transient (timeout, killed or exited
+    worker, out of memory: says nothing about the PDF) or other.
+    """
+    if needs_reserialize(stdout, stderr):
+        return "reserialize"
+    err_low = stderr.lower()
+    if returncode < 0 or returncode == 137 or any(sig in err_low for sig in MINERU_TRANSIENT_SIGNATURES):
+        return "transient"
+    if "'nonetype' object has no attribute 'shape'" in err_low or "mfr predict" in err_low:
+        return "formula"
+    if returncode == 0:
+        return "empty"
+    return "other"
+
+
+def _next_mineru_attempts(
+    failure: str, requested_method: str, requested_table: bool, method: str, formula: bool, table: bool
+) -> List[tuple[str, bool, bool]]:
+    """
+    Next (method, formula, table) attempts for a failure class; the caller skips combinations
+    already tried. transient stops the ladder (the run says nothing about the PDF), formula
+    drops the formula model, empty switches the parse method with the same models, and other
+    drops the optional models before the plain text-layer parse. Method switches beyond the
+    txt fallback only happen when the caller asked for auto.
+    """
+    if failure == "transient":
+        return []
+    if failure == "formula" and formula:
+        return [(method, False, table)]
+    nxt: List[tuple[str, bool, bool]] = []
+    if failure == "empty":
+        # A clean run without text: usually a scan behind a thin text layer, or the reverse.
+        if requested_method == "auto" and method != "ocr":
+            nxt.append(("ocr", formula, requested_table))
+        if method != "txt":
+            nxt.append(("txt", formula, table))
+        return nxt
+    if formula or table:
+        nxt.append((method, False, False))
+    if method != "txt":
+        nxt.append(("txt", False, False))
+    return nxt
+
+
+def predict_mineru_method(pdf_path: Path, method: str) -> str:
+    """Resolve method=auto up front from text-layer coverage: txt for born-digital, ocr for scans."""
+    if method != "auto":
+        return method
+    coverage = pdf_text_coverage(pdf_path)
+    if coverage >= MINERU_TXT_MIN_COVERAGE:
+        return "txt"
+    if coverage <= MINERU_OCR_MAX_COVERAGE:
+        return "ocr"
+    return "auto"
+
+
+def configure_mineru_mode_cache(path: Path | None) -> None:
+    """Persist per-PDF (sha256) MinerU outcomes to a JSON file; None disables."""
+    _MINERU_MODES["path"] = Path(path) if path else None
+    _MINERU_MODES["data"] = None
+
+
+def _mineru_modes() -> Dict[str, Dict[str, object]]:
+    path = _MINERU_MODES.get("path")
+    if path is None:
+        return {}
+    if _MINERU_MODES.get("data") is None:
         try:
-            text = md.read_text(encoding="utf-8", errors="ignore").strip()
-            if text:
-                return text
+            _MINERU_MODES["data"] = json.loads(Path(path).read_text(encoding="utf-8"))
         except Exception:
-            continue
-    return ""
+            _MINERU_MODES["data"] = {}
+    return _MINERU_MODES["data"]
+
+
+def mineru_mode_record(pdf_sha: str) -> Dict[str, object]:
+    """
+    Last known outcome for a PDF: {"status": "ok", method, formula, table},
+    {"status": "retry", failures, ...} after transient failures, or {"status": "poison", ...}.
+    """
+    if not pdf_sha:
+        return {}
+    with _MINERU_STATE_LOCK:
+        return dict(_mineru_modes().get(pdf_sha) or {})
 
 
-def _load_content_list_text(output_dir: Path) -> str:
-    json_files = sorted(output_dir.rglob("*content_list.json"))
-    for fp in json_files:
+def record_mineru_mode(pdf_sha: str, record: Dict[str, object]) -> None:
+    path = _MINERU_MODES.get("path")
+    if path is None or not pdf_sha:
+        return
+    with _MINERU_STATE_LOCK:
+        modes = _mineru_modes()
+        modes[pdf_sha] = {**record, "at": round(time.time(), 1)}
+        try:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            tmp = Path(path).with_suffix(".tmp")
+            tmp.write_text(json.dumps(modes, indent=1, sort_keys=True), encoding="utf-8")
+            tmp.replace(path)
+        except Exception:
+            return
+
+
+def mineru_poisoned(record: Dict[str, object]) -> bool:
+    """True while a poison mark is younger than MINERU_POISON_TTL_DAYS."""
+    if record.get("status") != "poison":
+        return False
+    if MINERU_POISON_TTL_DAYS <= 0:
+        return True
+    return time.time() - float(record.get("at") or 0) < MINERU_POISON_TTL_DAYS * 86400
+
+
+def mineru_failure_record(previous: Dict[str, object], failures: List[str], attempts: int) -> Dict[str, object]:
+    """
+    Outcome record for a run where every attempt failed. Only deterministic failures poison
+    the PDF at once; a run that hit a transient failure counts towards
+    MINERU_MAX_TRANSIENT_FAILURES instead.
+    """
+    failure = failures[-1] if failures else ""
+    if "transient" not in failures:
+        return {"status": "poison", "failure": failure, "attempts": attempts}
+    count = int(previous.get("failures") or 0) + 1 if previous.get("status") == "retry" else 1
+    status = "poison" if count >= MINERU_MAX_TRANSIENT_FAILURES else "retry"
+    return {"status": status, "failure": failure, "attempts": attempts, "failures": count}
+
+
+def clear_mineru_failures() -> int:
+    """Drop poison/retry marks from the mode cache, keeping recorded working modes; returns records dropped."""
+    path = _MINERU_MODES.get("path")
+    if path is None:
+        return 0
+    with _MINERU_STATE_LOCK:
+        modes = _mineru_modes()
+        failed = [sha for sha, record in modes.items() if record.get("status") != "ok"]
+        for sha in failed:
+            del modes[sha]
+        if failed:
+            try:
+                tmp = Path(path).with_suffix(".tmp")
+                tmp.write_text(json.dumps(modes, indent=1, sort_keys=True), encoding="utf-8")
+                tmp.replace(path)
+            except Exception:
+                pass
+    return len(failed)
+
+
+def prepare_mineru_subset(pdf_path: Path, output_dir: Path, max_ratio: float = MINERU_SUBSET_MAX_RATIO) -> Path | None:
+    """
+    Write a slim PDF of the auditor-report / remuneration candidate pages for MinerU, plus
+    page_map.json (subset index -> original 0-based page). Returns None (parse the full PDF)
+    when no candidates are found or the subset would not be meaningfully smaller.
+    """
+    page_map = output_dir / "page_map.json"
+    page_map.unlink(missing_ok=True)
+    total = pdf_page_count(pdf_path)
+    pages = find_candidate_pages(pdf_path)
+    if total <= 0 or not pages or len(pages) > total * max_ratio:
+        return None
+    # Same stem as the source so MinerU's <stem>/<method>/ layout is unchanged.
+    subset_pdf = output_dir / "_subset" / pdf_path.name
+    if not write_pdf_subset(pdf_path, pages, subset_pdf):
+        return None
+    page_map.write_text(
+        json.dumps({"source_pdf": str(pdf_path), "page_count": total, "pages": pages}),
+        encoding="utf-8",
+    )
+    return subset_pdf
+
+
+def apply_page_map(output_dir: Path) -> None:
+    """Add source_page_idx (page in the original PDF) to content_list items of a subset parse."""
+    page_map = output_dir / "page_map.json"
+    if not page_map.exists():
+        return
+    try:
+        pages = json.loads(page_map.read_text(encoding="utf-8"))["pages"]
+    except Exception:
+        return
+    for fp in output_dir.rglob("*content_list.json"):
         try:
             data = json.loads(fp.read_text(encoding="utf-8", errors="ignore"))
         except Exception:
             continue
         if not isinstance(data, list):
             continue
-        chunks: List[str] = []
         for item in data:
-            if not isinstance(item, dict):
-                continue
-            if str(item.get("type", "")).lower() != "text":
+            if isinstance(item, dict) and isinstance(item.get("page_idx"), int) and 0 <= item["page_idx"] < len(pages):
+                item["source_page_idx"] = pages[item["page_idx"]]
+        fp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+
+def _read_file_text(fp: Path) -> str:
+    """Read a MinerU artefact, transparently handling slim-retention .gz copies."""
+    if fp.suffix == ".gz":
+        with gzip.open(fp, "rt", encoding="utf-8", errors="ignore") as f:
+            return f.read()
+    return fp.read_text(encoding="utf-8", errors="ignore")
+
+
+def _read_text_file(fp: Path) -> str:
+    try:
+        return _read_file_text(fp).strip()
+    except Exception:
+        return ""
+
+
+def _read_content_list_items(fp: Path) -> List[Dict[str, object]]:
+    try:
+        data = json.loads(_read_file_text(fp))
+    except Exception:
+        return []
+    if not isinstance(data, list):
+        return []
+    return [item for item in data if isinstance(item, dict)]
+
+
+def _read_content_list_file(fp: Path) -> str:
+    data = _read_content_list_items(fp)
+    chunks: List[str] = []
+    for item in data:
+        if str(item.get("type", "")).lower() != "text":
+            continue
+        text = str(item.get("text", "")).strip()
+        if text:
+            chunks.append(text)
+    return "\n".join(chunks).strip()
+
+
+def mineru_pages(output_dir: Path, text: str) -> List[Tuple[int, str]]:
+    """
+    MinerU text per original PDF page (source_page_idx, else page_idx) from the text and table
+    items of content_list.json; [(0, text)] when the output has no usable content list.
+    """
+    files = sorted([*output_dir.rglob("*content_list.json"), *output_dir.rglob("*content_list.json.gz")])
+    for fp in files:
+        pages: Dict[int, List[str]] = {}
+        for item in _read_content_list_items(fp):
+            kind = str(item.get("type", "")).lower()
+            if kind == "text":
+                chunk = str(item.get("text", "")).strip()
+            elif kind == "table":
+                chunk = "\n".join(" ".join(cells) for cells in html_table_rows(str(item.get("table_body", ""))))
+            else:
                 continue
-            text = str(item.get("text", "")).strip()
-            if text:
-                chunks.append(text)
-        merged = "\n".join(chunks).strip()
-        if merged:
-            return merged
-    return ""
+            page = item.get("source_page_idx", item.get("page_idx"))
+            if chunk and isinstance(page, int):
+                pages.setdefault(page, []).append(chunk)
+        if pages:
+            return [(page, "\n".join(chunks)) for page, chunks in sorted(pages.items())]
+    return [(0, text)] if text else []
 
 
-def _load_plain_text(output_dir: Path) -> str:
-    txt_files = sorted(output_dir.rglob("*.txt"), key=lambda p: p.stat().st_size if p.exists() else 0, reverse=True)
-    for fp in txt_files:
-        try:
-            text = fp.read_text(encoding="utf-8", errors="ignore").strip()
+def _read_mineru_file(fp: Path, kind: str) -> str:
+    return _read_content_list_file(fp) if kind == "content_list" else _read_text_file(fp)
+
+
+def _largest_first(files) -> List[Path]:
+    return sorted(files, key=lambda p: p.stat().st_size if p.exists() else 0, reverse=True)
+
+
+def _locate_mineru_text(output_dir: Path) -> tuple[str, Path | None, str]:
+    """First non-empty MinerU text in loader priority (largest .md, content_list.json, largest .txt), with its file and kind."""
+    listings = (
+        ("md", lambda: _largest_first([*output_dir.rglob("*.md"), *output_dir.rglob("*.md.gz")])),
+        ("content_list", lambda: sorted([*output_dir.rglob("*content_list.json"), *output_dir.rglob("*content_list.json.gz")])),
+        ("txt", lambda: _largest_first(output_dir.rglob("*.txt"))),
+    )
+    for kind, files in listings:
+        for fp in files():
+            text = _read_mineru_file(fp, kind)
             if text:
-                return text
-        except Exception:
+                return text, fp, kind
+    return "", None, ""
+
+
+def _load_mineru_text(output_dir: Path) -> str:
+    return _locate_mineru_text(output_dir)[0]
+
+
+def html_table_rows(table_html: str) -> List[List[str]]:
+    """Rows of cell texts from MinerU's table_body HTML; colspan cells are padded so columns stay aligned."""
+    rows: List[List[str]] = []
+    for row_html in _HTML_ROW.findall(table_html or ""):
+        cells: List[str] = []
+        for attrs, cell_html in _HTML_CELL.findall(row_html):
+            cells.append(" ".join(html.unescape(_HTML_TAG.sub(" ", cell_html)).split()))
+            span = _HTML_COLSPAN.search(attrs)
+            if span:
+                cells.extend([""] * (int(span.group(1)) - 1))
+        rows.append(cells)
+    return rows
+
+
+def load_content_list_tables(output_dir: Path) -> List[Dict[str, object]]:
+    """
+    Table items from MinerU's content_list.json (plain or .gz): rows parsed from table_body,
+    page (original PDF page when a subset was parsed) and context text (caption, footnote
+    and the text item just before the table, which usually carries the note heading).
+    """
+    files = sorted([*output_dir.rglob("*content_list.json"), *output_dir.rglob("*content_list.json.gz")])
+    for fp in files:
+        items = _read_content_list_items(fp)
+        if not items:
             continue
+        tables: List[Dict[str, object]] = []
+        last_text = ""
+        for item in items:
+            kind = str(item.get("type", "")).lower()
+            if kind == "text":
+                last_text = str(item.get("text", "")).strip()
+                continue
+            if kind != "table":
+                continue
+            rows = html_table_rows(str(item.get("table_body", "")))
+            if not rows:
+                continue
+            caption = " ".join(str(c) for c in (item.get("table_caption") or []))
+            footnote = " ".join(str(c) for c in (item.get("table_footnote") or []))
+            tables.append(
+                {
+                    "page": item.get("source_page_idx", item.get("page_idx", "")),
+                    "rows": rows,
+                    "context": "\n".join(t for t in (last_text, caption, footnote) if t),
+                }
+            )
+        return tables
+    return []
+
+
+def extract_fee_from_mineru_tables(output_dir: Path) -> Dict[str, str]:
+    """
+    Fee lookup over MinerU's structured tables before any text regex: the first table with a
+    statutory audit fee row wins. Returns extract_fee_from_table_rows output plus
+    page/source/currency/fee_unit, or {} when no table matches.
+    """
+    for table in load_content_list_tables(output_dir):
+        rows = table["rows"]
+        found = extract_fee_from_table_rows(rows)
+        if not found.get("audit_fee"):
+            continue
+        header = " ".join(" ".join(r) for r in rows[:3])
+        currency, unit = detect_currency_and_unit(f"{table['context']}\n{header}")
+        found.update({"page": str(table["page"]), "source": "content_list", "currency": currency, "fee_unit": unit})
+        return found
+    return {}
+
+
+def split_markdown_sections(md: str) -> List[tuple[str, str]]:
+    """(heading, body) pairs in document order; text before the first heading gets heading ""."""
+    sections: List[tuple[str, str]] = []
+    heading, last = "", 0
+    for m in _MD_HEADING.finditer(md):
+        sections.append((heading, md[last : m.start()]))
+        heading, last = m.group(2).strip(), m.end()
+    sections.append((heading, md[last:]))
+    return [(h, b) for h, b in sections if h or b.strip()]
+
+
+def _is_fee_note(text: str) -> bool:
+    low = text.lower()
+    return "auditor" in low and ("remuneration" in low or "fees payable" in low or "audit fee" in low)
+
+
+def extract_report_sections(md: str, max_report_chars: int = MD_REPORT_MAX_CHARS) -> str:
+    """
+    Cut the independent auditor's report (its heading up to the first primary statement) and
+    the auditor remuneration / fees note out of MinerU markdown, dropping image links and the
+    report's own tables. Returns "" when nothing matches; callers then use the full text.
+    """
+    picked: List[str] = []
+    in_report = False
+    report_chars = 0
+    for heading, body in split_markdown_sections(md):
+        if _AUDITOR_REPORT_HEADING.search(heading):
+            in_report, report_chars = True, 0
+        elif in_report and (_REPORT_END_HEADING.search(heading) or report_chars > max_report_chars):
+            in_report = False
+
+        body = _MD_IMAGE.sub("", body)
+        if in_report:
+            chunk = f"{heading}\n{_HTML_TABLE.sub('', body).strip()}".strip()
+            report_chars += len(chunk)
+            picked.append(chunk)
+        elif _is_fee_note(heading) or _is_fee_note(body):
+            # Fee notes keep their tables: the fee row lives there.
+            picked.append(f"{heading}\n{body.strip()}".strip())
+    return "\n\n".join(c for c in picked if c)
+
+
+def mineru_options_key(backend: str, method: str, lang: str, formula: bool, table: bool, subset_pages: bool) -> str:
+    """Short stable key for the MinerU options that change its output."""
+    options = {
+        "backend": backend,
+        "method": method,
+        "lang": lang,
+        "formula": bool(formula),
+        "table": bool(table),
+        "subset_pages": bool(subset_pages),
+    }
+    return hashlib.sha256(json.dumps(options, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
+
+def _read_mineru_manifest(output_dir: Path) -> Dict[str, object]:
+    try:
+        return json.loads((output_dir / MINERU_MANIFEST).read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+
+
+def _mineru_hash_pointer(output_dir: Path, pdf_sha: str, options_key: str) -> Path:
+    # Slots share one root (mineru_outputs/<company>_<date>), so the hash index sits next to them.
+    return output_dir.parent / "_by_hash" / f"{pdf_sha}_{options_key}.json"
+
+
+def write_mineru_manifest(output_dir: Path, pdf_sha: str, options_key: str, mode: Dict[str, object]) -> None:
+    """Record which file holds the text for (sha256, options) and point the hash index at this slot."""
+    _, fp, kind = _locate_mineru_text(output_dir)
+    if fp is None or not pdf_sha:
+        return
+    manifest = {
+        "sha256": pdf_sha,
+        "options_key": options_key,
+        "text_file": str(fp.relative_to(output_dir)),
+        "kind": kind,
+        "mode": mode,
+        "created_at": round(time.time(), 1),
+    }
+    try:
+        (output_dir / MINERU_MANIFEST).write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+        pointer = _mineru_hash_pointer(output_dir, pdf_sha, options_key)
+        pointer.parent.mkdir(parents=True, exist_ok=True)
+        pointer.write_text(json.dumps({"output_dir": str(output_dir.resolve())}), encoding="utf-8")
+    except Exception:
+        return
+
+
+def _manifest_text(slot: Path, pdf_sha: str, options_key: str) -> str:
+    manifest = _read_mineru_manifest(slot)
+    if manifest.get("sha256") != pdf_sha or manifest.get("options_key") != options_key:
+        return ""
+    return _read_mineru_file(slot / str(manifest.get("text_file", "")), str(manifest.get("kind", "")))
+
+
+def _link_mineru_slot(source: Path, output_dir: Path) -> None:
+    """
+    Hard-link (or copy) a cached slot's files into output_dir, so readers of the slot itself
+    (content_list tables, page maps, re-extract) find them. Manifest and logs are rewritten
+    in place later, so they are not shared.
+    """
+    def link(src: str, dst: str) -> None:
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+    if output_dir.exists():
+        _clear_mineru_slot(output_dir)
+    ignore = shutil.ignore_patterns(MINERU_MANIFEST, "mineru_stdout.log", "mineru_stderr.log")
+    shutil.copytree(source, output_dir, ignore=ignore, copy_function=link, dirs_exist_ok=True)
+
+
+def mineru_adoptable_mode(pdf_sha: str, method: str, formula: bool, table: bool) -> Optional[Dict[str, object]]:
+    """
+    The recorded ok mode of pdf_sha when the requested method/formula/table could have produced
+    it (the recorded mode is the request itself or one of its fallbacks), else None.
+    load_cached_mineru_text adopts manifest-less output only with such a mode.
+    """
+    record = mineru_mode_record(pdf_sha)
+    if record.get("status") != "ok":
+        return None
+    if method != "auto" and record.get("method") not in (method, "txt"):
+        return None
+    if (record.get("formula") and not formula) or (record.get("table") and not table):
+        return None
+    return {"method": record.get("method"), "formula": bool(record.get("formula")), "table": bool(record.get("table"))}
+
+
+def load_cached_mineru_text(
+    output_dir: Path, pdf_sha: str, options_key: str, adopt_mode: Optional[Dict[str, object]] = None
+) -> str:
+    """
+    O(1) cache lookup: this slot's manifest, then the hash index (same PDF bytes parsed into
+    another slot, e.g. a re-download under a new date), whose files are then linked into
+    output_dir. Output without a manifest from older runs is adopted under the current
+    options only when adopt_mode (see mineru_adoptable_mode) vouches for it; the manifest
+    marks it adopted.
+    """
+    text = _manifest_text(output_dir, pdf_sha, options_key)
+    if text:
+        return text
+    try:
+        pointer = json.loads(_mineru_hash_pointer(output_dir, pdf_sha, options_key).read_text(encoding="utf-8"))
+        slot = Path(pointer["output_dir"])
+    except Exception:
+        slot = None
+    if slot is not None and slot.resolve() != output_dir.resolve() and _manifest_text(slot, pdf_sha, options_key):
+        try:
+            _link_mineru_slot(slot, output_dir)
+        except OSError:
+            return ""
+        mode = _read_mineru_manifest(slot).get("mode") or {}
+        write_mineru_manifest(output_dir, pdf_sha, options_key, {**mode, "linked_from": str(slot.resolve())})
+        return _manifest_text(output_dir, pdf_sha, options_key)
+
+    if adopt_mode and output_dir.exists() and not (output_dir / MINERU_MANIFEST).exists():
+        text = _load_mineru_text(output_dir)
+        if text:
+            write_mineru_manifest(output_dir, pdf_sha, options_key, {**adopt_mode, "adopted": True})
+            return text
     return ""
 
 
+def _tree_usage(root: Path) -> tuple[int, int]:
+    """(bytes, inodes) used by files and directories under root."""
+    total_bytes = inodes = 0
+    for fp in root.rglob("*"):
+        inodes += 1
+        if fp.is_file():
+            total_bytes += fp.stat().st_size
+    return total_bytes, inodes
+
+
+def slim_mineru_output(output_dir: Path) -> Dict[str, int]:
+    """
+    Slim retention: keep only what the extractors read (the manifest's text file and the
+    content_list.json), gzip both, and delete page images, layout/span PDFs, model JSON and
+    the subset PDF. Manifest, page_map.json and failure logs stay. Returns bytes/inodes saved.
+    """
+    manifest = _read_mineru_manifest(output_dir)
+    if not manifest.get("text_file"):
+        return {"bytes_saved": 0, "inodes_saved": 0}
+    before_bytes, before_inodes = _tree_usage(output_dir)
+
+    keep = {output_dir / str(manifest["text_file"])}
+    content_lists = sorted(output_dir.rglob("*content_list.json"))
+    if content_lists:
+        keep.add(content_lists[0])
+    kept: Dict[Path, Path] = {}
+    for fp in keep:
+        if fp.suffix == ".gz" or not fp.exists():
+            kept[fp] = fp
+            continue
+        gz = fp.with_name(fp.name + ".gz")
+        with fp.open("rb") as src, gzip.open(gz, "wb", compresslevel=6) as dst:
+            shutil.copyfileobj(src, dst)
+        fp.unlink()
+        kept[fp] = gz
+
+    top_level = {MINERU_MANIFEST, "page_map.json", "mineru_stdout.log", "mineru_stderr.log"}
+    keep_paths = set(kept.values())
+    for fp in sorted(output_dir.rglob("*"), key=lambda p: len(p.parts), reverse=True):
+        if fp in keep_paths or (fp.parent == output_dir and fp.name in top_level):
+            continue
+        if fp.is_dir():
+            if not any(fp.iterdir()):
+                fp.rmdir()
+        else:
+            fp.unlink(missing_ok=True)
+
+    text_fp = kept.get(output_dir / str(manifest["text_file"]))
+    if text_fp is not None:
+        manifest["text_file"] = str(text_fp.relative_to(output_dir))
+    manifest["retention"] = "slim"
+    (output_dir / MINERU_MANIFEST).write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+
+    after_bytes, after_inodes = _tree_usage(output_dir)
+    saved = {"bytes_saved": before_bytes - after_bytes, "inodes_saved": before_inodes - after_inodes}
+    with _MINERU_STATE_LOCK:
+        MINERU_RETENTION_TOTALS["slots"] += 1
+        MINERU_RETENTION_TOTALS["bytes_saved"] += saved["bytes_saved"]
+        MINERU_RETENTION_TOTALS["inodes_saved"] += saved["inodes_saved"]
+    return saved
+
+
+def _clear_mineru_slot(output_dir: Path) -> None:
+    for item in output_dir.iterdir():
+        if item.is_dir():
+            shutil.rmtree(item, ignore_errors=True)
+        else:
+            item.unlink(missing_ok=True)
+
+
 def run_mineru_extract(
     pdf_path: Path,
     output_dir: Path,
@@ -415,22 +1293,50 @@ def run_mineru_extract(
     formula: bool = True,
     table: bool = True,
     source: str = "",
+    subset_pages: bool = False,
+    retention: str = "full",
+    threads: int = 0,
 ) -> str:
     output_dir.mkdir(parents=True, exist_ok=True)
-    if force_refresh:
-        for item in output_dir.iterdir():
-            if item.is_dir():
-                shutil.rmtree(item, ignore_errors=True)
-            else:
-                item.unlink(missing_ok=True)
-
-    cached = _load_markdown_text(output_dir) or _load_content_list_text(output_dir) or _load_plain_text(output_dir)
-    if cached and not force_refresh:
-        return cached
+    pdf_sha = pdf_sha256(pdf_path)
+    options_key = mineru_options_key(backend, method, lang, formula, table, subset_pages)
+    if not force_refresh:
+        adopt_mode = mineru_adoptable_mode(pdf_sha, method, formula, table)
+        cached = load_cached_mineru_text(output_dir, pdf_sha, options_key, adopt_mode)
+        if cached:
+            return cached
+    if force_refresh or (output_dir / MINERU_MANIFEST).exists():
+        # Slot holds output for other bytes/options: start clean so stale text is never read.
+        _clear_mineru_slot(output_dir)
+
+    record = mineru_mode_record(pdf_sha)
+    if mineru_poisoned(record) and not force_refresh:
+        # Known-poison PDF: every mode failed before, don't repeat the ladder.
+        return ""
+    predicted_method = predict_mineru_method(pdf_path, method)
+    # A copy repaired on an earlier run (see repair_pdf) is parsed directly.
+    source_pdf = preferred_pdf_path(pdf_path)
 
     resolved_device = device or detect_default_device()
+    pdf_path = (prepare_mineru_subset(source_pdf, output_dir) if subset_pages else None) or source_pdf
 
     def _run_once(path_to_pdf: Path, run_method: str, run_formula: bool, run_table: bool) -> tuple[int, str, str]:
+        rc, out, err = _run_parser(path_to_pdf, run_method, run_formula, run_table)
+        if rc == 0:
+            apply_page_map(output_dir)
+        return rc, out, err
+
+    def _run_parser(path_to_pdf: Path, run_method: str, run_formula: bool, run_table: bool) -> tuple[int, str, str]:
+        if mineru_worker_running():
+            return mineru_worker_parse(
+                path_to_pdf,
+                output_dir,
+                backend=backend,
+                method=run_method,
+                lang=lang,
+                formula=run_formula,
+                table=run_table,
+            )
         cmd = build_mineru_cmd(
             path_to_pdf,
             output_dir,
@@ -442,67 +1348,564 @@ def run_mineru_extract(
             table=run_table,
             source=source,
         )
-        proc = subprocess.run(cmd, capture_output=True, text=True)
+        env = mineru_thread_env(threads) if threads > 0 else None
+        proc = subprocess.run(cmd, capture_output=True, text=True, env=env)
         return proc.returncode, proc.stdout or "", proc.stderr or ""
 
-    rc, out, err = _run_once(pdf_path, method, formula, table)
-    text = _load_markdown_text(output_dir) or _load_content_list_text(output_dir) or _load_plain_text(output_dir)
-    if rc == 0 and text:
-        return text
-
-    # Retry once with reserialized PDF if MinerU mis-detected file suffix/format.
-    retry_pdf = None
-    if needs_reserialize(out, err):
-        retry_pdf = reserialize_pdf(pdf_path)
-        if retry_pdf:
-            rc, out, err = _run_once(retry_pdf, method, formula, table)
-            text = _load_markdown_text(output_dir) or _load_content_list_text(output_dir) or _load_plain_text(output_dir)
-            if rc == 0 and text:
-                retry_pdf.unlink(missing_ok=True)
-                return text
-
-    # Fallback: disable formula model to avoid MFR crashes on malformed image crops.
-    err_low = err.lower()
-    if formula and ("'nonetype' object has no attribute 'shape'" in err_low or "mfr predict" in err_low):
-        rc, out2, err2 = _run_once(pdf_path, method, False, table)
-        out = f"{out}\n\n[FORMULA OFF RETRY]\n{out2}"
-        err = f"{err}\n\n[FORMULA OFF RETRY]\n{err2}"
-        text = _load_markdown_text(output_dir) or _load_content_list_text(output_dir) or _load_plain_text(output_dir)
+    first = (predicted_method, formula, table)
+    if record.get("status") == "ok":
+        first = (str(record["method"]), bool(record["formula"]), bool(record["table"]))
+    attempts: List[tuple[str, bool, bool]] = [first]
+    tried: set = set()
+    logs_out: List[str] = []
+    logs_err: List[str] = []
+    repaired = False
+    failures: List[str] = []
+    while attempts:
+        run_method, run_formula, run_table = attempts.pop(0)
+        if (str(source_pdf), run_method, run_formula, run_table) in tried:
+            continue
+        tried.add((str(source_pdf), run_method, run_formula, run_table))
+        if logs_out:
+            label = f"[{run_method.upper()} formula={run_formula} table={run_table} RETRY]"
+            logs_out.append(label)
+            logs_err.append(label)
+        rc, out, err = _run_once(pdf_path, run_method, run_formula, run_table)
+        logs_out.append(out)
+        logs_err.append(err)
+        text = _load_mineru_text(output_dir)
         if rc == 0 and text:
-            if retry_pdf:
-                retry_pdf.unlink(missing_ok=True)
+            mode = {"method": run_method, "formula": run_formula, "table": run_table}
+            record_mineru_mode(pdf_sha, {"status": "ok", **mode})
+            write_mineru_manifest(output_dir, pdf_sha, options_key, mode)
+            if retention == "slim":
+                slim_mineru_output(output_dir)
             return text
 
-    # Fallback: if method auto failed/empty, force OCR once.
-    if method == "auto":
-        rc, out2, err2 = _run_once(pdf_path, "ocr", False, table)
-        out = f"{out}\n\n[OCR RETRY]\n{out2}"
-        err = f"{err}\n\n[OCR RETRY]\n{err2}"
-        text = _load_markdown_text(output_dir) or _load_content_list_text(output_dir) or _load_plain_text(output_dir)
-        if rc == 0 and text:
-            if retry_pdf:
-                retry_pdf.unlink(missing_ok=True)
-            return text
+        failure = classify_mineru_failure(rc, out, err)
+        failures.append(failure)
+        if failure == "reserialize" and not repaired:
+            # Retry once on a repaired copy of the source (never the subset under output_dir, whose
+            # repair would not be reused) if MinerU mis-detected file suffix/format.
+            repaired = True
+            fixed = repair_pdf(source_pdf)
+            if fixed and fixed != source_pdf:
+                source_pdf = fixed
+                pdf_path = (prepare_mineru_subset(source_pdf, output_dir) if subset_pages else None) or source_pdf
+                attempts.insert(0, (run_method, run_formula, run_table))
+                continue
+        if failure == "transient":
+            # Timeout, killed or exited worker: degraded modes would only be recorded as this PDF's mode.
+            break
+        attempts = _next_mineru_attempts(failure, method, table, run_method, run_formula, run_table) + attempts
+
+    if not (record.get("status") == "ok" and "transient" in failures):
+        # A PDF with a known working mode keeps it through a transient failure.
+        record_mineru_mode(pdf_sha, mineru_failure_record(record, failures, len(tried)))
+    _save_mineru_logs(output_dir, "\n\n".join(logs_out), "\n\n".join(logs_err))
+    return ""
 
-    # Last fallback: plain text mode with formula/table both off.
-    rc, out2, err2 = _run_once(pdf_path, "txt", False, False)
-    out = f"{out}\n\n[TXT RETRY]\n{out2}"
-    err = f"{err}\n\n[TXT RETRY]\n{err2}"
-    text = _load_markdown_text(output_dir) or _load_content_list_text(output_dir) or _load_plain_text(output_dir)
-    if rc == 0 and text:
-        if retry_pdf:
-            retry_pdf.unlink(missing_ok=True)
-        return text
 
-    if retry_pdf:
-        retry_pdf.unlink(missing_ok=True)
-    _save_mineru_logs(output_dir, out, err)
-    return ""
+def mineru_thread_env(threads: int) -> Dict[str, str]:
+    """Environment for one MinerU process capped at `threads` OpenMP/BLAS threads (torch follows OMP_NUM_THREADS)."""
+    env = dict(os.environ)
+    for key in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMEXPR_NUM_THREADS"):
+        env[key] = str(threads)
+    return env
+
+
+def available_memory_mb() -> float:
+    """Currently available RAM in MB (psutil, /proc/meminfo or sysconf); 0.0 when unknown."""
+    try:
+        import psutil  # type: ignore
+
+        return psutil.virtual_memory().available / 1024 / 1024
+    except Exception:
+        pass
+    try:
+        for line in Path("/proc/meminfo").read_text().splitlines():
+            if line.startswith("MemAvailable:"):
+                return int(line.split()[1]) / 1024
+    except Exception:
+        pass
+    try:
+        return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") / 1024 / 1024
+    except (ValueError, OSError, AttributeError):
+        return 0.0
+
+
+def estimate_mineru_memory_mb(pdf_path: Path) -> float:
+    return MINERU_BASE_MEMORY_MB + MINERU_PAGE_MEMORY_MB * pdf_page_count(pdf_path)
+
+
+def start_mineru_pool(workers: int, threads_per_worker: int = 0, memory_budget_mb: float = 0.0) -> None:
+    """
+    Run up to `workers` MinerU jobs in parallel (see submit_mineru_job). Each MinerU process is
+    capped at threads_per_worker threads (default: cores / workers), and a job is admitted only
+    while the estimated memory of running jobs fits memory_budget_mb (default: 80% of available
+    RAM). A job that alone exceeds the budget still runs, but only when nothing else is running.
+    """
+    stop_mineru_pool()
+    workers = max(1, workers)
+    _MINERU_POOL.update(
+        {
+            "executor": ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mineru"),
+            "threads": threads_per_worker or max(1, (os.cpu_count() or 1) // workers),
+            "budget_mb": memory_budget_mb or available_memory_mb() * 0.8,
+            "reserved_mb": 0.0,
+        }
+    )
+
+
+def stop_mineru_pool() -> None:
+    executor = _MINERU_POOL.get("executor")
+    if executor is not None:
+        executor.shutdown(wait=True)
+    _MINERU_POOL["executor"] = None
+
+
+def _run_admitted(need_mb: float, kwargs: Dict[str, object], timings: Optional[Dict[str, float]]) -> str:
+    budget = float(_MINERU_POOL["budget_mb"])
+    with _MINERU_POOL_COND:
+        while budget > 0 and _MINERU_POOL["reserved_mb"] > 0 and _MINERU_POOL["reserved_mb"] + need_mb > budget:
+            _MINERU_POOL_COND.wait()
+        _MINERU_POOL["reserved_mb"] += need_mb
+    t0 = time.perf_counter()
+    try:
+        return run_mineru_extract(**kwargs, threads=int(_MINERU_POOL["threads"]))
+    finally:
+        if timings is not None:
+            timings["seconds"] = time.perf_counter() - t0
+        with _MINERU_POOL_COND:
+            _MINERU_POOL["reserved_mb"] -= need_mb
+            _MINERU_POOL_COND.notify_all()
+
+
+def submit_mineru_job(timings: Optional[Dict[str, float]] = None, **kwargs) -> Future:
+    """
+    Queue run_mineru_extract(**kwargs) on the pool started by start_mineru_pool; returns a Future
+    of its text. Pass a dict as timings to receive the parse seconds (admission wait excluded).
+    """
+    executor = _MINERU_POOL.get("executor")
+    if executor is None:
+        raise RuntimeError("start_mineru_pool() must be called before submit_mineru_job()")
+    need_mb = estimate_mineru_memory_mb(Path(kwargs["pdf_path"]))
+    return executor.submit(_run_admitted, need_mb, kwargs, timings)
+
+
+def _stage_pdf(src: Path, dst: Path) -> None:
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def run_mineru_batch(
+    jobs: List[tuple[Path, Path]],
+    staging_root: Path,
+    batch_size: int,
+    backend: str,
+    method: str,
+    lang: str,
+    force_refresh: bool,
+    device: str = "",
+    formula: bool = True,
+    table: bool = True,
+    source: str = "",
+    subset_pages: bool = False,
+    retention: str = "full",
+    threads: int = 0,
+) -> Dict[Path, str]:
+    """
+    Parse many (pdf_path, output_dir) jobs with one MinerU call per chunk of batch_size PDFs.
+    Jobs are grouped by the mode a single run would start from (recorded ok mode, else the
+    predicted method with the requested formula/table), so every chunk runs one mode.
+    PDFs are staged under their output slot name, the batch output is moved back to
+    <output_dir>/<stem>/ (same layout as a single run), and any document whose batch output
+    is missing or empty is retried on its own through run_mineru_extract.
+    Returns {output_dir: text}.
+    """
+    results: Dict[Path, str] = {}
+    pending: List[tuple[Path, Path]] = []
+    options_key = mineru_options_key(backend, method, lang, formula, table, subset_pages)
+    shas: Dict[Path, str] = {}
+    for pdf_path, output_dir in jobs:
+        shas[output_dir] = pdf_sha256(pdf_path)
+        adopt_mode = mineru_adoptable_mode(shas[output_dir], method, formula, table)
+        cached = "" if force_refresh else load_cached_mineru_text(output_dir, shas[output_dir], options_key, adopt_mode)
+        if cached:
+            results[output_dir] = cached
+        elif not force_refresh and mineru_poisoned(mineru_mode_record(shas[output_dir])):
+            results[output_dir] = ""
+        else:
+            pending.append((pdf_path, output_dir))
+
+    modes: Dict[Path, tuple[str, bool, bool]] = {}
+    groups: Dict[tuple[str, bool, bool], List[tuple[Path, Path]]] = {}
+    for pdf_path, output_dir in pending:
+        record = mineru_mode_record(shas[output_dir])
+        if record.get("status") == "ok":
+            mode = (str(record["method"]), bool(record["formula"]), bool(record["table"]))
+        else:
+            mode = (predict_mineru_method(pdf_path, method), formula, table)
+        modes[output_dir] = mode
+        groups.setdefault(mode, []).append((pdf_path, output_dir))
+
+    resolved_device = device or detect_default_device()
+    env = mineru_thread_env(threads) if threads > 0 else None
+    size = max(1, batch_size)
+    # A warm worker already amortises start-up, so it keeps per-document calls.
+    chunks = [] if mineru_worker_running() else [
+        (mode, group[i : i + size]) for mode, group in groups.items() for i in range(0, len(group), size)
+    ]
+    for (run_method, run_formula, run_table), chunk in chunks:
+        staging_root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix="mineru_batch_", dir=staging_root))
+        in_dir, out_dir = staging / "in", staging / "out"
+        in_dir.mkdir()
+        staged: Dict[str, Path] = {}
+        try:
+            for pdf_path, output_dir in chunk:
+                output_dir.mkdir(parents=True, exist_ok=True)
+                if force_refresh or (output_dir / MINERU_MANIFEST).exists():
+                    _clear_mineru_slot(output_dir)
+                pdf_path = preferred_pdf_path(pdf_path)
+                src = (prepare_mineru_subset(pdf_path, output_dir) if subset_pages else None) or pdf_path
+                _stage_pdf(src, in_dir / f"{output_dir.name}.pdf")
+                staged[output_dir.name] = output_dir
+
+            cmd = build_mineru_cmd(
+                in_dir,
+                out_dir,
+                backend=backend,
+                method=run_method,
+                lang=lang,
+                device=resolved_device,
+                formula=run_formula,
+                table=run_table,
+                source=source,
+            )
+            proc = subprocess.run(cmd, capture_output=True, text=True, env=env)
+            print(f"[MinerU batch] {len(chunk)} PDFs method={run_method} rc={proc.returncode}")
+
+            for stem, output_dir in staged.items():
+                produced = out_dir / stem
+                if produced.is_dir():
+                    target = output_dir / stem
+                    shutil.rmtree(target, ignore_errors=True)
+                    shutil.move(str(produced), str(target))
+                    apply_page_map(output_dir)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+
+    for pdf_path, output_dir in pending:
+        text = _load_mineru_text(output_dir)
+        if text:
+            run_method, run_formula, run_table = modes[output_dir]
+            mode = {"method": run_method, "formula": run_formula, "table": run_table}
+            record_mineru_mode(shas[output_dir], {"status": "ok", **mode})
+            write_mineru_manifest(output_dir, shas[output_dir], options_key, {**mode, "batch": True})
+            if retention == "slim":
+                slim_mineru_output(output_dir)
+        else:
+            # Individual retry keeps the reserialize / formula-off / OCR / txt ladder per document.
+            text = run_mineru_extract(
+                pdf_path=pdf_path,
+                output_dir=output_dir,
+                backend=backend,
+                method=method,
+                lang=lang,
+                force_refresh=False,
+                device=device,
+                formula=formula,
+                table=table,
+                source=source,
+                subset_pages=subset_pages,
+                retention=retention,
+                threads=threads,
+            )
+        results[output_dir] = text
+    return results
+
+
+def new_cascade_stats(backends: List[str]) -> Dict[str, Dict[str, float]]:
+    """Per-backend counters: runs (filings reaching it), hits (filings resolved there), seconds."""
+    return {b: {"runs": 0, "hits": 0, "seconds": 0.0} for b in backends}
+
+
+def cascade_needs_escalation(fields: Dict[str, str]) -> bool:
+    """Escalate while auditor, fee or currency is missing, or the auditor match is low confidence."""
+    return (
+        not fields.get("external_auditor")
+        or not fields.get("audit_fee")
+        or not fields.get("currency")
+        or fields.get("confidence") == "low"
+    )
+
+
+def _cascade_pages(backend: str, pdf_path: Path, ocr_max_pages: int) -> Iterator[Tuple[int, str]]:
+    if backend == "text":
+        if pdf_text_coverage(pdf_path) > 0:
+            yield from iter_pdf_pages_sampled(pdf_path)
+    elif backend == "ocr":
+        yield from iter_ocr_targeted_pages(pdf_path, max_pages=ocr_max_pages)
+
+
+def run_local_cascade(
+    pdf_path: Path,
+    backends: List[str],
+    stats: Dict[str, Dict[str, float]],
+    ocr_max_pages: int = 80,
+    corpus_key: Optional[Tuple[str, str]] = None,
+) -> Tuple[Dict[str, str], str]:
+    """
+    Run the in-process backends (sampled text layer, then targeted OCR) in cascade order until
+    cascade_needs_escalation() is False; later backends only fill what earlier ones missed.
+    Pages each backend read go to the corpus and page index under corpus_key (company_number, filing_date).
+    Returns (fields, backend that resolved the filing) or (fields, "") when it must escalate.
+    """
+    fields = new_field_state()
+    pdf_path = preferred_pdf_path(pdf_path)
+    with pdf_document(pdf_path):
+        for backend in backends:
+            if backend == "mineru":
+                break
+            stats[backend]["runs"] += 1
+            t0 = time.perf_counter()
+            seen: List[Tuple[int, str]] = []
+            with closing(recorded_pages(_cascade_pages(backend, pdf_path, ocr_max_pages), seen)) as pages:
+                fields = extract_fields_streaming(pages, state=fields)
+            stats[backend]["seconds"] += time.perf_counter() - t0
+            if corpus_key:
+                record_filing_pages(*corpus_key, backend, seen)
+            if not cascade_needs_escalation(fields):
+                stats[backend]["hits"] += 1
+                return fields, backend
+    return fields, ""
+
+
+def merge_mineru_fields(fields: Dict[str, str], text: str, output_dir: Path) -> Dict[str, str]:
+    """
+    Fold one filing's MinerU output into its cascade fields: a content_list table fee first,
+    then the auditor report / fee note sections, then the full text for whatever is still missing.
+    """
+    fields = dict(fields)
+    table = extract_fee_from_mineru_tables(output_dir) if fields["fee_method"] != "table" else {}
+    if table:
+        # Structured table hit: the text pass below then skips its fee regexes.
+        fields["audit_fee"], fields["fee_method"] = table["audit_fee"], "table"
+        fields["currency"] = table["currency"] or fields["currency"]
+        fields["fee_unit"] = table["fee_unit"] or fields["fee_unit"]
+    sections = extract_report_sections(text)
+    if sections:
+        fields = extract_fields_streaming([(0, sections)], state=fields)
+    if not sections or cascade_needs_escalation(fields):
+        # Whatever the sections missed is looked up in the full MinerU text.
+        fields = extract_fields_streaming([(0, text)], state=fields)
+    return fields
+
+
+def filing_row(company_number: str, company: str, filing_date: str, fields: Dict[str, str], pdf_path: Path | str) -> Dict[str, str]:
+    return make_row(
+        company_number=company_number,
+        company=company,
+        year=fields["year"] or parse_year(filing_date, ""),
+        external_auditor=fields["external_auditor"],
+        audit_fee=fields["audit_fee"],
+        fee_unit=fields["fee_unit"],
+        currency=fields["currency"],
+        filing_date=filing_date,
+        confidence=fields["confidence"],
+        pdf_path=str(pdf_path),
+    )
+
+
+def write_history_outputs(history_rows: List[Dict[str, str]], history_csv: Path, shortlist_csv: Path) -> List[Dict[str, str]]:
+    """Sort history rows in place, write the history and shortlist CSVs, and return the shortlist rows."""
+    history_rows.sort(key=lambda r: (r.get("company_number", ""), r.get("year", "")), reverse=True)
+    shortlist_rows = build_shortlist(history_rows)
+    write_csv(
+        history_csv,
+        history_rows,
+        [
+            "company_number",
+            "company",
+            "year",
+            "external_auditor",
+            "audit_fee",
+            "fee_unit",
+            "currency",
+            "filing_date",
+            "confidence",
+            "pdf_path",
+        ],
+    )
+    write_csv(
+        shortlist_csv,
+        shortlist_rows,
+        [
+            "company_number",
+            "company",
+            "current_external_auditor",
+            "continuous_tenure_years",
+            "latest_audit_fee_gbp",
+            "priority_score",
+            "tender_status",
+        ],
+    )
+    return shortlist_rows
+
+
+def read_history_rows(history_csv: Path) -> List[Dict[str, str]]:
+    if not history_csv.exists():
+        return []
+    with history_csv.open("r", encoding="utf-8", newline="") as f:
+        return list(csv.DictReader(f))
+
+
+def _init_re_extract_worker(regex_engine: str, extract_budget_s: float, auditor_registry: Optional[str]) -> None:
+    configure_field_extraction(regex_engine, extract_budget_s)
+    configure_auditor_registry(Path(auditor_registry) if auditor_registry else None)
+
+
+def _re_extract_filing(job: Dict[str, object]) -> Optional[Dict[str, str]]:
+    """
+    Process-pool worker: replay one filing's cascade from stored text. Corpus text/OCR pages
+    run first, then the cached MinerU slot while fields are still missing. None without any text.
+    """
+    fields = new_field_state()
+    found = False
+    for corpus_path, offset in job["corpus"]:
+        pages = read_corpus_pages(Path(corpus_path), int(offset))
+        if pages:
+            fields = extract_fields_streaming(pages, state=fields)
+            found = True
+    if job["output_dir"] and (not found or cascade_needs_escalation(fields)):
+        output_dir = Path(str(job["output_dir"]))
+        text = _load_mineru_text(output_dir)
+        if text:
+            fields = merge_mineru_fields(fields, text, output_dir)
+            found = True
+    if not found:
+        return None
+    return filing_row(
+        str(job["company_number"]), str(job["company"]), str(job["filing_date"]), fields, str(job["pdf_path"])
+    )
+
+
+def re_extract_history(
+    mineru_output_root: Path,
+    history_csv: Path,
+    download_dir: Path,
+    corpus_dir: Optional[Path] = None,
+    workers: int = 0,
+    regex_engine: str = "re",
+    extract_budget_s: float = 30.0,
+    auditor_registry: Optional[Path] = AUDITOR_REGISTRY_PATH,
+) -> Tuple[List[Dict[str, str]], Dict[str, int]]:
+    """
+    Rebuild history rows with the current extractors from stored text only, in a process pool:
+    text-layer / OCR pages in the corpus files under corpus_dir (latest block per filing and
+    source) and the cached MinerU output slots (<company_number>_<filing_date>). Nothing is
+    downloaded, parsed or OCR'd. Company names and PDF paths come from the previous history
+    CSV; its rows without any stored text are kept as they were.
+    """
+    previous = {(row.get("company_number", ""), row.get("filing_date", "")): row for row in read_history_rows(history_csv)}
+
+    slots: Dict[Tuple[str, str], str] = {}
+    for slot in sorted(mineru_output_root.iterdir()) if mineru_output_root.is_dir() else []:
+        key = parse_filing_stem(slot.name)
+        if key and slot.is_dir():
+            slots[key] = str(slot)
+    blocks: Dict[Tuple[str, str], Dict[str, Tuple[str, int]]] = {}
+    corpus_files = sorted(corpus_dir.glob("corpus_*.trc")) if corpus_dir and corpus_dir.is_dir() else []
+    for corpus_path in corpus_files:
+        for entry in load_corpus_index(corpus_path):
+            if entry["source"] in ("text", "ocr"):
+                key = (str(entry["company_number"]), str(entry["filing_date"]))
+                blocks.setdefault(key, {})[str(entry["source"])] = (str(corpus_path), int(entry["offset"]))
+
+    jobs: List[Dict[str, object]] = []
+    for key in sorted(set(slots) | set(blocks)):
+        prev = previous.get(key, {})
+        jobs.append(
+            {
+                "company_number": key[0],
+                "company": prev.get("company") or key[0],
+                "filing_date": key[1],
+                "pdf_path": prev.get("pdf_path") or str(download_dir / f"{key[0]}_{key[1]}.pdf"),
+                "output_dir": slots.get(key, ""),
+                "corpus": [blocks[key][src] for src in ("text", "ocr") if src in blocks.get(key, {})],
+            }
+        )
+
+    rows: Dict[Tuple[str, str], Dict[str, str]] = {}
+    if jobs:
+        max_workers = max(1, min(workers or os.cpu_count() or 1, len(jobs)))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_re_extract_worker,
+            initargs=(regex_engine, extract_budget_s, str(auditor_registry) if auditor_registry else None),
+        ) as pool:
+            for job, row in zip(jobs, pool.map(_re_extract_filing, jobs, chunksize=8)):
+                if row:
+                    rows[(str(job["company_number"]), str(job["filing_date"]))] = row
+
+    stats = {"filings": len(jobs), "re_extracted": len(rows), "kept": 0}
+    for key, row in previous.items():
+        if key not in rows:
+            rows[key] = row
+            stats["kept"] += 1
+    return list(rows.values()), stats
+
+
+def run_renormalize_auditors(args: argparse.Namespace) -> int:
+    start_ts = time.time()
+    history_csv, shortlist_csv = Path(args.history_csv), Path(args.shortlist_csv)
+    history_rows = read_history_rows(history_csv)
+    changed = renormalize_auditors(history_rows)
+    shortlist_rows = write_history_outputs(history_rows, history_csv, shortlist_csv)
+    print(f"[DONE] history CSV: {history_csv}")
+    print(f"[DONE] shortlist CSV: {shortlist_csv}")
+    print(f"[DONE] renormalize auditors: rows={len(history_rows)} changed={changed} shortlist={len(shortlist_rows)}")
+    print(f"[DONE] runtime_seconds: {time.time() - start_ts:.2f}")
+    return 0
+
+
+def run_re_extract(args: argparse.Namespace) -> int:
+    start_ts = time.time()
+    configure_field_extraction(args.regex_engine, args.extract_budget)
+    history_csv, shortlist_csv = Path(args.history_csv), Path(args.shortlist_csv)
+    history_rows, stats = re_extract_history(
+        Path(args.mineru_output_dir),
+        history_csv,
+        Path(args.download_dir),
+        corpus_dir=Path(args.corpus_dir) if args.corpus_dir else None,
+        workers=args.re_extract_workers,
+        regex_engine=args.regex_engine,
+        extract_budget_s=args.extract_budget,
+        auditor_registry=Path(args.auditor_registry) if args.auditor_registry else None,
+    )
+    shortlist_rows = write_history_outputs(history_rows, history_csv, shortlist_csv)
+    print(f"[DONE] history CSV: {history_csv}")
+    print(f"[DONE] shortlist CSV: {shortlist_csv}")
+    print(
+        f"[DONE] re-extract: filings={stats['filings']} re_extracted={stats['re_extracted']} "
+        f"kept={stats['kept']} history={len(history_rows)} shortlist={len(shortlist_rows)}"
+    )
+    print(f"[DONE] runtime_seconds: {time.time() - start_ts:.2f}")
+    return 0
 
 
 def run_cli() -> int:
     start_ts = time.time()
     args = parse_args()
+    configure_auditor_registry(Path(args.auditor_registry) if args.auditor_registry else None)
+    if args.renormalize_auditors:
+        return run_renormalize_auditors(args)
+    if args.re_extract:
+        return run_re_extract(args)
 
     if not ensure_mineru_cli():
         print('MinerU CLI not found. Install first, e.g. `uv pip install -U "mineru[all]"`.')
@@ -541,10 +1944,51 @@ def run_cli() -> int:
         print("No active companies found.")
         return 0
 
+    cascade = [b.strip() for b in args.cascade.split(",") if b.strip()]
+    unknown = [b for b in cascade if b not in CASCADE_BACKENDS]
+    if not cascade or unknown:
+        print(f"Invalid --cascade {args.cascade!r}; choose from: {', '.join(CASCADE_BACKENDS)}")
+        return 1
+    cascade_stats = new_cascade_stats(cascade)
+    use_mineru = "mineru" in cascade
+
+    use_pool = use_mineru and args.mineru_workers > 1 and args.mineru_batch_size <= 0
+    if args.mineru_worker and use_pool:
+        print("[INFO] --mineru-workers > 1: running separate MinerU processes instead of the warm worker.")
+    elif args.mineru_worker and use_mineru:
+        start_mineru_worker(device=args.mineru_device or detect_default_device(), source=args.mineru_source)
+
     history_rows: List[Dict[str, str]] = []
     download_dir = Path(args.download_dir)
+    configure_pdf_index(Path(args.pdf_index) if args.pdf_index else None, exclude_dirs=[Path(args.mineru_output_dir)])
+    configure_field_extraction(args.regex_engine, args.extract_budget)
+    configure_corpus(Path(args.corpus_dir) if args.corpus_dir else None)
+    configure_page_index(Path(args.page_index) if args.page_index else None)
     mineru_output_root = Path(args.mineru_output_dir)
+    configure_mineru_mode_cache(Path(args.mineru_mode_cache) if args.mineru_mode_cache else None)
+    if args.mineru_clear_failures:
+        print(f"[INFO] cleared {clear_mineru_failures()} failed MinerU mode records")
+    mineru_options = dict(
+        backend=args.mineru_backend,
+        method=args.mineru_method,
+        lang=args.mineru_lang,
+        force_refresh=args.mineru_force_refresh,
+        device=args.mineru_device,
+        formula=args.mineru_formula,
+        table=args.mineru_table,
+        source=args.mineru_source,
+        subset_pages=args.mineru_subset,
+        retention=args.mineru_retention,
+    )
+    if use_pool:
+        start_mineru_pool(
+            args.mineru_workers,
+            threads_per_worker=args.mineru_threads_per_worker,
+            memory_budget_mb=args.mineru_memory_budget_mb,
+        )
 
+    # Phase 1: collect downloaded filings.
+    pending: List[Dict[str, object]] = []
     for c in companies:
         company_number = str(c.get("company_number") or "")
         if not company_number:
@@ -574,79 +2018,86 @@ def run_cli() -> int:
             pdf_path = download_dir / f"{company_number}_{filing_date}.pdf"
             if not pdf_path.exists() and not download_pdf(session=session, headers=headers, pdf_url=pdf_url, output_path=pdf_path):
                 continue
-
-            per_pdf_output = mineru_output_root / f"{company_number}_{filing_date}"
-            text = run_mineru_extract(
-                pdf_path=pdf_path,
-                output_dir=per_pdf_output,
-                backend=args.mineru_backend,
-                method=args.mineru_method,
-                lang=args.mineru_lang,
-                force_refresh=args.mineru_force_refresh,
-                device=args.mineru_device,
-                formula=args.mineru_formula,
-                table=args.mineru_table,
-                source=args.mineru_source,
+            pdf_info(pdf_path)  # keep the PDF index current for later stages
+
+            job: Dict[str, object] = {
+                "company_number": company_number,
+                "company": company_name,
+                "filing_date": filing_date,
+                "pdf_path": pdf_path,
+                "output_dir": mineru_output_root / f"{company_number}_{filing_date}",
+            }
+            job["fields"], job["resolved_by"] = run_local_cascade(
+                pdf_path, cascade, cascade_stats, corpus_key=(company_number, filing_date)
             )
-            if not text:
-                continue
-
-            auditor, confidence = extract_external_auditor(text)
-            audit_fee, _ = extract_audit_fee(text)
-            currency, fee_unit = detect_currency_and_unit(text)
-            year = parse_year(filing_date, text)
-
-            history_rows.append(
-                make_row(
-                    company_number=company_number,
-                    company=company_name,
-                    year=year,
-                    external_auditor=auditor,
-                    audit_fee=audit_fee,
-                    fee_unit=fee_unit,
-                    currency=currency,
-                    filing_date=filing_date,
-                    confidence=confidence,
-                    pdf_path=str(pdf_path),
+            job["needs_mineru"] = use_mineru and not job["resolved_by"]
+            if use_pool and job["needs_mineru"]:
+                # Parsing starts now; downloads keep feeding the pool.
+                job["timings"] = {}
+                job["future"] = submit_mineru_job(
+                    timings=job["timings"], pdf_path=pdf_path, output_dir=job["output_dir"], **mineru_options
                 )
-            )
+            pending.append(job)
+
+    # Phase 2 (batch mode): one MinerU call per chunk instead of per PDF.
+    batch_texts: Dict[Path, str] = {}
+    batch_jobs = [job for job in pending if job["needs_mineru"]]
+    if args.mineru_batch_size > 0 and batch_jobs:
+        t0 = time.perf_counter()
+        batch_texts = run_mineru_batch(
+            [(Path(job["pdf_path"]), Path(job["output_dir"])) for job in batch_jobs],
+            staging_root=mineru_output_root / "_staging",
+            batch_size=args.mineru_batch_size,
+            threads=args.mineru_threads_per_worker,
+            **mineru_options,
+        )
+        cascade_stats["mineru"]["seconds"] += time.perf_counter() - t0
+
+    # Phase 3: merge MinerU text into the cascade fields and build rows.
+    for job in pending:
+        pdf_path = Path(job["pdf_path"])
+        per_pdf_output = Path(job["output_dir"])
+        filing_date = str(job["filing_date"])
+        fields = dict(job["fields"])
+        if job["needs_mineru"]:
+            cascade_stats["mineru"]["runs"] += 1
+            if "future" in job:
+                text = job["future"].result()
+                cascade_stats["mineru"]["seconds"] += job["timings"].get("seconds", 0.0)
+            elif per_pdf_output in batch_texts:
+                text = batch_texts[per_pdf_output]
+            else:
+                t0 = time.perf_counter()
+                text = run_mineru_extract(pdf_path=pdf_path, output_dir=per_pdf_output, **mineru_options)
+                cascade_stats["mineru"]["seconds"] += time.perf_counter() - t0
+            if text:
+                record_filing_pages(str(job["company_number"]), filing_date, "mineru", mineru_pages(per_pdf_output, text))
+                fields = merge_mineru_fields(fields, text, per_pdf_output)
+                if not cascade_needs_escalation(fields):
+                    cascade_stats["mineru"]["hits"] += 1
+        else:
+            text = ""
+        if not text and not job["resolved_by"] and not (fields["external_auditor"] or fields["audit_fee"]):
+            continue
 
-    history_rows.sort(key=lambda r: (r.get("company_number", ""), r.get("year", "")), reverse=True)
-    shortlist_rows = build_shortlist(history_rows)
+        history_rows.append(
+            filing_row(str(job["company_number"]), str(job["company"]), filing_date, fields, pdf_path)
+        )
 
-    write_csv(
-        Path(args.history_csv),
-        history_rows,
-        [
-            "company_number",
-            "company",
-            "year",
-            "external_auditor",
-            "audit_fee",
-            "fee_unit",
-            "currency",
-            "filing_date",
-            "confidence",
-            "pdf_path",
-        ],
-    )
-    write_csv(
-        Path(args.shortlist_csv),
-        shortlist_rows,
-        [
-            "company_number",
-            "company",
-            "current_external_auditor",
-            "continuous_tenure_years",
-            "latest_audit_fee_gbp",
-            "priority_score",
-            "tender_status",
-        ],
-    )
+    stop_mineru_pool()
+    shortlist_rows = write_history_outputs(history_rows, Path(args.history_csv), Path(args.shortlist_csv))
 
     print(f"[DONE] history CSV: {args.history_csv}")
     print(f"[DONE] shortlist CSV: {args.shortlist_csv}")
     print(f"[DONE] rows: history={len(history_rows)} shortlist={len(shortlist_rows)}")
+    for backend, st in cascade_stats.items():
+        print(f"[DONE] cascade {backend}: runs={st['runs']:.0f} hits={st['hits']:.0f} seconds={st['seconds']:.2f}")
+    if MINERU_RETENTION_TOTALS["slots"]:
+        print(
+            f"[DONE] slim retention: slots={MINERU_RETENTION_TOTALS['slots']} "
+            f"saved={MINERU_RETENTION_TOTALS['bytes_saved'] / 1024 / 1024:.1f} MB "
+            f"inodes={MINERU_RETENTION_TOTALS['inodes_saved']}"
+        )
     elapsed = time.time() - start_ts
     print(f"[DONE] runtime_seconds: {elapsed:.2f}")
     print(f"[DONE] runtime_minutes: {elapsed / 60:.2f}")
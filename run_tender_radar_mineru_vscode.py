@@ -12,40 +12,30 @@ from run_tender_radar_mineru import (
     check_mineru_runtime_deps,
     ensure_mineru_cli,
     ensure_companies_csv_from_companies_house,
+    extract_fee_from_mineru_tables,
     is_target_accounts_filing,
     load_active_companies_from_csv,
     run_mineru_extract,
+    start_mineru_worker,
 )
 from tender_radar import (
     account_filings,
     build_shortlist,
+    configure_pdf_index,
     create_ch_session,
-    detect_currency_and_unit,
     document_pdf_url,
     download_pdf,
-    extract_audit_fee,
-    extract_external_auditor,
+    extract_fields,
     load_api_key_from_file,
     load_dotenv_file,
     make_row,
-    parse_year,
+    pdf_page_count,
+    refresh_pdf_index,
     search_companies,
     write_csv,
 )
 
 
-def get_pdf_page_count(pdf_path: Path) -> int:
-    try:
-        import fitz  # type: ignore
-    except Exception:
-        return 0
-    try:
-        doc = fitz.open(str(pdf_path))
-        return int(doc.page_count or 0)
-    except Exception:
-        return 0
-
-
 # %% 1) Config: edit values here
 # Works in both .py and .ipynb: __file__ is not defined in notebooks.
 ROOT = Path(__file__).resolve().parent if "__file__" in globals() else Path.cwd()
@@ -74,6 +64,7 @@ DOWNLOAD_DIR = Path(os.getenv("TENDER_DOWNLOAD_DIR", str(ROOT / "uk_accounts_pdf
 PREVIEW_DOWNLOAD_DIR = Path(os.getenv("TENDER_PREVIEW_DOWNLOAD_DIR", str(ROOT / "preview_downloads")))
 HISTORY_CSV = Path(os.getenv("TENDER_HISTORY_CSV", str(ROOT / "tender_history.csv")))
 SHORTLIST_CSV = Path(os.getenv("TENDER_SHORTLIST_CSV", str(ROOT / "tender_shortlist.csv")))
+PDF_INDEX = Path(os.getenv("TENDER_PDF_INDEX", str(ROOT / "pdf_index.sqlite")))
 
 MINERU_OUTPUT_DIR = Path(os.getenv("TENDER_MINERU_OUTPUT_DIR", str(ROOT / "mineru_outputs")))
 MINERU_BACKEND = os.getenv("TENDER_MINERU_BACKEND", "pipeline")
@@ -84,6 +75,9 @@ MINERU_FORMULA = os.getenv("TENDER_MINERU_FORMULA", "false").lower() != "false"
 MINERU_TABLE = os.getenv("TENDER_MINERU_TABLE", "true").lower() != "false"
 MINERU_SOURCE = os.getenv("TENDER_MINERU_SOURCE", "")
 MINERU_FORCE_REFRESH = False
+MINERU_WORKER = os.getenv("TENDER_MINERU_WORKER", "false").lower() == "true"
+MINERU_SUBSET = os.getenv("TENDER_MINERU_SUBSET", "false").lower() == "true"
+MINERU_RETENTION = os.getenv("TENDER_MINERU_RETENTION", "full")  # "slim" keeps only gzipped md + content_list
 
 API_KEY_FILE = Path(os.getenv("CH_API_KEY_FILE", str(ROOT / "ch_api_key.txt")))
 API_KEY = os.getenv("CH_API_KEY") or load_api_key_from_file(API_KEY_FILE)
@@ -97,9 +91,11 @@ print(f"DOWNLOAD_DIR={DOWNLOAD_DIR}")
 print(f"PREVIEW_DOWNLOAD_DIR={PREVIEW_DOWNLOAD_DIR}")
 print(f"HISTORY_CSV={HISTORY_CSV}")
 print(f"SHORTLIST_CSV={SHORTLIST_CSV}")
+print(f"PDF_INDEX={PDF_INDEX}")
 print(f"RUN_ONLY_PREVIEW_COMPANY={RUN_ONLY_PREVIEW_COMPANY}")
 print(f"SAMPLE_ONLY_COMPANY_NUMBER={SAMPLE_ONLY_COMPANY_NUMBER}")
 print(f"MINERU_BACKEND={MINERU_BACKEND}, METHOD={MINERU_METHOD}, DEVICE={MINERU_DEVICE or 'auto'}")
+print(f"MINERU_WORKER={MINERU_WORKER}, SUBSET={MINERU_SUBSET}, RETENTION={MINERU_RETENTION}")
 
 
 # %% 2) Pre-flight checks
@@ -112,6 +108,10 @@ if missing:
 if not API_KEY:
     raise RuntimeError("Missing API key. Set CH_API_KEY in .env or provide ch_api_key.txt")
 
+if MINERU_WORKER:
+    start_mineru_worker(device=MINERU_DEVICE, source=MINERU_SOURCE)
+    print("MinerU warm worker started (models load on the first filing).")
+
 print("Pre-flight checks passed.")
 
 
@@ -251,8 +251,13 @@ for c in companies:
                 }
             )
 
+# Page counts, hashes and text-layer coverage are answered from the index from here on.
+pdf_index_conn = configure_pdf_index(PDF_INDEX, exclude_dirs=[MINERU_OUTPUT_DIR])
+indexed = refresh_pdf_index(pdf_index_conn, [DOWNLOAD_DIR, PREVIEW_DOWNLOAD_DIR])
+
 print(f"Preview folder: {PREVIEW_DOWNLOAD_DIR}")
 print(f"Downloaded/ready files: {len(downloaded_rows)}")
+print(f"PDF index: {PDF_INDEX} (new/updated entries: {indexed})")
 downloaded_files_df = pd.DataFrame(downloaded_rows)
 display(downloaded_files_df.head(200))
 
@@ -292,7 +297,7 @@ for c in sample_companies:
             ok = download_pdf(session=session, headers=headers, pdf_url=pdf_url, output_path=sample_pdf_path)
             if not ok:
                 continue
-        page_count = get_pdf_page_count(sample_pdf_path)
+        page_count = pdf_page_count(sample_pdf_path)
         rank_pages = page_count if page_count > 0 else 10_000
         candidates.append((rank_pages, filing, sample_pdf_path))
 
@@ -316,6 +321,8 @@ for c in sample_companies:
         formula=MINERU_FORMULA,
         table=MINERU_TABLE,
         source=MINERU_SOURCE,
+        subset_pages=MINERU_SUBSET,
+        retention=MINERU_RETENTION,
     )
     if not sample_text:
         sample_extraction_rows.append(
@@ -331,10 +338,11 @@ for c in sample_companies:
         )
         continue
 
-    sample_auditor, sample_conf = extract_external_auditor(sample_text)
-    sample_fee, _ = extract_audit_fee(sample_text)
-    sample_currency, sample_unit = detect_currency_and_unit(sample_text)
-    sample_year = parse_year(sample_date, sample_text)
+    sample_fields = extract_fields(sample_text, sample_date)
+    sample_auditor, sample_conf = sample_fields["external_auditor"], sample_fields["confidence"]
+    sample_fee = sample_fields["audit_fee"]
+    sample_currency, sample_unit = sample_fields["currency"], sample_fields["fee_unit"]
+    sample_year = sample_fields["year"]
     sample_extraction_rows.append(
         {
             "company_number": company_number,
@@ -434,14 +442,19 @@ for c in run_companies:
             formula=MINERU_FORMULA,
             table=MINERU_TABLE,
             source=MINERU_SOURCE,
+            subset_pages=MINERU_SUBSET,
+            retention=MINERU_RETENTION,
         )
         if not text:
             continue
 
-        auditor, confidence = extract_external_auditor(text)
-        audit_fee, _ = extract_audit_fee(text)
-        currency, fee_unit = detect_currency_and_unit(text)
-        year = parse_year(filing_date, text)
+        fields = extract_fields(text, filing_date)
+        auditor, confidence = fields["external_auditor"], fields["confidence"]
+        fee_table = extract_fee_from_mineru_tables(per_pdf_output)
+        audit_fee = fee_table.get("audit_fee") or fields["audit_fee"]
+        currency = fee_table.get("currency") or fields["currency"]
+        fee_unit = fee_table.get("fee_unit") or fields["fee_unit"]
+        year = fields["year"]
 
         history_rows.append(
             make_row(
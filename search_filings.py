@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Query the full-text page index (page_index.sqlite) built during extraction runs.
+
+  python search_filings.py '"fees payable to the company" AND auditor*' --min-gbp 1000000
+  python search_filings.py 'NEAR(auditor* remuneration, 10)' --company 01234567
+  python search_filings.py --backfill corpus/ 'auditor*'
+
+Queries use SQLite FTS5 syntax: "phrases", prefix*, AND / OR / NOT and NEAR(...).
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import re
+import sqlite3
+from pathlib import Path
+from typing import Dict, List
+
+from tender_radar import (
+    configure_page_index,
+    detect_currency_and_unit,
+    fee_to_gbp_numeric,
+    index_filing_pages,
+    iter_corpus,
+    search_pages,
+)
+
+# £-prefixed or suffixed amounts (£2m, £1.2bn, 250k, £45) and bare grouped, decimal or 3+ digit numbers.
+_AMOUNT = re.compile(
+    r"(?i)(?P<pound>£\s*)?(?P<value>\d{1,3}(?:,\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?)"
+    r"(?:\s*(?P<suffix>bn|billion|m|million|k)\b)?"
+)
+_SUFFIX_UNITS = {"bn": "billion", "billion": "billion", "m": "million", "million": "million", "k": "thousand"}
+
+
+def amounts_near(row: Dict[str, object], window: int) -> List[float]:
+    """GBP amounts within window characters of the row's matched tokens; bare numbers use the page's unit."""
+    text = str(row["text"])
+    currency, page_unit = detect_currency_and_unit(text)
+    amounts: List[float] = []
+    for start, end in row["hits"]:
+        for m in _AMOUNT.finditer(text, max(0, start - window), min(len(text), end + window)):
+            value = m["value"].replace(",", "")
+            if not m["pound"] and not m["suffix"] and re.fullmatch(r"\d{1,2}|(?:19|20)\d{2}", value):
+                continue  # a note number or year column, not an amount
+            suffix = (m["suffix"] or "").lower()
+            unit = _SUFFIX_UNITS.get(suffix) or ("" if m["pound"] else page_unit)
+            gbp = fee_to_gbp_numeric(value, unit, "GBP" if m["pound"] else currency)
+            if gbp:  # None, or 0 from a "£000" column header
+                amounts.append(gbp)
+    return amounts
+
+
+def backfill(corpus_dir: Path, conn) -> int:
+    """Index every block of the corpus files under corpus_dir (later files replace earlier pages)."""
+    pages = 0
+    for path in sorted(corpus_dir.glob("corpus_*.trc")):
+        for key, block in iter_corpus(path):
+            pages += index_filing_pages(conn, key["company_number"], key["filing_date"], key["source"], block)
+    return pages
+
+
+def main() -> None:
+    root = Path(__file__).resolve().parent
+    p = argparse.ArgumentParser(description="Search extracted filing text by company, filing date and page")
+    p.add_argument("query", help="FTS5 query")
+    p.add_argument("--index", default=os.getenv("TENDER_PAGE_INDEX", str(root / "page_index.sqlite")), help="Page index path")
+    p.add_argument("--company", default="", help="Only this company number")
+    p.add_argument("--filing-date", default="", help="Only this filing date (YYYY-MM-DD)")
+    p.add_argument("--min-gbp", type=float, default=0.0, help="Only pages with a GBP amount at least this near a match")
+    p.add_argument("--near", type=int, default=300, help="Characters around a match searched for --min-gbp amounts")
+    p.add_argument("--limit", type=int, default=50, help="Max pages listed")
+    p.add_argument("--backfill", default="", help="Index this corpus directory first")
+    args = p.parse_args()
+
+    conn = configure_page_index(Path(args.index))
+    if args.backfill:
+        print(f"[INFO] indexed {backfill(Path(args.backfill), conn)} pages from {args.backfill}")
+
+    try:
+        rows = search_pages(
+            args.query,
+            limit=-1 if args.min_gbp else args.limit,
+            company_number=args.company,
+            filing_date=args.filing_date,
+        )
+    except sqlite3.OperationalError as exc:
+        raise SystemExit(f"[ERROR] invalid FTS5 query {args.query!r}: {exc}")
+    shown = 0
+    for row in rows:
+        amount = ""
+        if args.min_gbp:
+            near = [a for a in amounts_near(row, args.near) if a >= args.min_gbp]
+            if not near:
+                continue
+            amount = f" £{max(near):,.0f}"
+        print(f"{row['company_number']} {row['filing_date']} {row['source']} p{row['page']}{amount}  {row['snippet']}")
+        shown += 1
+        if shown >= args.limit:
+            break
+    print(f"[DONE] pages: {shown}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,23 @@ from __future__ import annotations
 import argparse
 import base64
 import csv
+import hashlib
+import json
 import math
+import mmap
 import os
 import re
+import struct
+import threading
 import time
-from collections import defaultdict
+import zlib
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from itertools import accumulate
+from contextlib import closing, contextmanager
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional, Tuple
+from types import SimpleNamespace
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
 
 import requests
 
@@ -30,6 +40,47 @@ AUDITOR_NORMALIZATION = {
     "mazars": "Mazars",
     "rsm": "RSM",
 }
+# UK statutory audit firms beyond the built-in names above (configure_auditor_registry).
+AUDITOR_REGISTRY_PATH = Path(__file__).resolve().with_name("uk_audit_firms.csv")
+
+# Tokens whose OCR confidence decides whether a page is re-rendered at high zoom.
+OCR_KEY_TOKENS = ("auditor", "audit", "remuneration", "fees", "llp", "£")
+# Low-zoom OCR lines that anchor high-zoom crops (region-targeted OCR).
+# Zoom of the OCR stage's sparse scan; find_candidate_pages samples at the same zoom so renders are shared.
+OCR_SPARSE_ZOOM = 1.6
+OCR_FEE_REGION_HINTS = ("remuneration", "fees payable", "audit of the", "audit fee", "statutory audit")
+OCR_SIGNATURE_REGION_HINTS = ("on behalf of", "statutory auditor", "chartered accountants", " llp")
+# OCR result cache state; see configure_ocr_cache. Disabled until configured.
+_OCR_CACHE: Dict[str, object] = {"dir": None, "max_bytes": 512 * 1024 * 1024, "size": None, "engine": None}
+_OCR_CACHE_LOCK = threading.Lock()
+# Pooled PyMuPDF handles keyed by resolved path -> [(mtime_ns, size), doc, refs, close_when_idle];
+# see pdf_document. Entries replaced or dropped while referenced wait in _PDF_POOL_RETIRED.
+# _PDF_POOL_LOCK also serialises the PyMuPDF calls themselves (open, page text, rendering,
+# saving): MuPDF is not safe to call from several threads at once, and MinerU pool threads
+# prepare subsets while the main thread reads PDFs. It is never held across a generator
+# yield or a Tesseract run, so one thread's OCR does not stall another thread's PDF work.
+PDF_POOL_MAX_OPEN = int(os.getenv("TENDER_PDF_POOL_SIZE", "8"))
+_PDF_POOL: "OrderedDict[str, List[object]]" = OrderedDict()
+_PDF_POOL_RETIRED: List[List[object]] = []
+_PDF_POOL_LOCK = threading.RLock()
+_PDF_INFO_CACHE: Dict[Tuple[str, Tuple[int, int]], Dict[str, object]] = {}
+# File SHA-256 per (path, (mtime, size)) when no PDF index holds it; see pdf_sha256.
+_PDF_SHA_CACHE: Dict[Tuple[str, Tuple[int, int]], str] = {}
+# SQLite PDF metadata index connection and directories it never indexes; see configure_pdf_index.
+_PDF_INDEX: Dict[str, object] = {"conn": None, "exclude": ()}
+# Regex engine and per-document time budget (seconds, 0 = none) of the field extractors;
+# see configure_field_extraction.
+_FIELD_EXTRACTION: Dict[str, object] = {"engine": "re", "budget_s": float(os.getenv("TENDER_EXTRACT_BUDGET_S", "30"))}
+# Append-only extracted-text corpus for this run (configure_corpus).
+_CORPUS: Dict[str, object] = {"path": None, "file": None, "index": None, "codec": 0, "compress": None}
+_CORPUS_LOCK = threading.Lock()
+# Auditor name resolver indexes (configure_auditor_registry).
+_AUDITOR_REGISTRY: Dict[str, object] = {"path": None, "canonical": frozenset(), "memo": {}, "resolved": {}}
+# SQLite FTS5 index of extracted page text (configure_page_index).
+_PAGE_INDEX: Dict[str, object] = {"conn": None}
+_PAGE_INDEX_LOCK = threading.RLock()
+# Table header cells such as "2024", "2024 £000" or "£m 2024" that anchor year columns.
+_YEAR_HEADER_CELL = re.compile(r"(?i)(?:[£$€]\s*(?:['’]?000|m)?\s*)?(20\d{2})(?:\s*[£$€]\s*(?:['’]?000|m)?)?")
 
 
 def make_row(
@@ -244,13 +295,221 @@ def is_probably_full_audited_accounts(filing: dict) -> bool:
     return any(h in desc for h in hints) or typ in {"aa", "aa01", "aa02", "aa03", "aa04", "aa06", "aa07"}
 
 
+_AUDIT_FIRM_BAD_HINTS = (
+    "consolidated financial statements",
+    "climate-related",
+    "note ",
+    "contents",
+    "directors",
+    "statement",
+)
+_AUDIT_FIRM_SUFFIXES = (" llp", " ltd", " limited", " plc")
+
+
+_AUDITOR_NAME_TOKEN = re.compile(r"[a-z0-9]+")
+_GLUED_LLP = re.compile(r"(?<=[a-z0-9])llp\b")  # OCR "KPMGLLP"
+# Tokens that end the firm name proper in a captured string (legal form / role words).
+_AUDITOR_NAME_STOP = frozenset(
+    ("llp", "ltd", "limited", "plc", "chartered", "statutory", "registered", "accountants", "auditor", "auditors")
+)
+# Words too common in firm names to count towards a fuzzy match.
+_AUDITOR_NAME_GENERIC = frozenset(("and", "the", "of", "for", "audit", "services", "uk", "co", "partners", "accountancy"))
+_AUDITOR_FUZZY_MIN_DICE = 0.8
+# Legal-form tokens that let a needs_suffix firm (a bare surname such as "Menzies") match,
+# looked for within _AUDITOR_SUFFIX_WINDOW tokens after the alias; "chartered accountants"
+# counts as well.
+_AUDITOR_SUFFIX_TOKENS = frozenset(("llp", "ltd", "limited"))
+_AUDITOR_SUFFIX_WINDOW = 3
+# Shortest alias (spaces removed) found glued to a neighbouring word ("remunerationKPMG").
+_AUDITOR_GLUED_MIN_LEN = 4
+_AUDITOR_MEMO_MAX = 100_000
+
+
+def _auditor_name_tokens(name: str) -> List[str]:
+    return _AUDITOR_NAME_TOKEN.findall(_GLUED_LLP.sub(" llp", name.lower().replace("&", " and ").replace("+", " and ")))
+
+
+def _has_firm_suffix(tokens: Sequence[str]) -> bool:
+    return any(t in _AUDITOR_SUFFIX_TOKENS for t in tokens) or any(
+        a == "chartered" and b == "accountants" for a, b in zip(tokens, tokens[1:])
+    )
+
+
+def _name_trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def configure_auditor_registry(path: Optional[Path] = AUDITOR_REGISTRY_PATH) -> int:
+    """
+    Load the audit firm registry CSV (name, aliases separated by ';', needs_suffix) on top
+    of AUDITOR_NORMALIZATION and rebuild the resolver indexes: alias token sequences by first
+    token for exact matches, aliases with spaces removed for text glued to a neighbouring
+    word, character trigrams of aliases (4+ characters without generic words such as
+    "audit" or "services") for fuzzy ones. Firms with needs_suffix=yes (surnames and common
+    words) only match when LLP / Ltd / Limited / Chartered Accountants follows.
+    A missing file (or None) leaves the built-in firms only. Returns the number of firms.
+    """
+    entries: List[Tuple[str, str]] = [(normalized, raw) for raw, normalized in AUDITOR_NORMALIZATION.items()]
+    needs_suffix: Set[str] = set()
+    if path and Path(path).exists():
+        with Path(path).open("r", encoding="utf-8", newline="") as f:
+            for row in csv.DictReader(f):
+                name = (row.get("name") or "").strip()
+                if name:
+                    entries.extend((name, alias) for alias in [name, *(row.get("aliases") or "").split(";")] if alias.strip())
+                    if (row.get("needs_suffix") or "").strip().lower() in ("yes", "true", "1"):
+                        needs_suffix.add(name)
+
+    aliases: Dict[Tuple[str, ...], str] = {}
+    by_first: Dict[str, List[Tuple[str, ...]]] = defaultdict(list)
+    glued: List[Tuple[str, str]] = []
+    grams: Dict[str, List[int]] = defaultdict(list)
+    fuzzy: List[Tuple[str, int]] = []
+    for name, alias in entries:
+        tokens = tuple(_auditor_name_tokens(alias))
+        if not tokens or tokens in aliases:
+            continue  # first spelling wins, so built-in names keep their firm
+        aliases[tokens] = name
+        by_first[tokens[0]].append(tokens)
+        if len("".join(tokens)) >= _AUDITOR_GLUED_MIN_LEN:
+            glued.append(("".join(tokens), name))
+        text = " ".join(t for t in tokens if t not in _AUDITOR_NAME_GENERIC)
+        if len(text) >= 4:
+            alias_grams = _name_trigrams(text)
+            for g in alias_grams:
+                grams[g].append(len(fuzzy))
+            fuzzy.append((name, len(alias_grams)))
+    for seqs in by_first.values():
+        seqs.sort(key=len, reverse=True)  # longest alias first at each position
+    glued.sort(key=lambda item: len(item[0]), reverse=True)
+    _AUDITOR_REGISTRY.update(
+        path=Path(path) if path else None,
+        canonical=frozenset(name.lower() for name, _ in entries if name not in needs_suffix),
+        needs_suffix=frozenset(needs_suffix),
+        aliases=aliases,
+        by_first=dict(by_first),
+        glued=glued,
+        grams=dict(grams),
+        fuzzy=fuzzy,
+        memo={},
+        resolved={},
+    )
+    return len({name for name, _ in entries})
+
+
+def _fuzzy_auditor_name(core: str) -> str:
+    if len(core) < 4:
+        return ""
+    core_grams = _name_trigrams(core)
+    shared: Dict[int, int] = defaultdict(int)
+    for g in core_grams:
+        for idx in _AUDITOR_REGISTRY["grams"].get(g, ()):
+            shared[idx] += 1
+    best, best_dice = "", _AUDITOR_FUZZY_MIN_DICE
+    for idx, n in shared.items():
+        name, alias_grams = _AUDITOR_REGISTRY["fuzzy"][idx]
+        dice = 2.0 * n / (len(core_grams) + alias_grams)
+        if dice >= best_dice:
+            best, best_dice = name, dice
+    return best
+
+
+def _firm_allowed(name: str, tokens: Sequence[str], end: int) -> bool:
+    """False for a needs_suffix firm whose alias (ending before tokens[end]) has no legal form after it."""
+    if name not in _AUDITOR_REGISTRY["needs_suffix"]:
+        return True
+    return _has_firm_suffix(tokens[end : end + _AUDITOR_SUFFIX_WINDOW])
+
+
+def _glued_auditor_name(tokens: Sequence[str]) -> str:
+    """Firm whose alias is glued to a neighbouring word on one side ("remunerationKPMG LLP")."""
+    joined = "".join(tokens)
+    ends = list(accumulate(len(t) for t in tokens))
+    bounds = {0, *ends}
+    for alias, name in _AUDITOR_REGISTRY["glued"]:
+        pos = joined.find(alias)
+        while pos != -1:
+            end = pos + len(alias)
+            if (pos in bounds or end in bounds) and _firm_allowed(name, tokens, bisect_left(ends, end) + 1):
+                return name
+            pos = joined.find(alias, pos + 1)
+    return ""
+
+
+def resolve_auditor_name(name: str) -> str:
+    """
+    Registry firm for a raw auditor string, or "" when none matches. An alias must appear as
+    whole tokens (so "EY" no longer matches "Jeffreys") or, failing that, glued to a word on
+    one side only; otherwise the name up to its legal form / role words is compared by
+    trigram similarity to catch OCR misspellings. needs_suffix firms also need a legal form
+    after the name. Memoised per distinct string.
+    """
+    memo = _AUDITOR_REGISTRY["resolved"]
+    if name in memo:
+        return memo[name]
+    tokens = _auditor_name_tokens(name)
+    by_first, aliases = _AUDITOR_REGISTRY["by_first"], _AUDITOR_REGISTRY["aliases"]
+    found = ""
+    for i, token in enumerate(tokens):
+        for seq in by_first.get(token, ()):
+            if tuple(tokens[i : i + len(seq)]) == seq and _firm_allowed(aliases[seq], tokens, i + len(seq)):
+                found = aliases[seq]
+                break
+        if found:
+            break
+    if not found:
+        found = _glued_auditor_name(tokens)
+    if not found:
+        core: List[str] = []
+        for token in tokens:
+            if token in _AUDITOR_NAME_STOP:
+                break
+            if token not in _AUDITOR_NAME_GENERIC:
+                core.append(token)
+        found = _fuzzy_auditor_name(" ".join(core))
+        if found in _AUDITOR_REGISTRY["needs_suffix"] and not _has_firm_suffix(tokens):
+            found = ""
+    if len(memo) >= _AUDITOR_MEMO_MAX:
+        memo.clear()
+    memo[name] = found
+    return found
+
+
+def _clean_auditor_name(name: str) -> str:
+    return " ".join(name.replace("\u00a0", " ").split()).strip(" ,.;:-")
+
+
 def normalize_auditor_name(name: str) -> str:
-    cleaned = " ".join(name.replace("\u00a0", " ").split()).strip(" ,.;:-")
-    low = cleaned.lower()
-    for raw, normalized in AUDITOR_NORMALIZATION.items():
-        if raw in low:
-            return normalized
-    return cleaned
+    memo = _AUDITOR_REGISTRY["memo"]
+    if name in memo:
+        return memo[name]
+    cleaned = _clean_auditor_name(name)
+    normalized = resolve_auditor_name(cleaned) or cleaned
+    if len(memo) >= _AUDITOR_MEMO_MAX:
+        memo.clear()
+    memo[name] = normalized
+    return normalized
+
+
+def resolve_auditor_names(names: Iterable[str]) -> Dict[str, str]:
+    """Batch normalize_auditor_name: each distinct raw string -> its firm name (or cleaned self)."""
+    return {name: normalize_auditor_name(name) if name else "" for name in dict.fromkeys(names)}
+
+
+def renormalize_auditors(history_rows: List[Dict[str, str]]) -> int:
+    """Re-resolve external_auditor on history rows in place against the current registry; returns rows changed."""
+    resolved = resolve_auditor_names(r.get("external_auditor", "") for r in history_rows)
+    changed = 0
+    for row in history_rows:
+        new = resolved[row.get("external_auditor", "")]
+        if new != row.get("external_auditor", ""):
+            row["external_auditor"] = new
+            changed += 1
+    return changed
+
+
+configure_auditor_registry(Path(os.getenv("TENDER_AUDITOR_REGISTRY", str(AUDITOR_REGISTRY_PATH))))
 
 
 def _is_plausible_audit_firm(name: str) -> bool:
@@ -259,63 +518,331 @@ def _is_plausible_audit_firm(name: str) -> bool:
         return False
     if len(low) > 80:
         return False
-    bad_hints = [
-        "consolidated financial statements",
-        "climate-related",
-        "note ",
-        "contents",
-        "directors",
-        "statement",
-    ]
-    if any(b in low for b in bad_hints):
+    if any(b in low for b in _AUDIT_FIRM_BAD_HINTS):
         return False
-    if any(k in low for k in AUDITOR_NORMALIZATION.keys()):
+    if low in _AUDITOR_REGISTRY["canonical"] or resolve_auditor_name(name):
         return True
-    legal_suffix = (" llp", " ltd", " limited", " plc")
-    return low.endswith(legal_suffix)
+    return low.endswith(_AUDIT_FIRM_SUFFIXES)
+
+
+# Document-level patterns, compiled with the engine chosen by configure_field_extraction.
+# Adjacent whitespace quantifiers are folded ("\s*\n?\s*" -> "\s*", "^\s*" -> "^[^\S\n]*",
+# "\s*['’]?\s*" -> "\s*(?:['’]\s*)?"): same matches, but no quadratic backtracking on long
+# blank or whitespace runs.
+_AUDITOR_PATTERN_SOURCES = (
+    r"(?is)independent auditor(?:s)?(?:'|’) report[^\n]{0,120}\n([^\n]{2,120})",
+    r"(?is)(?:signed for and on behalf of|for and on behalf of)\s*([A-Z][A-Za-z&,\.\- '\(\)]{2,120})",
+    r"(?im)^[^\S\n]*auditor(?:s)?\s*[:\-]\s*([A-Z][A-Za-z&,\.\- '\(\)]{2,120})\s*$",
+)
+_CURRENCY_PATTERN_SOURCES = (
+    (r"\bgbp\b|£|pounds sterling", "GBP"),
+    (r"\busd\b|\$", "USD"),
+    (r"\beur\b|€", "EUR"),
+)
+_UNIT_PATTERN_SOURCES = (
+    (r"(?i)(£\s*(?:['’]\s*)?000|000s|in thousands|thousand)", "thousand"),
+    (r"(?i)(£m|us\$m|€m|in millions|million)", "million"),
+    (r"(?i)(billion|bn)", "billion"),
+)
+_SENTENCE_FEE_PATTERN_SOURCES = (
+    r"(?i)fees?\s+payable\s+to\s+the\s+(?:group'?s\s+)?(?:external\s+)?auditor[^\n\r]{0,120}?audit[^\n\r]{0,120}?accounts?[^\n\r]{0,60}?([£$€]?\s*\(?\d[\d,]*(?:\.\d+)?\)?)",
+    r"(?i)audit(?:or)?(?:s)?\s+(?:fee|fees|remuneration)[^\n\r]{0,120}?([£$€]?\s*\(?\d[\d,]*(?:\.\d+)?\)?)",
+    r"(?i)statutory\s+audit[^\n\r]{0,100}?([£$€]?\s*\(?\d[\d,]*(?:\.\d+)?\)?)",
+)
+_YEAR_ENDED_PATTERN_SOURCES = (
+    r"(?i)for the year ended[^\n\r]{0,40}\b(20\d{2})\b",
+    r"(?i)year ended[^\n\r]{0,40}\b(20\d{2})\b",
+)
+_AUDITOR_PATTERNS: Tuple = ()
+_CURRENCY_PATTERNS: Tuple = ()
+_UNIT_PATTERNS: Tuple = ()
+_SENTENCE_FEE_PATTERNS: Tuple = ()
+_YEAR_ENDED_PATTERNS: Tuple = ()
+_NUMBER_TOKEN = re.compile(r"\(?\d[\d,]*(?:\.\d+)?\)?")
+_CURRENCY_PREFIX = re.compile(r"^[£$€]\s*")
+_SIGNED_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+
+
+def configure_field_extraction(engine: str = "re", budget_s: Optional[float] = None) -> str:
+    """
+    Compile the document-level field patterns with engine: "re", or "re2" for the
+    linear-time google-re2 package (any pattern it rejects, or all of them when it is not
+    installed, stay on re). RE2's \\s, \\d and \\b are ASCII-only, so exotic whitespace or
+    digits can match differently. budget_s, when given, sets the per-document time budget
+    of extract_fields / extract_fields_streaming (0 disables it). Returns the engine in use.
+    """
+    global _AUDITOR_PATTERNS, _CURRENCY_PATTERNS, _UNIT_PATTERNS, _SENTENCE_FEE_PATTERNS, _YEAR_ENDED_PATTERNS
+    if engine not in ("re", "re2"):
+        raise ValueError(f"unknown regex engine {engine!r}; choose re or re2")
+    module = re
+    if engine == "re2":
+        try:
+            import re2  # type: ignore
+
+            module = re2
+        except Exception:
+            print("[WARN] regex engine re2 requested but google-re2 is not installed; using re")
+
+    def compile_pattern(source: str):
+        if module is not re:
+            try:
+                return module.compile(source)
+            except Exception:
+                pass
+        return re.compile(source)
+
+    _AUDITOR_PATTERNS = tuple(compile_pattern(src) for src in _AUDITOR_PATTERN_SOURCES)
+    _CURRENCY_PATTERNS = tuple((compile_pattern(src), code) for src, code in _CURRENCY_PATTERN_SOURCES)
+    _UNIT_PATTERNS = tuple((compile_pattern(src), val) for src, val in _UNIT_PATTERN_SOURCES)
+    _SENTENCE_FEE_PATTERNS = tuple(compile_pattern(src) for src in _SENTENCE_FEE_PATTERN_SOURCES)
+    _YEAR_ENDED_PATTERNS = tuple(compile_pattern(src) for src in _YEAR_ENDED_PATTERN_SOURCES)
+    _FIELD_EXTRACTION["engine"] = "re" if module is re else "re2"
+    if budget_s is not None:
+        _FIELD_EXTRACTION["budget_s"] = float(budget_s)
+    return str(_FIELD_EXTRACTION["engine"])
+
+
+configure_field_extraction(os.getenv("TENDER_REGEX_ENGINE", "re"))
+
+
+def _extract_deadline(budget_s: Optional[float] = None) -> Optional[float]:
+    """perf_counter() deadline for one document, or None without a budget."""
+    budget = float(_FIELD_EXTRACTION["budget_s"]) if budget_s is None else budget_s
+    return time.perf_counter() + budget if budget > 0 else None
+
+
+def _warn_over_budget(chars: int, budget_s: Optional[float]) -> None:
+    budget = _FIELD_EXTRACTION["budget_s"] if budget_s is None else budget_s
+    print(f"[WARN] field extraction over its {budget}s budget on {chars} chars; remaining regex passes skipped")
+
+
+_YEAR_TOKEN = re.compile(r"\b(20\d{2})\b")
+_FEE_ROW_PRIMARY = (
+    "audit of the",
+    "audit of group accounts",
+    "audit of the company",
+    "audit of financial statements",
+    "audit of the annual accounts",
+    "fees payable to the company",
+    "fees payable to the group's auditor",
+    "statutory audit",
+)
+_FEE_ROW_EXCLUDE = ("other services", "other assurance", "tax", "non-audit", "subsidiaries", "pension", "total")
+# A fee table header holds "auditor" and one of these; only the rarer words are mapped to lines.
+_FEE_HEADER_KEYWORDS = ("remuneration", "fees payable")
+# Fee rows and headers are anchored on these; exclusions are only checked on anchored lines.
+_FEE_LINE_KEYWORDS = tuple(dict.fromkeys(_FEE_ROW_PRIMARY + _FEE_HEADER_KEYWORDS))
+_FEE_PRIMARY_MAX_LEN = max(len(k) for k in _FEE_ROW_PRIMARY)
+# Words each _SENTENCE_FEE_PATTERNS / _AUDITOR_PATTERNS match has to start with (or, for
+# "signed for and on behalf of" and "^\s*auditor", be found a few characters into).
+_SENTENCE_FEE_ANCHORS = ("fee", "audit", "statutory")
+_AUDITOR_CONTEXT_KEYWORDS = ("auditor", "audit report", "independent")
+# Keywords extract_fields needs every offset of (to map fee rows and headers to lines),
+# located in one keyword_hits call. Regex anchors and auditor context words are found
+# lazily with str.find instead: on keyword-dense text only the first few are ever used.
+DOCUMENT_KEYWORDS = _FEE_LINE_KEYWORDS
+# Characters re.IGNORECASE equates with an ASCII letter although str.lower() does not.
+_CASEFOLD_ODD = "\u0130\u0131\u017f\u212a"
+_FIRST_HIT_KEYWORDS = frozenset(AUDITOR_NORMALIZATION)
+
+
+def _keyword_stems(keywords: Iterable[str]) -> Dict[str, Dict[str, Tuple[str, ...]]]:
+    """
+    Group keywords for a shared scan: under the shortest other keyword they start with
+    ("fees payable to the company" under "fees payable"), else on their own.
+    Each group is split by the character following the stem ("" for the stem itself), and
+    the stem itself is kept in every split, so a stem hit is only checked against the
+    keywords that can still start there.
+    """
+    keywords = list(dict.fromkeys(keywords))
+    stems: Dict[str, List[str]] = defaultdict(list)
+    for kw in sorted(keywords, key=len):
+        prefix = next((k for k in stems if kw.startswith(k)), "")
+        stems[prefix or kw].append(kw)
+    groups: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+    for stem, kws in stems.items():
+        exact = tuple(kw for kw in kws if kw == stem)
+        by_next: Dict[str, Tuple[str, ...]] = {"": exact}
+        for kw in kws:
+            if kw != stem:
+                nxt = kw[len(stem)]
+                by_next[nxt] = by_next.get(nxt, exact) + (kw,)
+        groups[stem] = by_next
+    return groups
+
+
+# Stem groups per keyword tuple, built on first use.
+_KEYWORD_STEM_CACHE: Dict[Tuple[str, ...], Dict[str, Dict[str, Tuple[str, ...]]]] = {}
+
+
+def keyword_hits(
+    low: str,
+    keywords: Iterable[str] = DOCUMENT_KEYWORDS,
+    first_only: Iterable[str] = _FIRST_HIT_KEYWORDS,
+) -> Dict[str, List[int]]:
+    """
+    Sorted start offsets of every occurrence (overlaps included) of each keyword in the
+    lower-cased text, or just the first one for keywords in first_only; keywords that do
+    not occur are left out. A keyword that starts with another ("fees payable to the
+    company" with "fees payable") is found in the same str.find scan of the shorter one and
+    told apart with startswith, like the shared prefixes of an Aho-Corasick trie; this
+    outruns a regex alternation or a pure-Python automaton here. The extractors then
+    answer "does this line / window contain k" from the offsets instead of rescanning.
+    """
+    keywords = tuple(keywords)
+    stems = _KEYWORD_STEM_CACHE.get(keywords)
+    if stems is None:
+        stems = _KEYWORD_STEM_CACHE[keywords] = _keyword_stems(keywords)
+    first_only = frozenset(first_only)
+    find, startswith = low.find, low.startswith
+    hits: Dict[str, List[int]] = {}
+    for stem, by_next in stems.items():
+        n = len(stem)
+        exact = by_next[""]
+        group = set().union(*by_next.values())
+        pos = find(stem)
+        if len(group) == 1 and not group <= first_only:
+            positions: List[int] = []
+            while pos != -1:
+                positions.append(pos)
+                pos = find(stem, pos + 1)
+            if positions:
+                hits[stem] = positions
+            continue
+        if group.isdisjoint(first_only):
+            # Every occurrence is wanted: skip the first-only bookkeeping.
+            found: Dict[str, List[int]] = {kw: [] for kw in group}
+            while pos != -1:
+                for kw in by_next.get(low[pos + n : pos + n + 1], exact):
+                    if startswith(kw, pos):
+                        found[kw].append(pos)
+                pos = find(stem, pos + 1)
+            hits.update((kw, positions) for kw, positions in found.items() if positions)
+            continue
+        pending = len(group)
+        while pos != -1 and pending:
+            for kw in by_next.get(low[pos + n : pos + n + 1], exact):
+                if startswith(kw, pos) and not (kw in first_only and kw in hits):
+                    hits.setdefault(kw, []).append(pos)
+                    if kw in first_only:
+                        pending -= 1
+            pos = find(stem, pos + 1)
+    return hits
+
+
+def _offsets_align(text: str, low: str) -> bool:
+    """
+    True when keyword_hits offsets in low are offsets in text as well and (?i) patterns
+    can only match where a lower-case keyword was found, so they may be tried at the hits.
+    """
+    return text.isascii() or (len(text) == len(low) and not any(c in text for c in _CASEFOLD_ODD))
+
+
+# Anchored attempts _first_match makes before one search from the next start takes over.
+_ANCHOR_MATCH_LIMIT = 64
+
+
+def _first_match(pattern, text: str, starts: Optional[Iterable[int]], deadline: Optional[float] = None):
+    """
+    pattern.search(text), trying only the ascending candidate starts when given. Matches can
+    only begin at a start, so once _ANCHOR_MATCH_LIMIT starts failed, one search from the
+    next start finds the same match without a Python-level attempt per keyword hit.
+    re2 patterns always run one search: each re2 call re-encodes the whole text, so
+    per-start attempts would cost a pass over the text each.
+    Raises TimeoutError once deadline (perf_counter) has passed, checked between attempts.
+    """
+    if deadline is not None and time.perf_counter() > deadline:
+        raise TimeoutError("field extraction budget exceeded")
+    if starts is None or not isinstance(pattern, re.Pattern):
+        return pattern.search(text)
+    for tried, pos in enumerate(starts):
+        if tried == _ANCHOR_MATCH_LIMIT:
+            return pattern.search(text, pos)
+        if deadline is not None and time.perf_counter() > deadline:
+            raise TimeoutError("field extraction budget exceeded")
+        m = pattern.match(text, pos)
+        if m:
+            return m
+    return None
+
+
+def _iter_hits(low: str, kw: str) -> Iterator[int]:
+    """Ascending start offsets of kw in low (overlaps included), found as they are consumed."""
+    pos = low.find(kw)
+    while pos != -1:
+        yield pos
+        pos = low.find(kw, pos + 1)
+
+
+def _auditor_pattern_starts(compact: str, low: str) -> Tuple[Iterable[int], ...]:
+    """Candidate starts for each of _AUDITOR_PATTERNS, in pattern order; low is compact.lower()."""
+
+    def signed_starts() -> Iterator[int]:
+        # "signed for and on behalf of" starts len("signed ") before the phrase; a later
+        # phrase can start no earlier than 19 characters on, so the offsets stay ascending.
+        for h in _iter_hits(low, "for and on behalf of"):
+            if h:
+                yield max(0, h - len("signed "))
+            yield h
+
+    def line_starts() -> Iterator[int]:
+        # "^[^\S\n]*auditor": the start of the keyword's line, if only spaces precede it.
+        for a in _iter_hits(low, "auditor"):
+            q = a
+            while q > 0 and compact[q - 1] != "\n" and compact[q - 1].isspace():
+                q -= 1
+            if q == 0 or compact[q - 1] == "\n":
+                yield q
+
+    return (_iter_hits(low, "independent"), signed_starts(), line_starts())
 
 
 def extract_external_auditor(text: str) -> Tuple[str, str]:
     compact = text.replace("\u00a0", " ")
     lower = compact.lower()
-    patterns = [
-        r"(?is)independent auditor(?:s)?(?:'|’) report[^\n]{0,120}\n([^\n]{2,120})",
-        r"(?is)(?:signed for and on behalf of|for and on behalf of)\s*\n?\s*([A-Z][A-Za-z&,\.\- '\(\)]{2,120})",
-        r"(?im)^\s*auditor(?:s)?\s*[:\-]\s*([A-Z][A-Za-z&,\.\- '\(\)]{2,120})\s*$",
-    ]
-    for pat in patterns:
-        m = re.search(pat, compact)
+    return _extract_external_auditor(compact, lower, _offsets_align(compact, lower))
+
+
+def _extract_external_auditor(
+    compact: str,
+    low: str,
+    aligned: bool,
+    deadline: Optional[float] = None,
+) -> Tuple[str, str]:
+    """low is compact.lower(); aligned as returned by _offsets_align."""
+    starts = _auditor_pattern_starts(compact, low) if aligned else (None,) * len(_AUDITOR_PATTERNS)
+    for pat, pat_starts in zip(_AUDITOR_PATTERNS, starts):
+        m = _first_match(pat, compact, pat_starts, deadline)
         if m:
-            candidate = normalize_auditor_name(m.group(1))
-            if _is_plausible_audit_firm(candidate):
-                return (candidate, "high")
+            # Judge the captured text, not its normalised form: a bare "Menzies" and a
+            # resolved "Menzies LLP" both normalise to "Menzies".
+            cleaned = _clean_auditor_name(m.group(1))
+            firm = resolve_auditor_name(cleaned)
+            if firm or _is_plausible_audit_firm(cleaned):
+                return (firm or cleaned, "high")
     for raw, normalized in AUDITOR_NORMALIZATION.items():
-        idx = lower.find(raw)
+        idx = low.find(raw)
         if idx != -1:
-            near = lower[max(0, idx - 140): idx + 140]
-            if "auditor" in near or "audit report" in near or "independent" in near:
+            lo, hi = max(0, idx - 140), idx + 140
+            if any(low.find(kw, lo, hi) != -1 for kw in _AUDITOR_CONTEXT_KEYWORDS):
                 return (normalized, "medium")
     return ("", "low")
 
 
 def detect_currency_and_unit(text: str) -> Tuple[str, str]:
-    low = text.lower()
+    return _detect_currency_and_unit(text, text.lower())
+
+
+def _detect_currency_and_unit(text: str, low: str) -> Tuple[str, str]:
     currency = ""
-    if re.search(r"\bgbp\b|£|pounds sterling", low):
-        currency = "GBP"
-    elif re.search(r"\busd\b|\$", low):
-        currency = "USD"
-    elif re.search(r"\beur\b|€", low):
-        currency = "EUR"
+    for pat, code in _CURRENCY_PATTERNS:
+        if pat.search(low):
+            currency = code
+            break
 
     unit = ""
-    unit_patterns = [
-        (r"(?i)(£\s*['’]?\s*000|000s|in thousands|thousand)", "thousand"),
-        (r"(?i)(£m|us\$m|€m|in millions|million)", "million"),
-        (r"(?i)(billion|bn)", "billion"),
-    ]
-    for pat, val in unit_patterns:
-        if re.search(pat, text):
+    for pat, val in _UNIT_PATTERNS:
+        if pat.search(text):
             unit = val
             break
     return (currency, unit)
@@ -323,7 +850,7 @@ def detect_currency_and_unit(text: str) -> Tuple[str, str]:
 
 def _extract_number_tokens(s: str) -> List[str]:
     vals = []
-    for m in re.finditer(r"\(?\d[\d,]*(?:\.\d+)?\)?", s):
+    for m in _NUMBER_TOKEN.finditer(s):
         token = m.group(0).replace(",", "").replace("(", "-").replace(")", "").strip()
         if token:
             vals.append(token)
@@ -331,114 +858,772 @@ def _extract_number_tokens(s: str) -> List[str]:
 
 
 def _is_fee_row(line: str) -> bool:
-    low = line.lower()
-    primary = (
-        "audit of the",
-        "audit of group accounts",
-        "audit of the company",
-        "audit of financial statements",
-        "audit of the annual accounts",
-        "fees payable to the company",
-        "fees payable to the group's auditor",
-        "statutory audit",
-    )
-    exclude = ("other services", "other assurance", "tax", "non-audit", "subsidiaries", "pension", "total")
-    return any(p in low for p in primary) and not any(e in low for e in exclude)
+    return _is_fee_row_low(line.lower())
+
+
+def _is_fee_row_low(low: str) -> bool:
+    return any(p in low for p in _FEE_ROW_PRIMARY) and not any(e in low for e in _FEE_ROW_EXCLUDE)
 
 
 def extract_audit_fee(text: str) -> Tuple[str, str]:
-    lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
+    low = text.lower()
+    hits = keyword_hits(low.replace("\u00a0", " "), _FEE_LINE_KEYWORDS)
+    return _extract_audit_fee(text, low, hits, _offsets_align(text, low))
 
-    header_idx = [
-        i for i, ln in enumerate(lines)
-        if "auditor" in ln.lower() and ("remuneration" in ln.lower() or "fees payable" in ln.lower())
-    ]
+
+def _extract_audit_fee(
+    text: str,
+    low: str,
+    hits: Dict[str, List[int]],
+    aligned: bool,
+    deadline: Optional[float] = None,
+) -> Tuple[str, str]:
+    """
+    hits are keyword_hits over low with NBSP as space. Each fee keyword hit is mapped to its
+    line by offset, so only lines (and merged pairs) holding a primary fee keyword are
+    checked in full, and the sentence patterns are only tried where their first word is.
+    Lines are taken from low: fee numbers are the same either way.
+    """
+    raw = low.splitlines(True)
+    stripped = list(map(str.strip, raw))
+    lines = list(filter(None, stripped))
+    ends = list(accumulate(map(len, raw)))
+    # rank[r] - 1 is the index in lines of raw line r (when it is non-empty).
+    rank = list(accumulate(map(bool, stripped)))
+    exact = "\u00a0" not in low
+    # Keyword -> indexes in lines of the lines holding it.
+    kw_lines: Dict[str, Set[int]] = {}
+    for kw in _FEE_LINE_KEYWORDS:
+        positions = hits.get(kw, ())
+        if not exact:
+            positions = [pos for pos in positions if low.startswith(kw, pos)]
+        if positions:
+            kw_lines[kw] = {rank[bisect_right(ends, pos)] - 1 for pos in positions}
+
+    anchored: Set[int] = set().union(*(kw_lines.get(kw, ()) for kw in _FEE_ROW_PRIMARY))
+    fee_lines = sorted(anchored)
+
+    def pair_anchored(i: int) -> bool:
+        # A primary keyword in either line, or one that only appears across the joining space.
+        if i in anchored or i + 1 in anchored:
+            return True
+        span = _FEE_PRIMARY_MAX_LEN - 1
+        joint = f"{lines[i][-span:]} {lines[i + 1][:span]}"
+        return any(p in joint for p in _FEE_ROW_PRIMARY)
+
+    header_lines = set().union(*(kw_lines.get(kw, ()) for kw in _FEE_HEADER_KEYWORDS))
+    header_idx = sorted(i for i in header_lines if "auditor" in lines[i])
     for idx in header_idx:
-        window = lines[idx: idx + 40]
-        for ln in window:
-            if _is_fee_row(ln):
-                nums = _extract_number_tokens(ln)
+        stop = min(len(lines), idx + 40)
+        for i in range(idx, stop):
+            if i in anchored and _is_fee_row_low(lines[i]):
+                nums = _extract_number_tokens(lines[i])
                 if nums:
                     return (nums[0], "table")
-        for i in range(0, max(0, len(window) - 1)):
-            merged = f"{window[i]} {window[i + 1]}"
-            if _is_fee_row(merged):
+        for i in range(idx, stop - 1):
+            if not pair_anchored(i):
+                continue
+            merged = f"{lines[i]} {lines[i + 1]}"
+            if _is_fee_row_low(merged):
                 nums = _extract_number_tokens(merged)
                 if nums:
                     return (nums[0], "table")
 
-    for ln in lines:
-        if _is_fee_row(ln):
-            nums = _extract_number_tokens(ln)
+    for i in fee_lines:
+        if _is_fee_row_low(lines[i]):
+            nums = _extract_number_tokens(lines[i])
             if nums:
                 return (nums[0], "table")
 
-    sentence_patterns = [
-        r"(?i)fees?\s+payable\s+to\s+the\s+(?:group'?s\s+)?(?:external\s+)?auditor[^\n\r]{0,120}?audit[^\n\r]{0,120}?accounts?[^\n\r]{0,60}?([£$€]?\s*\(?\d[\d,]*(?:\.\d+)?\)?)",
-        r"(?i)audit(?:or)?(?:s)?\s+(?:fee|fees|remuneration)[^\n\r]{0,120}?([£$€]?\s*\(?\d[\d,]*(?:\.\d+)?\)?)",
-        r"(?i)statutory\s+audit[^\n\r]{0,100}?([£$€]?\s*\(?\d[\d,]*(?:\.\d+)?\)?)",
-    ]
-    for pat in sentence_patterns:
-        m = re.search(pat, text)
+    for pat, anchor in zip(_SENTENCE_FEE_PATTERNS, _SENTENCE_FEE_ANCHORS):
+        m = _first_match(pat, text, _iter_hits(low, anchor) if aligned else None, deadline)
         if m:
             token = m.group(1).replace(",", "").replace("(", "-").replace(")", "").strip()
-            token = re.sub(r"^[£$€]\s*", "", token)
-            num = re.search(r"-?\d+(?:\.\d+)?", token)
+            token = _CURRENCY_PREFIX.sub("", token)
+            num = _SIGNED_NUMBER.search(token)
             if num:
                 return (num.group(0), "text")
     return ("", "none")
 
 
 def parse_year(filing_date: str, text: str) -> str:
-    m = re.search(r"(?i)for the year ended[^\n\r]{0,40}\b(20\d{2})\b", text)
-    if m:
-        return m.group(1)
-    m = re.search(r"(?i)year ended[^\n\r]{0,40}\b(20\d{2})\b", text)
-    if m:
-        return m.group(1)
-    m = re.search(r"\b(20\d{2})\b", filing_date or "")
+    for pat in _YEAR_ENDED_PATTERNS:
+        m = pat.search(text)
+        if m:
+            return m.group(1)
+    m = _YEAR_TOKEN.search(filing_date or "")
     return m.group(1) if m else ""
 
 
-def extract_pdf_text_sampled(pdf_path: Path, front_pages: int = 25, tail_pages: int = 80, tail_stride: int = 3) -> str:
+def extract_fields(text: str, filing_date: str = "", budget_s: Optional[float] = None) -> Dict[str, str]:
     """
-    Fast path: extract all front pages + sampled tail pages.
-    This is significantly faster than parsing every page.
+    All fields in one pass over text: normalises (NBSP, lower-case, line split) once,
+    locates every DOCUMENT_KEYWORDS hit once and runs the precompiled patterns. Returns the
+    new_field_state keys; each value equals what extract_external_auditor /
+    extract_audit_fee / detect_currency_and_unit / parse_year return for the same text.
+    Once budget_s (default: configure_field_extraction) runs out, the auditor and fee
+    regex passes are skipped and those fields keep what was found so far.
     """
+    deadline = _extract_deadline(budget_s)
+    low = text.lower()
+    # NBSP as space; equal to text.replace("\u00a0", " ").lower().
+    compact_low = low.replace("\u00a0", " ")
+    hits = keyword_hits(compact_low)
+    aligned = _offsets_align(text, low)
+    over_budget = False
+    try:
+        auditor, confidence = _extract_external_auditor(text.replace("\u00a0", " "), compact_low, aligned, deadline)
+    except TimeoutError:
+        auditor, confidence, over_budget = "", "low", True
+    try:
+        audit_fee, fee_method = _extract_audit_fee(text, low, hits, aligned, deadline)
+    except TimeoutError:
+        audit_fee, fee_method, over_budget = "", "none", True
+    if over_budget:
+        _warn_over_budget(len(text), budget_s)
+    currency, fee_unit = _detect_currency_and_unit(text, low)
+    return {
+        "external_auditor": auditor,
+        "confidence": confidence,
+        "audit_fee": audit_fee,
+        "fee_method": fee_method,
+        "currency": currency,
+        "fee_unit": fee_unit,
+        "year": parse_year(filing_date, text),
+    }
+
+
+_NUMBER_CELL = re.compile(r"[£$€]?\s*\(?-?\d[\d,]*(?:\.\d+)?\)?")
+
+
+def _is_number_cell(cell: str) -> bool:
+    return bool(_NUMBER_CELL.fullmatch(cell.strip()))
+
+
+def extract_fee_from_table_rows(rows: List[List[str]]) -> Dict[str, str]:
+    """
+    Find the statutory audit fee row in an already-structured table.
+    Returns audit_fee/prior_audit_fee (+ year/prior_year when a year header row exists,
+    matched by column position; otherwise the first two figures in row order).
+    A label row without figures is also tried joined with the next row, so a fee label
+    wrapped over two lines still matches. Empty dict when no fee row matches.
+    """
+    year_cols: Dict[int, str] = {}
+    pending = ""
+    for row in rows:
+        cells = [" ".join(str(c or "").replace("\u00a0", " ").split()) for c in row]
+        if not any(cells):
+            continue
+        label = " ".join(c for c in cells if c and not _is_number_cell(c))
+        numbers = [(i, _extract_number_tokens(c)[0]) for i, c in enumerate(cells) if c and _is_number_cell(c)]
+        if pending and numbers and not _is_fee_row(label) and _is_fee_row(f"{pending} {label}"):
+            label = f"{pending} {label}".strip()
+        pending = label if label and not numbers else ""
+
+        if not _is_fee_row(label):
+            years = {i: m.group(1) for i, c in enumerate(cells) if (m := _YEAR_HEADER_CELL.fullmatch(c))}
+            if years and not year_cols:
+                year_cols = years
+            continue
+        if not numbers:
+            continue
+
+        out = {"label": label}
+        by_col = dict(numbers)
+        if year_cols and not set(year_cols) <= set(by_col) and len(numbers) >= len(year_cols):
+            # Word-coordinate rows lose empty cells; align figures to year columns from the right.
+            by_col = dict(zip(sorted(year_cols), [v for _, v in numbers][-len(year_cols):]))
+        year_order = sorted(year_cols.items(), key=lambda kv: kv[1], reverse=True)
+        if year_order and year_order[0][0] in by_col:
+            out["audit_fee"], out["year"] = by_col[year_order[0][0]], year_order[0][1]
+            if len(year_order) > 1 and year_order[1][0] in by_col:
+                out["prior_audit_fee"], out["prior_year"] = by_col[year_order[1][0]], year_order[1][1]
+        else:
+            out["audit_fee"] = numbers[0][1]
+            if len(numbers) > 1:
+                out["prior_audit_fee"] = numbers[1][1]
+        return out
+    return {}
+
+
+_AUDITOR_CONFIDENCE_RANK = {"": 0, "low": 0, "medium": 1, "high": 2}
+
+
+def new_field_state() -> Dict[str, str]:
+    """Empty per-filing field state for extract_fields_streaming."""
+    return {
+        "external_auditor": "",
+        "confidence": "low",
+        "audit_fee": "",
+        "fee_method": "none",
+        "currency": "",
+        "fee_unit": "",
+        "year": "",
+    }
+
+
+def fields_complete(state: Dict[str, str]) -> bool:
+    """True once every field is found with enough confidence to stop reading pages."""
+    return (
+        state.get("confidence") == "high"
+        and state.get("fee_method") == "table"
+        and bool(state.get("currency"))
+        and bool(state.get("fee_unit"))
+        and bool(state.get("year"))
+    )
+
+
+def extract_fields_streaming(
+    pages: Iterable[Tuple[int, str]],
+    state: Optional[Dict[str, str]] = None,
+    budget_s: Optional[float] = None,
+) -> Dict[str, str]:
+    """
+    Update field state page by page and stop pulling pages once fields_complete().
+    Each page is matched together with the previous one so tables and signature blocks
+    split across a page break still match. year is only set from document text; callers
+    fall back to the filing date with parse_year(filing_date, "").
+    budget_s covers the whole call, as in extract_fields.
+    """
+    state = state if state is not None else new_field_state()
+    if fields_complete(state):
+        return state
+    deadline = _extract_deadline(budget_s)
+    over_budget = False
+    chars = 0
+    prev = ""
+    for _, page_text in pages:
+        window = f"{prev}\n\n{page_text}" if prev else page_text
+        prev = page_text
+        chars += len(page_text)
+        low = window.lower()
+        compact_low = low.replace("\u00a0", " ")
+        hits = keyword_hits(compact_low)
+        aligned = _offsets_align(window, low)
+
+        if state["confidence"] != "high":
+            try:
+                auditor, confidence = _extract_external_auditor(
+                    window.replace("\u00a0", " "), compact_low, aligned, deadline
+                )
+            except TimeoutError:
+                auditor, confidence, over_budget = "", "low", True
+            if auditor and (
+                not state["external_auditor"]
+                or _AUDITOR_CONFIDENCE_RANK[confidence] > _AUDITOR_CONFIDENCE_RANK[state["confidence"]]
+            ):
+                state["external_auditor"] = auditor
+                state["confidence"] = confidence
+
+        fee_found = False
+        if state["fee_method"] != "table":
+            try:
+                fee, method = _extract_audit_fee(window, low, hits, aligned, deadline)
+            except TimeoutError:
+                fee, method, over_budget = "", "none", True
+            if fee and (not state["audit_fee"] or method == "table"):
+                state["audit_fee"] = fee
+                state["fee_method"] = method
+                fee_found = True
+
+        currency, unit = _detect_currency_and_unit(window, low)
+        # Currency/unit next to the fee beat earlier document-level hints.
+        if currency and (fee_found or not state["currency"]):
+            state["currency"] = currency
+        if unit and (fee_found or not state["fee_unit"]):
+            state["fee_unit"] = unit
+
+        if not state["year"]:
+            state["year"] = parse_year("", window)
+
+        if fields_complete(state):
+            break
+    if over_budget:
+        _warn_over_budget(chars, budget_s)
+    return state
+
+
+def _pdf_pool_key(pdf_path: Path) -> Tuple[str, Tuple[int, int]]:
+    p = Path(pdf_path).resolve()
+    st = p.stat()
+    return (str(p), (st.st_mtime_ns, st.st_size))
+
+
+def _close_pdf_entry(entry: List[object]) -> None:
+    """Close a pool entry that has left _PDF_POOL, or park it until its last user releases it."""
+    if entry[2]:
+        _PDF_POOL_RETIRED.append(entry)
+    else:
+        entry[1].close()
+
+
+def _acquire_pdf_document(pdf_path: Path) -> Tuple[object, bool]:
+    """Take a reference on the pooled handle for pdf_path; returns (doc or None, opened_here)."""
     try:
         import fitz  # type: ignore
     except Exception:
-        return ""
+        return None, False
+    try:
+        path_key, version = _pdf_pool_key(pdf_path)
+    except OSError:
+        return None, False
+    with _PDF_POOL_LOCK:
+        entry = _PDF_POOL.get(path_key)
+        if entry is not None and entry[0] == version:
+            entry[2] += 1
+            _PDF_POOL.move_to_end(path_key)
+            return entry[1], False
+        if entry is not None:
+            _close_pdf_entry(_PDF_POOL.pop(path_key))
+        try:
+            doc = fitz.open(path_key)
+        except Exception:
+            return None, False
+        _PDF_POOL[path_key] = [version, doc, 1, False]
+        idle = [k for k, e in _PDF_POOL.items() if not e[2]]
+        for k in idle[: max(0, len(_PDF_POOL) - max(1, PDF_POOL_MAX_OPEN))]:
+            _PDF_POOL.pop(k)[1].close()
+        return doc, True
+
 
+def get_pdf_document(pdf_path: Path):
+    """
+    Return a pooled PyMuPDF handle for pdf_path, or None if it cannot be opened.
+    The caller holds a reference until release_pdf_document. Handles are reopened when the
+    file changes on disk; beyond PDF_POOL_MAX_OPEN, the least recently used handles nobody
+    holds are closed. A handle still referenced is never closed.
+    """
+    return _acquire_pdf_document(pdf_path)[0]
+
+
+def release_pdf_document(pdf_path: Path, doc, close_when_idle: bool = False) -> None:
+    """Drop a reference taken by get_pdf_document; close_when_idle closes the handle once nobody holds it."""
+    if doc is None:
+        return
+    with _PDF_POOL_LOCK:
+        key = str(Path(pdf_path).resolve())
+        entry = _PDF_POOL.get(key)
+        if entry is not None and entry[1] is doc:
+            entry[2] -= 1
+            entry[3] = entry[3] or close_when_idle
+            if not entry[2] and entry[3]:
+                _PDF_POOL.pop(key)[1].close()
+            return
+        for i, entry in enumerate(_PDF_POOL_RETIRED):
+            if entry[1] is doc:
+                entry[2] -= 1
+                if not entry[2]:
+                    _PDF_POOL_RETIRED.pop(i)[1].close()
+                return
+
+
+def close_pdf_document(pdf_path: Path) -> None:
+    """Drop the pooled handle for pdf_path (no-op if not open); it closes once its last user releases it."""
+    with _PDF_POOL_LOCK:
+        entry = _PDF_POOL.pop(str(Path(pdf_path).resolve()), None)
+        if entry is not None:
+            _close_pdf_entry(entry)
+
+
+def close_all_pdf_documents() -> None:
+    with _PDF_POOL_LOCK:
+        entries = list(_PDF_POOL.values())
+        _PDF_POOL.clear()
+        for entry in entries:
+            _close_pdf_entry(entry)
+
+
+@contextmanager
+def pdf_document(pdf_path: Path) -> Iterator[object]:
+    """
+    Context-managed pooled open: yields the shared handle (or None if unreadable).
+    The scope that first opened the file closes it once every scope using it has exited, so
+    nesting a stage inside a per-filing `with pdf_document(...)` block reuses one handle for
+    every stage. The scope does not hold _PDF_POOL_LOCK: callers take it around each
+    PyMuPDF call on the handle.
+    """
+    doc, owner = _acquire_pdf_document(pdf_path)
     try:
-        doc = fitz.open(str(pdf_path))
-    except Exception:
-        return ""
+        yield doc
+    finally:
+        release_pdf_document(pdf_path, doc, close_when_idle=owner)
 
-    page_count = doc.page_count
-    pages: List[int] = list(range(0, min(front_pages, page_count)))
-    tail_start = max(0, page_count - tail_pages)
-    for p in range(tail_start, page_count, max(1, tail_stride)):
-        if p not in pages:
-            pages.append(p)
 
-    chunks: List[str] = []
-    for p in pages:
+def pdf_metadata(pdf_path: Path) -> Dict[str, object]:
+    """Cached page count + PyMuPDF metadata (producer, creator, ...); {} if unreadable."""
+    try:
+        cache_key = _pdf_pool_key(pdf_path)
+    except OSError:
+        return {}
+    cached = _PDF_INFO_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+    with pdf_document(pdf_path) as doc:
+        if doc is None:
+            return {}
+        with _PDF_POOL_LOCK:
+            info: Dict[str, object] = {"page_count": int(doc.page_count or 0)}
+            info.update({k: v for k, v in (doc.metadata or {}).items() if v})
+    _PDF_INFO_CACHE[cache_key] = info
+    return info
+
+
+def pdf_page_count(pdf_path: Path) -> int:
+    return int(pdf_info(pdf_path).get("page_count", 0) or 0)
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with Path(path).open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _text_layer_coverage(doc, max_probe_pages: int = 40, min_chars: int = 50) -> float:
+    """Share of (evenly probed) pages with a usable text layer: ~1.0 born-digital, 0.0 scanned."""
+    with _PDF_POOL_LOCK:
+        page_count = doc.page_count
+    if page_count <= 0:
+        return 0.0
+    step = max(1, page_count // max_probe_pages)
+    probes = list(range(0, page_count, step))[:max_probe_pages]
+    with_text = 0
+    for p in probes:
         try:
-            txt = (doc[p].get_text("text") or "").strip()
-            if txt:
-                chunks.append(txt)
+            with _PDF_POOL_LOCK:
+                txt = doc[p].get_text("text") or ""
         except Exception:
             continue
-    return "\n\n".join(chunks)
+        if len(txt.strip()) >= min_chars:
+            with_text += 1
+    return round(with_text / len(probes), 3)
+
+
+def open_pdf_index(index_path: Path):
+    """Open (creating if needed) the SQLite PDF metadata index."""
+    import sqlite3
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(index_path), check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pdf_index (
+            path TEXT PRIMARY KEY,
+            size INTEGER NOT NULL,
+            mtime_ns INTEGER NOT NULL,
+            sha256 TEXT NOT NULL,
+            page_count INTEGER NOT NULL,
+            text_coverage REAL NOT NULL,
+            producer TEXT NOT NULL,
+            indexed_at REAL NOT NULL
+        )
+        """
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS pdf_index_sha256 ON pdf_index (sha256)")
+    conn.commit()
+    return conn
 
 
-def _ocr_page_text(doc, page_index: int, zoom: float = 2.2) -> str:
+def configure_pdf_index(index_path: Optional[Path], exclude_dirs: Iterable[Path] = ()):
+    """
+    Make pdf_info/pdf_page_count answer from the SQLite index (None disables); returns the connection.
+    Files under exclude_dirs (MinerU output with its subset PDFs and batch staging copies)
+    are never indexed; pdf_info reads those from the document instead.
+    """
+    with _PDF_POOL_LOCK:
+        if _PDF_INDEX.get("conn") is not None:
+            _PDF_INDEX["conn"].close()
+        _PDF_INDEX["conn"] = open_pdf_index(Path(index_path)) if index_path else None
+        _PDF_INDEX["exclude"] = tuple(Path(d).resolve() for d in exclude_dirs)
+        return _PDF_INDEX["conn"]
+
+
+def pdf_index_excludes(pdf_path: Path) -> bool:
+    """True for files under a directory configure_pdf_index keeps out of the index."""
+    path = Path(pdf_path).resolve()
+    return any(path.is_relative_to(root) for root in _PDF_INDEX.get("exclude") or ())
+
+
+def index_pdf(conn, pdf_path: Path, force: bool = False) -> Dict[str, object]:
+    """
+    Return the index row for pdf_path, (re)computing it only when size/mtime changed.
+    Row keys: path, size, mtime_ns, sha256, page_count, text_coverage, producer, indexed_at.
+    Returns {} for missing or unreadable files.
+    """
+    path = Path(pdf_path).resolve()
     try:
-        from PIL import Image  # type: ignore
-        import pytesseract  # type: ignore
-    except Exception:
+        st = path.stat()
+    except OSError:
+        return {}
+    with _PDF_POOL_LOCK:
+        row = conn.execute("SELECT * FROM pdf_index WHERE path = ?", (str(path),)).fetchone()
+    if row is not None and not force and row["size"] == st.st_size and row["mtime_ns"] == st.st_mtime_ns:
+        return dict(row)
+
+    with pdf_document(path) as doc:
+        if doc is None:
+            return {}
+        with _PDF_POOL_LOCK:
+            page_count = int(doc.page_count or 0)
+            producer = str((doc.metadata or {}).get("producer") or "")
+        info = {
+            "path": str(path),
+            "size": st.st_size,
+            "mtime_ns": st.st_mtime_ns,
+            "sha256": file_sha256(path),
+            "page_count": page_count,
+            "text_coverage": _text_layer_coverage(doc),
+            "producer": producer,
+            "indexed_at": time.time(),
+        }
+    with _PDF_POOL_LOCK:
+        conn.execute(
+            "INSERT OR REPLACE INTO pdf_index VALUES "
+            "(:path, :size, :mtime_ns, :sha256, :page_count, :text_coverage, :producer, :indexed_at)",
+            info,
+        )
+        conn.commit()
+    return info
+
+
+def refresh_pdf_index(conn, pdf_dirs: Iterable[Path]) -> int:
+    """Incrementally index every *.pdf under pdf_dirs and drop rows for deleted files; returns rows (re)indexed."""
+    updated = 0
+    for d in pdf_dirs:
+        if not Path(d).exists():
+            continue
+        for fp in sorted(Path(d).glob("*.pdf")):
+            before = conn.execute("SELECT mtime_ns, size FROM pdf_index WHERE path = ?", (str(fp.resolve()),)).fetchone()
+            info = index_pdf(conn, fp)
+            if info and (before is None or (before["mtime_ns"], before["size"]) != (info["mtime_ns"], info["size"])):
+                updated += 1
+    with _PDF_POOL_LOCK:
+        stale = [r["path"] for r in conn.execute("SELECT path FROM pdf_index") if not Path(r["path"]).exists()]
+        conn.executemany("DELETE FROM pdf_index WHERE path = ?", [(p,) for p in stale])
+        conn.commit()
+    return updated
+
+
+def pdf_info(pdf_path: Path) -> Dict[str, object]:
+    """
+    PDF facts for pipeline stages: from the SQLite index when configured (see
+    configure_pdf_index), else page_count/producer from the pooled document.
+    """
+    conn = _PDF_INDEX.get("conn")
+    if conn is not None and not pdf_index_excludes(pdf_path):
+        return index_pdf(conn, pdf_path)
+    meta = pdf_metadata(pdf_path)
+    return {"page_count": meta.get("page_count", 0), "producer": meta.get("producer", "")} if meta else {}
+
+
+def pdf_text_coverage(pdf_path: Path) -> float:
+    """Text-layer coverage (0.0 scanned .. 1.0 born-digital), from the index when configured."""
+    info = pdf_info(pdf_path)
+    if "text_coverage" in info:
+        return float(info["text_coverage"])
+    with pdf_document(pdf_path) as doc:
+        return _text_layer_coverage(doc) if doc is not None else 0.0
+
+
+def pdf_sha256(pdf_path: Path) -> str:
+    """
+    SHA-256 of a PDF's bytes: from the PDF index when configured, else hashed once per
+    (path, mtime, size) so repeated lookups in a run do not re-read the file; "" if unreadable.
+    """
+    try:
+        sha = str(pdf_info(pdf_path).get("sha256") or "")
+        if sha:
+            return sha
+        cache_key = _pdf_pool_key(pdf_path)
+        if cache_key not in _PDF_SHA_CACHE:
+            _PDF_SHA_CACHE[cache_key] = file_sha256(pdf_path)
+        return _PDF_SHA_CACHE[cache_key]
+    except OSError:
         return ""
+
+
+def repaired_pdf_path(pdf_path: Path) -> Path:
+    """Content-addressed slot for a repaired copy: <pdf dir>/.repaired/<sha256>/<original name>."""
+    sha = pdf_sha256(pdf_path)
+    if not sha:
+        raise OSError(f"cannot read {pdf_path}")
+    return Path(pdf_path).parent / ".repaired" / sha / Path(pdf_path).name
+
+
+def preferred_pdf_path(pdf_path: Path) -> Path:
+    """The cached repaired copy when one exists (see repair_pdf), else pdf_path itself."""
+    try:
+        repaired = repaired_pdf_path(pdf_path)
+    except OSError:
+        return pdf_path
+    return repaired if repaired.exists() else pdf_path
+
+
+def repair_pdf(pdf_path: Path) -> Optional[Path]:
+    """
+    Rewrite a structurally damaged PDF in process (PyMuPDF xref rebuild, garbage collection,
+    content-stream clean) once into repaired_pdf_path and return it; later stages and reruns
+    reuse the cached copy through preferred_pdf_path. None when the file cannot be repaired.
+    """
+    try:
+        import fitz  # type: ignore
+    except Exception:
+        return None
+    try:
+        target = repaired_pdf_path(pdf_path)
+    except OSError:
+        return None
+    if target.exists():
+        return target
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + ".tmp")
+    try:
+        # Fresh handle: the pooled one may already be in a partially broken state.
+        with _PDF_POOL_LOCK, closing(fitz.open(str(pdf_path))) as doc:
+            if doc.page_count <= 0:
+                return None
+            doc.save(str(tmp), garbage=4, clean=True, deflate=True)
+        tmp.replace(target)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        return None
+    return target
+
+
+def iter_pdf_pages_sampled(
+    pdf_path: Path,
+    front_pages: int = 25,
+    tail_pages: int = 80,
+    tail_stride: int = 3,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (page_index, text) for all front pages + sampled tail pages, in that order.
+    Pages are read lazily, so a consumer that stops early never touches the rest.
+    """
+    with pdf_document(pdf_path) as doc:
+        if doc is None:
+            return
+
+        with _PDF_POOL_LOCK:
+            page_count = doc.page_count
+        pages: List[int] = list(range(0, min(front_pages, page_count)))
+        tail_start = max(0, page_count - tail_pages)
+        for p in range(tail_start, page_count, max(1, tail_stride)):
+            if p not in pages:
+                pages.append(p)
+
+        for p in pages:
+            try:
+                with _PDF_POOL_LOCK:
+                    txt = (doc[p].get_text("text") or "").strip()
+            except Exception:
+                continue
+            if txt:
+                yield (p, txt)
+
+
+def extract_pdf_text_sampled(pdf_path: Path, front_pages: int = 25, tail_pages: int = 80, tail_stride: int = 3) -> str:
+    """
+    Fast path: extract all front pages + sampled tail pages.
+    This is significantly faster than parsing every page.
+    """
+    pages = iter_pdf_pages_sampled(pdf_path, front_pages=front_pages, tail_pages=tail_pages, tail_stride=tail_stride)
+    return "\n\n".join(txt for _, txt in pages)
+
+
+def _is_auditor_page_text(text: str) -> bool:
+    """True when a page looks like the auditor's report or the auditor remuneration note."""
+    low = text.lower()
+    return (
+        "independent auditor" in low
+        or ("auditor" in low and "report" in low)
+        or ("auditor" in low and ("remuneration" in low or "fees payable" in low))
+        or "audit fee" in low
+    )
+
+
+def find_candidate_pages(
+    pdf_path: Path,
+    front_pages: int = 3,
+    neighbours: int = 2,
+    ocr_zoom: float = OCR_SPARSE_ZOOM,
+) -> List[int]:
+    """
+    Cheap pre-stage for heavy parsers: sorted page indexes likely to hold the auditor's
+    report or remuneration note, plus neighbours and the first front_pages.
+    Pages the page index already holds for the filing (named <company_number>_<date>.pdf)
+    are used when any of them match; otherwise pages with a text layer are matched directly
+    and textless pages are OCRed at ocr_zoom, on the OCR stage's sparse pages only
+    (_ocr_sparse_pages). With the default zoom these are the exact renders the OCR stage
+    makes, so one of the two is served from the OCR cache.
+    Returns [] when nothing matched (caller keeps the full PDF).
+    """
+    key = parse_filing_stem(Path(pdf_path).stem)
+    hits = indexed_candidate_pages(*key) if key else []
+    if hits:
+        page_count = pdf_page_count(pdf_path)
+        hits = [h for h in hits if h < page_count]
+    else:
+        with pdf_document(pdf_path) as doc:
+            if doc is None:
+                return []
+            with _PDF_POOL_LOCK:
+                page_count = doc.page_count
+            sparse = set(_ocr_sparse_pages(page_count))
+            for p in range(page_count):
+                try:
+                    with _PDF_POOL_LOCK:
+                        txt = doc[p].get_text("text") or ""
+                except Exception:
+                    txt = ""
+                if len(txt.strip()) < 50:
+                    if p not in sparse:
+                        continue
+                    txt = _ocr_page_text(doc, p, zoom=ocr_zoom)
+                if _is_auditor_page_text(txt):
+                    hits.append(p)
+
+    if not hits:
+        return []
+    pages = set(range(min(front_pages, page_count)))
+    for h in hits:
+        pages.update(range(max(0, h - neighbours), min(page_count, h + neighbours + 1)))
+    return sorted(pages)
+
+
+def write_pdf_subset(pdf_path: Path, pages: List[int], output_path: Path) -> bool:
+    """Write the given 0-based pages of pdf_path (in order) to output_path as a new PDF."""
+    try:
+        import fitz  # type: ignore
+    except Exception:
+        return False
+
+    with pdf_document(pdf_path) as doc:
+        if doc is None or not pages:
+            return False
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            with _PDF_POOL_LOCK, closing(fitz.open()) as subset:
+                # Copy contiguous runs in one call so shared resources are written once.
+                start = prev = pages[0]
+                for p in list(pages[1:]) + [None]:
+                    if p is not None and p == prev + 1:
+                        prev = p
+                        continue
+                    subset.insert_pdf(doc, from_page=start, to_page=prev)
+                    if p is not None:
+                        start = prev = p
+                subset.save(str(output_path), garbage=3, deflate=True)
+        except Exception:
+            output_path.unlink(missing_ok=True)
+            return False
+    return True
+
+
+def _configure_tesseract(pytesseract) -> None:
     # Make OCR robust across conda/VS Code environments.
     tesseract_candidates = [
         os.getenv("TESSERACT_CMD", ""),
@@ -450,50 +1635,314 @@ def _ocr_page_text(doc, page_index: int, zoom: float = 2.2) -> str:
         if candidate and Path(candidate).exists():
             pytesseract.pytesseract.tesseract_cmd = candidate
             break
+
+
+def configure_ocr_cache(cache_dir: Optional[Path], max_mb: float = 512.0) -> None:
+    """Point the OCR result cache at cache_dir (None/empty disables it) with an LRU size cap."""
+    with _OCR_CACHE_LOCK:
+        _OCR_CACHE["dir"] = Path(cache_dir) if cache_dir else None
+        _OCR_CACHE["max_bytes"] = int(max_mb * 1024 * 1024)
+        _OCR_CACHE["size"] = None
+
+
+def _ocr_cache_key(pytesseract, pix, zoom: float, lang: str, kind: str) -> str:
+    if _OCR_CACHE.get("engine") is None:
+        try:
+            _OCR_CACHE["engine"] = str(pytesseract.get_tesseract_version())
+        except Exception:
+            _OCR_CACHE["engine"] = "unknown"
+    h = hashlib.sha256()
+    h.update(f"{kind}|{lang}|{zoom:.3f}|{_OCR_CACHE['engine']}|{pix.width}x{pix.height}|".encode("utf-8"))
+    h.update(pix.samples)
+    return h.hexdigest()
+
+
+def _ocr_cache_evict(cache_dir: Path, max_bytes: int) -> None:
+    """
+    Drop least recently used entries (oldest mtime) until the cache is under 90% of max_bytes.
+    Callers hold _OCR_CACHE_LOCK.
+    """
+    entries = []
+    for fp in cache_dir.glob("*/*.json"):
+        try:
+            st = fp.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, fp))
+    total = sum(size for _, size, _ in entries)
+    for _, size, fp in sorted(entries):
+        if total <= max_bytes * 0.9:
+            break
+        fp.unlink(missing_ok=True)
+        total -= size
+    _OCR_CACHE["size"] = total
+
+
+def _tesseract_cached(pytesseract, pix, zoom: float, kind: str, lang: str = "eng"):
+    """
+    Run Tesseract on a rendered pixmap, reusing a cached result for identical pixels/settings.
+    kind is "string" (image_to_string, returns str) or "data" (image_to_data dict).
+    """
+    from PIL import Image  # type: ignore
+
+    cache_dir = _OCR_CACHE.get("dir")
+    fp = None
+    if cache_dir is not None:
+        key = _ocr_cache_key(pytesseract, pix, zoom, lang, kind)
+        fp = cache_dir / key[:2] / f"{key}.json"
+        try:
+            result = json.loads(fp.read_text(encoding="utf-8"))
+            os.utime(fp)  # LRU: a hit counts as a recent use.
+            return result
+        except (OSError, ValueError):
+            pass
+
+    img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
+    if kind == "data":
+        result = pytesseract.image_to_data(img, lang=lang, output_type=pytesseract.Output.DICT)
+    else:
+        result = pytesseract.image_to_string(img, lang=lang) or ""
+
+    if fp is not None:
+        # Per-thread temp name: two threads may OCR identical pixels at the same time.
+        tmp = fp.with_name(f"{fp.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            fp.parent.mkdir(parents=True, exist_ok=True)
+            tmp.write_text(json.dumps(result), encoding="utf-8")
+            with _OCR_CACHE_LOCK:
+                try:
+                    replaced = fp.stat().st_size
+                except OSError:
+                    replaced = 0
+                os.replace(tmp, fp)
+                if _OCR_CACHE["size"] is None:
+                    _ocr_cache_evict(cache_dir, _OCR_CACHE["max_bytes"])
+                else:
+                    _OCR_CACHE["size"] += fp.stat().st_size - replaced
+                    if _OCR_CACHE["size"] > _OCR_CACHE["max_bytes"]:
+                        _ocr_cache_evict(cache_dir, _OCR_CACHE["max_bytes"])
+        except OSError:
+            tmp.unlink(missing_ok=True)
+    return result
+
+
+def _render_page(doc, page_index: int, zoom: float, clip=None) -> SimpleNamespace:
+    """
+    RGB render of a page (or clip rect) at zoom as plain width/height/samples, so Tesseract
+    and the OCR cache run outside _PDF_POOL_LOCK on pixels MuPDF no longer owns.
+    """
+    import fitz  # type: ignore
+
+    with _PDF_POOL_LOCK:
+        pix = doc[page_index].get_pixmap(matrix=fitz.Matrix(zoom, zoom), clip=clip, alpha=False)
+        rendered = SimpleNamespace(width=pix.width, height=pix.height, samples=bytes(pix.samples))
+        del pix
+    return rendered
+
+
+def _ocr_page_text(doc, page_index: int, zoom: float = 2.2) -> str:
+    try:
+        import pytesseract  # type: ignore
+    except Exception:
+        return ""
+    _configure_tesseract(pytesseract)
     try:
-        page = doc[page_index]
-        pix = page.get_pixmap(matrix=__import__("fitz").Matrix(zoom, zoom), alpha=False)
-        img = Image.frombytes("RGB", [pix.width, pix.height], pix.samples)
-        return (pytesseract.image_to_string(img, lang="eng") or "").strip()
+        pix = _render_page(doc, page_index, zoom)
+        return (_tesseract_cached(pytesseract, pix, zoom, "string") or "").strip()
     except Exception:
         return ""
 
 
-def ocr_targeted_text(pdf_path: Path, max_pages: int = 80) -> str:
+def _ocr_page_words(doc, page_index: int, zoom: float) -> Tuple[str, List[Tuple[str, float]], List[Tuple[str, object]]]:
     """
-    OCR fallback for scanned PDFs:
-    1) sparse scan to detect likely auditor/remuneration pages
-    2) dense scan around hits (+ front pages for auditor signature)
+    OCR one page via Tesseract TSV output.
+    Returns (page text, [(word, confidence 0-100)], [(line text, line rect in page.rect points)]);
+    text keeps Tesseract's line breaks and line rects feed region-targeted OCR.
     """
     try:
         import fitz  # type: ignore
+        import pytesseract  # type: ignore
     except Exception:
-        return ""
+        return ("", [], [])
+    _configure_tesseract(pytesseract)
     try:
-        doc = fitz.open(str(pdf_path))
+        pix = _render_page(doc, page_index, zoom)
+        data = _tesseract_cached(pytesseract, pix, zoom, "data")
     except Exception:
-        return ""
+        return ("", [], [])
+
+    lines: Dict[Tuple[int, int, int], List[str]] = defaultdict(list)
+    boxes: Dict[Tuple[int, int, int], List[float]] = {}
+    words: List[Tuple[str, float]] = []
+    for i, raw in enumerate(data.get("text", [])):
+        word = str(raw or "").strip()
+        if not word:
+            continue
+        try:
+            conf = float(data["conf"][i])
+        except (KeyError, TypeError, ValueError):
+            conf = -1.0
+        words.append((word, conf))
+        key = (data["block_num"][i], data["par_num"][i], data["line_num"][i])
+        lines[key].append(word)
+        x0, y0 = float(data["left"][i]), float(data["top"][i])
+        x1, y1 = x0 + float(data["width"][i]), y0 + float(data["height"][i])
+        box = boxes.setdefault(key, [x0, y0, x1, y1])
+        box[:] = [min(box[0], x0), min(box[1], y0), max(box[2], x1), max(box[3], y1)]
+    text = "\n".join(" ".join(ws) for _, ws in sorted(lines.items()))
+    # Pixmap pixels / zoom are page.rect (rotated) points, the space get_pixmap(clip=...) and
+    # _ocr_candidate_regions work in, so no derotation here.
+    line_boxes = [(" ".join(lines[k]), fitz.Rect(*[v / zoom for v in boxes[k]])) for k in sorted(lines)]
+    return (text.strip(), words, line_boxes)
+
+
+def _ocr_candidate_regions(page_rect, line_boxes: List[Tuple[str, object]]) -> List[object]:
+    """
+    Turn low-zoom OCR lines into clip rects around auditor signature blocks and fee tables.
+    Signature blocks stay narrow; fee tables span the page width so figure columns survive.
+    page_rect and line rects are page.rect points (rotation applied), as the clips are.
+    """
+    regions = []
+    for line, rect in line_boxes:
+        low = line.lower()
+        line_h = max(6.0, rect.height)
+        if any(h in low for h in OCR_FEE_REGION_HINTS):
+            clip = type(rect)(page_rect.x0, rect.y0 - 2 * line_h, page_rect.x1, rect.y1 + 16 * line_h)
+        elif any(h in low for h in OCR_SIGNATURE_REGION_HINTS):
+            width = max(rect.width, page_rect.width * 0.45)
+            clip = type(rect)(rect.x0 - 12, rect.y0 - 3 * line_h, rect.x0 + width + 12, rect.y1 + 6 * line_h)
+        else:
+            continue
+        clip &= page_rect
+        if clip.is_empty:
+            continue
+        for i, existing in enumerate(regions):
+            if existing.intersects(clip):
+                regions[i] = existing | clip
+                break
+        else:
+            regions.append(clip)
+    return regions
+
+
+def _ocr_page_regions(doc, page_index: int, regions: List[object], zoom: float) -> Tuple[str, int]:
+    """OCR only the given clip rects of a page; returns (text, pixels fed to Tesseract)."""
+    try:
+        import pytesseract  # type: ignore
+    except Exception:
+        return ("", 0)
+    _configure_tesseract(pytesseract)
+    chunks: List[str] = []
+    pixels = 0
+    try:
+        for clip in sorted(regions, key=lambda r: (r.y0, r.x0)):
+            pix = _render_page(doc, page_index, zoom, clip=clip)
+            pixels += pix.width * pix.height
+            t = (_tesseract_cached(pytesseract, pix, zoom, "string") or "").strip()
+            if t:
+                chunks.append(t)
+    except Exception:
+        return ("\n".join(chunks), pixels)
+    return ("\n".join(chunks), pixels)
 
-    page_count = doc.page_count
-    if page_count <= 0:
-        return ""
 
+def _needs_zoom_escalation(words: List[Tuple[str, float]], min_confidence: float) -> bool:
+    """
+    Decide whether a low-zoom OCR pass is good enough.
+    Key tokens (auditor, fee, currency words) must all clear the threshold; pages without
+    key tokens fall back to the mean word confidence.
+    """
+    confs = [c for _, c in words if c >= 0]
+    if not confs:
+        return True
+    key_confs = [c for w, c in words if c >= 0 and any(k in w.lower() for k in OCR_KEY_TOKENS)]
+    if key_confs:
+        return min(key_confs) < min_confidence
+    return sum(confs) / len(confs) < min_confidence
+
+
+def _ocr_sparse_pages(page_count: int) -> List[int]:
+    """Pages the OCR stage scans first for auditor hits: every 3rd of the first 20, then every 5th (8th past 120 pages)."""
     sparse = set(range(0, min(20, page_count), 3))
     step = 8 if page_count > 120 else 5
     sparse.update(range(0, page_count, step))
+    return sorted(sparse)
+
+
+def iter_ocr_targeted_pages(
+    pdf_path: Path,
+    max_pages: int = 80,
+    adaptive: bool = False,
+    low_zoom: float = OCR_SPARSE_ZOOM,
+    high_zoom: float = 2.3,
+    min_confidence: float = 70.0,
+    region_crop: bool = False,
+    stats: Optional[Dict[str, float]] = None,
+) -> Iterator[Tuple[int, str]]:
+    """
+    Yield (page_index, OCR text) in priority order for scanned PDFs:
+    1) sparse scan to detect likely auditor/remuneration pages
+    2) dense scan around hits (+ front pages for auditor signature)
+
+    adaptive=True OCRs every page at low_zoom first and re-renders at high_zoom only when
+    key-token confidence is below min_confidence. Pass a dict as stats to receive
+    pages/escalated/seconds and the estimated seconds saved versus a fixed high-zoom pass.
+
+    region_crop=True uses the low-zoom layout pass to locate auditor signature and fee-note
+    blocks and renders only those clip rects at high_zoom (whole page if none are found);
+    stats then also reports pixels fed to high-zoom OCR versus full-page rendering.
+    Stats are filled when the generator finishes or is closed early by its consumer.
+    """
+    with pdf_document(pdf_path) as doc:
+        if doc is None:
+            return
+        yield from _iter_ocr_targeted_doc(
+            doc,
+            max_pages=max_pages,
+            adaptive=adaptive,
+            low_zoom=low_zoom,
+            high_zoom=high_zoom,
+            min_confidence=min_confidence,
+            region_crop=region_crop,
+            stats=stats,
+        )
+
+
+def _iter_ocr_targeted_doc(
+    doc,
+    max_pages: int,
+    adaptive: bool,
+    low_zoom: float,
+    high_zoom: float,
+    min_confidence: float,
+    region_crop: bool,
+    stats: Optional[Dict[str, float]],
+) -> Iterator[Tuple[int, str]]:
+    with _PDF_POOL_LOCK:
+        page_count = doc.page_count
+    if page_count <= 0:
+        return
+
+    sparse = _ocr_sparse_pages(page_count)
+
+    # Adaptive/region modes keep low-zoom results so the dense pass can reuse sparse pages.
+    low_pass_mode = adaptive or region_crop
+    low_results: Dict[int, Tuple[str, List[Tuple[str, float]], List[Tuple[str, object]]]] = {}
+    low_seconds: Dict[int, float] = {}
+
+    def low_pass(p: int) -> str:
+        if p not in low_results:
+            t0 = time.perf_counter()
+            low_results[p] = _ocr_page_words(doc, p, zoom=low_zoom)
+            low_seconds[p] = time.perf_counter() - t0
+        return low_results[p][0]
 
     hits = set()
-    for p in sorted(sparse):
-        t = _ocr_page_text(doc, p, zoom=1.6)
+    for p in sparse:
+        t = low_pass(p) if low_pass_mode else _ocr_page_text(doc, p, zoom=low_zoom)
         if not t:
             continue
-        low = t.lower()
-        if (
-            "independent auditor" in low
-            or ("auditor" in low and "report" in low)
-            or ("auditor" in low and ("remuneration" in low or "fees payable" in low))
-            or "audit fee" in low
-        ):
+        if _is_auditor_page_text(t):
             hits.add(p)
 
     ordered: List[int] = []
@@ -514,12 +1963,489 @@ def ocr_targeted_text(pdf_path: Path, max_pages: int = 80) -> str:
             push(q)
 
     pages = ordered[:max_pages]
-    chunks: List[str] = []
-    for p in pages:
-        t = _ocr_page_text(doc, p, zoom=2.3)
-        if t:
-            chunks.append(t)
-    return "\n\n".join(chunks)
+    if not low_pass_mode:
+        for p in pages:
+            t = _ocr_page_text(doc, p, zoom=high_zoom)
+            if t:
+                yield (p, t)
+        return
+
+    dense_start = time.perf_counter()
+    high_seconds: List[float] = []
+    reused_low = 0.0
+    high_pixels = 0
+    full_pixels = 0
+    done: List[int] = []
+    try:
+        for p in pages:
+            if p in low_results:
+                reused_low += low_seconds.get(p, 0.0)
+            t = low_pass(p)
+            with _PDF_POOL_LOCK:
+                page_rect = doc[p].rect
+            full_pixels += int(page_rect.width * high_zoom) * int(page_rect.height * high_zoom)
+            done.append(p)
+            if adaptive and not _needs_zoom_escalation(low_results[p][1], min_confidence):
+                if t:
+                    yield (p, t)
+                continue
+            t0 = time.perf_counter()
+            regions = _ocr_candidate_regions(page_rect, low_results[p][2]) if region_crop else []
+            if regions:
+                # High-zoom crops first so extractors prefer them; low-zoom text keeps context.
+                region_text, pixels = _ocr_page_regions(doc, p, regions, zoom=high_zoom)
+                high_pixels += pixels
+                t = "\n".join(x for x in (region_text, t) if x)
+            else:
+                high_pixels += int(page_rect.width * high_zoom) * int(page_rect.height * high_zoom)
+                t = _ocr_page_text(doc, p, zoom=high_zoom) or t
+            high_seconds.append(time.perf_counter() - t0)
+            if t:
+                yield (p, t)
+    finally:
+        if stats is not None:
+            _fill_ocr_stats(
+                stats,
+                pages=done,
+                low_seconds=low_seconds,
+                high_seconds=high_seconds,
+                high_pixels=high_pixels,
+                full_pixels=full_pixels,
+                spent=time.perf_counter() - dense_start + reused_low,
+                zoom_ratio=high_zoom / low_zoom,
+            )
+
+
+def _fill_ocr_stats(
+    stats: Dict[str, float],
+    pages: List[int],
+    low_seconds: Dict[int, float],
+    high_seconds: List[float],
+    high_pixels: int,
+    full_pixels: int,
+    spent: float,
+    zoom_ratio: float,
+) -> None:
+    # Estimate the fixed high-zoom cost from observed seconds per pixel; without an
+    # escalated page to time, scale the low-zoom cost by the pixel ratio instead.
+    if high_pixels:
+        fixed_estimate = sum(high_seconds) / high_pixels * full_pixels
+    else:
+        dense_low = sum(low_seconds.get(p, 0.0) for p in pages)
+        fixed_estimate = dense_low * zoom_ratio ** 2
+    stats.update(
+        {
+            "pages": float(len(pages)),
+            "escalated": float(len(high_seconds)),
+            "seconds": round(spent, 3),
+            "fixed_zoom_seconds_estimate": round(fixed_estimate, 3),
+            "seconds_saved": round(fixed_estimate - spent, 3),
+            "high_zoom_pixels": float(high_pixels),
+            "full_page_pixels": float(full_pixels),
+        }
+    )
+
+
+def ocr_targeted_text(
+    pdf_path: Path,
+    max_pages: int = 80,
+    adaptive: bool = False,
+    low_zoom: float = OCR_SPARSE_ZOOM,
+    high_zoom: float = 2.3,
+    min_confidence: float = 70.0,
+    region_crop: bool = False,
+    stats: Optional[Dict[str, float]] = None,
+) -> str:
+    """
+    OCR fallback for scanned PDFs:
+    1) sparse scan to detect likely auditor/remuneration pages
+    2) dense scan around hits (+ front pages for auditor signature)
+    See iter_ocr_targeted_pages for the adaptive/region options.
+    """
+    pages = iter_ocr_targeted_pages(
+        pdf_path,
+        max_pages=max_pages,
+        adaptive=adaptive,
+        low_zoom=low_zoom,
+        high_zoom=high_zoom,
+        min_confidence=min_confidence,
+        region_crop=region_crop,
+        stats=stats,
+    )
+    return "\n\n".join(t for _, t in pages)
+
+
+def _word_rows(page, y_tolerance: float = 3.0, cell_gap: float = 8.0) -> List[List[str]]:
+    """Rebuild table rows from word coordinates: one row per baseline, cells split on wide x gaps."""
+    words = sorted(page.get_text("words") or [], key=lambda w: ((w[1] + w[3]) / 2, w[0]))
+    rows: List[List[tuple]] = []
+    row_y = None
+    for w in words:
+        y = (w[1] + w[3]) / 2
+        if row_y is None or y - row_y > y_tolerance:
+            rows.append([])
+            row_y = y
+        rows[-1].append(w)
+
+    out: List[List[str]] = []
+    for row in rows:
+        cells: List[str] = []
+        last_x1 = None
+        for w in sorted(row, key=lambda w: w[0]):
+            if last_x1 is None or w[0] - last_x1 > cell_gap:
+                cells.append(w[4])
+            else:
+                cells[-1] = f"{cells[-1]} {w[4]}"
+            last_x1 = w[2]
+        out.append(cells)
+    return out
+
+
+def extract_remuneration_table(pdf_path: Path, max_pages: int = 4) -> Dict[str, str]:
+    """
+    Born-digital fast path: rebuild the auditor's remuneration table from the PDF itself.
+    Only pages whose text layer mentions auditor remuneration / fees payable are inspected,
+    with PyMuPDF table detection first and word-coordinate rows as fallback.
+    Returns extract_fee_from_table_rows output plus page/source/currency/fee_unit, or {}.
+    """
+    with pdf_document(pdf_path) as doc:
+        if doc is None:
+            return {}
+        with _PDF_POOL_LOCK:
+            return _extract_remuneration_table(doc, max_pages)
+
+
+def _extract_remuneration_table(doc, max_pages: int) -> Dict[str, str]:
+    targets: List[Tuple[int, str]] = []
+    for i in range(doc.page_count):
+        try:
+            txt = doc[i].get_text("text") or ""
+        except Exception:
+            continue
+        low = txt.lower()
+        if "auditor" in low and ("remuneration" in low or "fees payable" in low):
+            targets.append((i, txt))
+            if len(targets) >= max_pages:
+                break
+
+    for i, txt in targets:
+        page = doc[i]
+        candidates: List[Tuple[str, List[List[str]]]] = []
+        try:
+            candidates.extend(("find_tables", tab.extract()) for tab in page.find_tables().tables)
+        except Exception:
+            pass
+        candidates.append(("words", _word_rows(page)))
+        for source, rows in candidates:
+            found = extract_fee_from_table_rows(rows)
+            if found.get("audit_fee"):
+                currency, unit = detect_currency_and_unit(txt)
+                found.update({"page": str(i), "source": source, "currency": currency, "fee_unit": unit})
+                return found
+    return {}
+
+
+_CORPUS_HEADER = struct.Struct("<4sBII")  # magic, codec, key length, payload length
+_CORPUS_MAGIC = b"TRC1"
+_CORPUS_ZLIB, _CORPUS_ZSTD = 1, 2
+
+
+def _corpus_compressor() -> Tuple[int, object]:
+    """zstd (zstandard package) when installed, else zlib."""
+    try:
+        import zstandard  # type: ignore
+
+        return _CORPUS_ZSTD, zstandard.ZstdCompressor(level=10).compress
+    except Exception:
+        return _CORPUS_ZLIB, lambda data: zlib.compress(data, 6)
+
+
+def _corpus_decompress(codec: int, payload: bytes) -> bytes:
+    if codec == _CORPUS_ZSTD:
+        try:
+            import zstandard  # type: ignore
+        except Exception as exc:
+            raise RuntimeError("corpus block is zstd-compressed; install zstandard to read it") from exc
+        return zstandard.ZstdDecompressor().decompress(payload)
+    return zlib.decompress(payload)
+
+
+def configure_corpus(corpus_dir: Optional[Path]) -> Optional[Path]:
+    """
+    Start this run's append-only corpus file corpus_<timestamp>_<pid>.trc under corpus_dir
+    (None/empty disables, closing the current one). Returns the file path.
+    """
+    with _CORPUS_LOCK:
+        for key in ("file", "index"):
+            if _CORPUS[key] is not None:
+                _CORPUS[key].close()
+                _CORPUS[key] = None
+        _CORPUS["path"] = None
+        if not corpus_dir:
+            return None
+        corpus_dir = Path(corpus_dir)
+        corpus_dir.mkdir(parents=True, exist_ok=True)
+        path = corpus_dir / f"corpus_{time.strftime('%Y%m%d-%H%M%S')}_{os.getpid()}.trc"
+        _CORPUS["codec"], _CORPUS["compress"] = _corpus_compressor()
+        _CORPUS["file"] = path.open("ab")
+        _CORPUS["index"] = Path(f"{path}.idx").open("a", encoding="utf-8")
+        _CORPUS["path"] = path
+        return path
+
+
+def corpus_append(company_number: str, filing_date: str, source: str, pages: Iterable[Tuple[int, str]]) -> bool:
+    """
+    Append one filing's extracted pages (source: text, ocr or mineru) as a compressed block,
+    plus its offset to the .idx sidecar. No-op without a configured corpus or pages.
+    """
+    pages = [(int(p), t) for p, t in pages if t]
+    if _CORPUS["file"] is None or not pages:
+        return False
+    key = json.dumps(
+        {
+            "company_number": company_number,
+            "filing_date": filing_date,
+            "source": source,
+            "pages": [p for p, _ in pages],
+            "lengths": [len(t) for _, t in pages],
+        },
+        separators=(",", ":"),
+    ).encode("utf-8")
+    payload = _CORPUS["compress"]("".join(t for _, t in pages).encode("utf-8"))
+    with _CORPUS_LOCK:
+        f = _CORPUS["file"]
+        if f is None:
+            return False
+        offset = f.tell()
+        f.write(_CORPUS_HEADER.pack(_CORPUS_MAGIC, _CORPUS["codec"], len(key), len(payload)))
+        f.write(key)
+        f.write(payload)
+        f.flush()
+        entry = {"company_number": company_number, "filing_date": filing_date, "source": source, "offset": offset}
+        _CORPUS["index"].write(json.dumps(entry, separators=(",", ":")) + "\n")
+        _CORPUS["index"].flush()
+    return True
+
+
+def _read_corpus_block(buf, offset: int) -> Tuple[Optional[Dict[str, object]], List[Tuple[int, str]], int]:
+    """(key, pages, next offset) of the block at offset in buf (bytes/mmap); key is None at a truncated tail."""
+    end = offset + _CORPUS_HEADER.size
+    if end > len(buf):
+        return None, [], offset
+    magic, codec, key_len, payload_len = _CORPUS_HEADER.unpack(buf[offset:end])
+    if magic != _CORPUS_MAGIC or end + key_len + payload_len > len(buf):
+        return None, [], offset
+    key = json.loads(bytes(buf[end : end + key_len]).decode("utf-8"))
+    text = _corpus_decompress(codec, bytes(buf[end + key_len : end + key_len + payload_len])).decode("utf-8")
+    pages: List[Tuple[int, str]] = []
+    pos = 0
+    for page, length in zip(key.pop("pages"), key.pop("lengths")):
+        pages.append((page, text[pos : pos + length]))
+        pos += length
+    return key, pages, end + key_len + payload_len
+
+
+def iter_corpus(path: Path) -> Iterator[Tuple[Dict[str, str], List[Tuple[int, str]]]]:
+    """Yield (key, pages) for every block of a corpus file in write order, reading it through mmap."""
+    path = Path(path)
+    if not path.exists() or path.stat().st_size == 0:
+        return
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        offset = 0
+        while True:
+            key, pages, offset = _read_corpus_block(buf, offset)
+            if key is None:
+                return
+            yield key, pages
+
+
+def load_corpus_index(path: Path) -> List[Dict[str, object]]:
+    """Index entries (company_number, filing_date, source, offset) of a corpus file, from its .idx sidecar or a block scan."""
+    path = Path(path)
+    sidecar = Path(f"{path}.idx")
+    if sidecar.exists():
+        entries = []
+        for line in sidecar.read_text(encoding="utf-8").splitlines():
+            try:
+                entries.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue  # torn last line from an interrupted run
+        return entries
+    entries = []
+    if path.exists() and path.stat().st_size:
+        with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+            offset = 0
+            while offset + _CORPUS_HEADER.size <= len(buf):
+                magic, _codec, key_len, payload_len = _CORPUS_HEADER.unpack(buf[offset : offset + _CORPUS_HEADER.size])
+                start = offset + _CORPUS_HEADER.size
+                if magic != _CORPUS_MAGIC or start + key_len + payload_len > len(buf):
+                    break
+                key = json.loads(bytes(buf[start : start + key_len]).decode("utf-8"))
+                entries.append({k: key[k] for k in ("company_number", "filing_date", "source")} | {"offset": offset})
+                offset = start + key_len + payload_len
+    return entries
+
+
+def read_corpus_pages(path: Path, offset: int) -> List[Tuple[int, str]]:
+    """Pages of the corpus block at offset (from load_corpus_index)."""
+    with Path(path).open("rb") as f:
+        f.seek(offset)
+        header = f.read(_CORPUS_HEADER.size)
+        if len(header) < _CORPUS_HEADER.size:
+            return []
+        _magic, _codec, key_len, payload_len = _CORPUS_HEADER.unpack(header)
+        key, pages, _next = _read_corpus_block(header + f.read(key_len + payload_len), 0)
+    return pages if key is not None else []
+
+
+def recorded_pages(pages: Iterable[Tuple[int, str]], sink: List[Tuple[int, str]]) -> Iterator[Tuple[int, str]]:
+    """Pass (page_index, text) pairs through unchanged, keeping the ones consumed in sink."""
+    try:
+        for page in pages:
+            sink.append(page)
+            yield page
+    finally:
+        close = getattr(pages, "close", None)
+        if close is not None:
+            close()
+
+
+_FILING_STEM = re.compile(r"^(?P<company_number>[A-Za-z0-9]+)_(?P<filing_date>\d{4}-\d{2}-\d{2})$")
+# FTS5 form of _is_auditor_page_text, for indexed_candidate_pages.
+_AUDITOR_PAGE_QUERY = (
+    '"independent auditor" * OR (auditor* AND report*) '
+    'OR (auditor* AND (remuneration OR "fees payable")) OR "audit fee" *'
+)
+
+
+def parse_filing_stem(name: str) -> Optional[Tuple[str, str]]:
+    """(company_number, filing_date) from a <company_number>_<YYYY-MM-DD> PDF stem or output directory name."""
+    m = _FILING_STEM.match(name)
+    return (m["company_number"], m["filing_date"]) if m else None
+
+
+def open_page_index(index_path: Path):
+    """Open (creating if needed) the SQLite FTS5 index of extracted page text."""
+    import sqlite3
+
+    index_path.parent.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(index_path), check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(
+        """
+        CREATE TABLE IF NOT EXISTS filing_pages (
+            id INTEGER PRIMARY KEY,
+            company_number TEXT NOT NULL,
+            filing_date TEXT NOT NULL,
+            source TEXT NOT NULL,
+            page INTEGER NOT NULL,
+            text TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS filing_pages_filing ON filing_pages (company_number, filing_date, source);
+        CREATE VIRTUAL TABLE IF NOT EXISTS page_fts USING fts5(text, content='filing_pages', content_rowid='id');
+        CREATE TRIGGER IF NOT EXISTS filing_pages_insert AFTER INSERT ON filing_pages BEGIN
+            INSERT INTO page_fts (rowid, text) VALUES (new.id, new.text);
+        END;
+        CREATE TRIGGER IF NOT EXISTS filing_pages_delete AFTER DELETE ON filing_pages BEGIN
+            INSERT INTO page_fts (page_fts, rowid, text) VALUES ('delete', old.id, old.text);
+        END;
+        """
+    )
+    conn.commit()
+    return conn
+
+
+def configure_page_index(index_path: Optional[Path]):
+    """Make record_filing_pages/indexed_candidate_pages use the FTS5 page index (None disables); returns the connection."""
+    with _PAGE_INDEX_LOCK:
+        if _PAGE_INDEX.get("conn") is not None:
+            _PAGE_INDEX["conn"].close()
+        _PAGE_INDEX["conn"] = open_page_index(Path(index_path)) if index_path else None
+        return _PAGE_INDEX["conn"]
+
+
+def index_filing_pages(conn, company_number: str, filing_date: str, source: str, pages: Iterable[Tuple[int, str]]) -> int:
+    """Replace the indexed pages of one filing and source; returns pages written."""
+    rows = [(company_number, filing_date, source, int(p), t) for p, t in pages if t]
+    if not rows:
+        return 0
+    with _PAGE_INDEX_LOCK:
+        conn.execute(
+            "DELETE FROM filing_pages WHERE company_number = ? AND filing_date = ? AND source = ?",
+            (company_number, filing_date, source),
+        )
+        conn.executemany(
+            "INSERT INTO filing_pages (company_number, filing_date, source, page, text) VALUES (?, ?, ?, ?, ?)", rows
+        )
+        conn.commit()
+    return len(rows)
+
+
+def record_filing_pages(company_number: str, filing_date: str, source: str, pages: Iterable[Tuple[int, str]]) -> None:
+    """Persist the pages an extractor read to the run's corpus and the page index (whichever are configured)."""
+    pages = list(pages)
+    corpus_append(company_number, filing_date, source, pages)
+    if _PAGE_INDEX["conn"] is not None:
+        index_filing_pages(_PAGE_INDEX["conn"], company_number, filing_date, source, pages)
+
+
+def search_pages(
+    query: str,
+    limit: int = 50,
+    company_number: str = "",
+    filing_date: str = "",
+    conn=None,
+) -> List[Dict[str, object]]:
+    """
+    Best-ranked (bm25) indexed pages matching an FTS5 query (phrases, NEAR, prefix*, AND/OR),
+    optionally within one company / filing; limit < 0 returns every match. Keys: company_number,
+    filing_date, source, page, snippet, rank, text and hits ((start, end) offsets of matched
+    tokens in text).
+    """
+    conn = conn if conn is not None else _PAGE_INDEX["conn"]
+    if conn is None:
+        return []
+    sql = (
+        "SELECT p.company_number, p.filing_date, p.source, p.page, "
+        "highlight(page_fts, 0, char(2), char(3)) AS marked, "
+        "snippet(page_fts, 0, '[', ']', ' ... ', 16) AS snippet, bm25(page_fts) AS rank "
+        "FROM page_fts JOIN filing_pages p ON p.id = page_fts.rowid WHERE page_fts MATCH ?"
+    )
+    params: List[object] = [query]
+    if company_number:
+        sql += " AND p.company_number = ?"
+        params.append(company_number)
+    if filing_date:
+        sql += " AND p.filing_date = ?"
+        params.append(filing_date)
+    sql += " ORDER BY rank LIMIT ?"
+    params.append(int(limit))
+    with _PAGE_INDEX_LOCK:
+        rows = [dict(r) for r in conn.execute(sql, params)]
+    for row in rows:
+        parts = row.pop("marked").split("\x02")
+        text, hits = parts[0], []
+        for part in parts[1:]:
+            token, _, rest = part.partition("\x03")
+            hits.append((len(text), len(text) + len(token)))
+            text += token + rest
+        row["text"], row["hits"] = text, hits
+    return rows
+
+
+def indexed_candidate_pages(company_number: str, filing_date: str) -> List[int]:
+    """Sorted PDF pages of a filing whose indexed text-layer/OCR text looks like the auditor's report or fee note."""
+    conn = _PAGE_INDEX["conn"]
+    if conn is None:
+        return []
+    with _PAGE_INDEX_LOCK:
+        rows = conn.execute(
+            "SELECT DISTINCT p.page FROM filing_pages p JOIN page_fts ON page_fts.rowid = p.id "
+            "WHERE p.company_number = ? AND p.filing_date = ? AND p.source IN ('text', 'ocr') "
+            "AND page_fts MATCH ? ORDER BY p.page",
+            (company_number, filing_date, _AUDITOR_PAGE_QUERY),
+        ).fetchall()
+    return [int(r["page"]) for r in rows]
 
 
 def fee_to_gbp_numeric(value: str, unit: str, currency: str) -> Optional[float]:
@@ -642,6 +2568,11 @@ def parse_args() -> argparse.Namespace:
         default=os.getenv("TENDER_DOWNLOAD_DIR", str(root / "uk_accounts_pdfs")),
         help="Local PDF folder",
     )
+    p.add_argument(
+        "--pdf-index",
+        default=os.getenv("TENDER_PDF_INDEX", str(root / "pdf_index.sqlite")),
+        help="SQLite index of downloaded PDF facts (size, sha256, pages, text coverage); empty disables",
+    )
     p.add_argument(
         "--enable-ocr-fallback",
         action=argparse.BooleanOptionalAction,
@@ -649,6 +2580,74 @@ def parse_args() -> argparse.Namespace:
         help="Run targeted OCR when fields are missing",
     )
     p.add_argument("--ocr-max-pages", type=int, default=80, help="Max pages for OCR fallback")
+    p.add_argument(
+        "--ocr-adaptive",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("TENDER_OCR_ADAPTIVE", "false").lower() == "true",
+        help="OCR at low zoom first; re-render at high zoom only on low-confidence pages",
+    )
+    p.add_argument(
+        "--ocr-min-confidence",
+        type=float,
+        default=float(os.getenv("TENDER_OCR_MIN_CONFIDENCE", "70")),
+        help="Tesseract word confidence (0-100) below which adaptive OCR escalates zoom",
+    )
+    p.add_argument(
+        "--ocr-region-crop",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("TENDER_OCR_REGION_CROP", "false").lower() == "true",
+        help="Render only auditor signature / fee-note regions at high zoom",
+    )
+    p.add_argument(
+        "--ocr-cache-dir",
+        default=os.getenv("TENDER_OCR_CACHE_DIR", str(root / "ocr_cache")),
+        help="OCR result cache keyed by page image hash + settings (empty disables)",
+    )
+    p.add_argument(
+        "--ocr-cache-max-mb",
+        type=float,
+        default=float(os.getenv("TENDER_OCR_CACHE_MAX_MB", "512")),
+        help="OCR cache size cap; least recently used entries are evicted",
+    )
+    p.add_argument(
+        "--streaming-extract",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("TENDER_STREAMING_EXTRACT", "false").lower() == "true",
+        help="Extract fields page by page and stop reading/OCRing once every field is found",
+    )
+    p.add_argument(
+        "--pdf-tables",
+        action=argparse.BooleanOptionalAction,
+        default=os.getenv("TENDER_PDF_TABLES", "true").lower() != "false",
+        help="Rebuild the auditor remuneration table from born-digital PDFs when no fee table row matched",
+    )
+    p.add_argument(
+        "--regex-engine",
+        choices=("re", "re2"),
+        default=os.getenv("TENDER_REGEX_ENGINE", "re"),
+        help="Engine for the field regexes; re2 (pip install google-re2) runs in linear time",
+    )
+    p.add_argument(
+        "--extract-budget",
+        type=float,
+        default=float(os.getenv("TENDER_EXTRACT_BUDGET_S", "30")),
+        help="Per-document field extraction budget in seconds; regex passes past it are skipped (0 = none)",
+    )
+    p.add_argument(
+        "--corpus-dir",
+        default=os.getenv("TENDER_CORPUS_DIR", str(root / "corpus")),
+        help="Directory for the per-run append-only corpus of extracted text (empty disables)",
+    )
+    p.add_argument(
+        "--page-index",
+        default=os.getenv("TENDER_PAGE_INDEX", str(root / "page_index.sqlite")),
+        help="SQLite FTS5 index of extracted page text by company, filing date and page (empty disables)",
+    )
+    p.add_argument(
+        "--auditor-registry",
+        default=os.getenv("TENDER_AUDITOR_REGISTRY", str(AUDITOR_REGISTRY_PATH)),
+        help="CSV of audit firms (name, ;-separated aliases) used to normalise auditor names (empty = built-in firms)",
+    )
     p.add_argument(
         "--history-csv",
         default=os.getenv("TENDER_HISTORY_CSV", str(root / "tender_history.csv")),
@@ -676,8 +2675,27 @@ def run_pipeline(
     ocr_max_pages: int,
     history_csv: Path,
     shortlist_csv: Path,
+    ocr_adaptive: bool = False,
+    ocr_min_confidence: float = 70.0,
+    ocr_region_crop: bool = False,
+    streaming_extract: bool = False,
+    pdf_tables: bool = True,
+    ocr_cache_dir: Optional[Path] = None,
+    ocr_cache_max_mb: float = 512.0,
+    pdf_index: Optional[Path] = None,
+    regex_engine: str = "re",
+    extract_budget_s: float = 30.0,
+    corpus_dir: Optional[Path] = None,
+    page_index: Optional[Path] = None,
+    auditor_registry: Optional[Path] = AUDITOR_REGISTRY_PATH,
 ) -> Tuple[List[Dict[str, str]], List[Dict[str, str]]]:
     """Run the end-to-end extraction pipeline and write CSV outputs."""
+    configure_auditor_registry(auditor_registry)
+    configure_ocr_cache(ocr_cache_dir, ocr_cache_max_mb)
+    configure_corpus(corpus_dir)
+    configure_page_index(page_index)
+    configure_field_extraction(regex_engine, extract_budget_s)
+    configure_pdf_index(pdf_index)
     session, headers = create_ch_session(api_key)
     companies = search_companies(
         session=session,
@@ -721,34 +2739,103 @@ def run_pipeline(
             if not pdf_path.exists() and not download_pdf(session=session, headers=headers, pdf_url=pdf_url, output_path=pdf_path):
                 continue
 
-            text = extract_pdf_text_sampled(pdf_path)
-            auditor, confidence = extract_external_auditor(text)
-            audit_fee, _ = extract_audit_fee(text)
-            currency, fee_unit = detect_currency_and_unit(text)
-            year = parse_year(filing_date, text)
-
-            need_ocr = enable_ocr_fallback and (
-                not auditor or not audit_fee or not currency or not fee_unit
-            )
-            if need_ocr:
-                ocr_text = ocr_targeted_text(pdf_path, max_pages=ocr_max_pages)
-                if ocr_text:
-                    ocr_auditor, ocr_conf = extract_external_auditor(ocr_text)
-                    ocr_fee, _ = extract_audit_fee(ocr_text)
-                    ocr_currency, ocr_unit = detect_currency_and_unit(ocr_text)
-                    ocr_year = parse_year(filing_date, ocr_text)
-
-                    if ocr_auditor and not auditor:
-                        auditor = ocr_auditor
-                        confidence = ocr_conf
-                    if ocr_fee and not audit_fee:
-                        audit_fee = ocr_fee
-                    if ocr_currency and not currency:
-                        currency = ocr_currency
-                    if ocr_unit and not fee_unit:
-                        fee_unit = ocr_unit
-                    if ocr_year and not year:
-                        year = ocr_year
+            # Index lookup (incremental on new downloads) lets scanned PDFs skip text-layer stages.
+            has_text_layer = float(pdf_info(pdf_path).get("text_coverage", 1.0)) > 0
+
+            # One shared PyMuPDF handle per filing across sampling, table and OCR stages.
+            with pdf_document(pdf_path):
+                ocr_stats: Dict[str, float] = {}
+                # Pages the extractors actually read, persisted to the corpus below.
+                text_pages: List[Tuple[int, str]] = []
+                ocr_seen: List[Tuple[int, str]] = []
+                if streaming_extract:
+                    fields = new_field_state()
+                    if has_text_layer:
+                        fields = extract_fields_streaming(
+                            recorded_pages(iter_pdf_pages_sampled(pdf_path), text_pages), state=fields
+                        )
+                    if has_text_layer and pdf_tables and fields["fee_method"] != "table":
+                        table = extract_remuneration_table(pdf_path)
+                        if table:
+                            fields["audit_fee"], fields["fee_method"] = table["audit_fee"], "table"
+                            fields["currency"] = table["currency"] or fields["currency"]
+                            fields["fee_unit"] = table["fee_unit"] or fields["fee_unit"]
+                    need_ocr = enable_ocr_fallback and not all(
+                        fields[k] for k in ("external_auditor", "audit_fee", "currency", "fee_unit")
+                    )
+                    if need_ocr:
+                        with closing(
+                            iter_ocr_targeted_pages(
+                                pdf_path,
+                                max_pages=ocr_max_pages,
+                                adaptive=ocr_adaptive,
+                                min_confidence=ocr_min_confidence,
+                                region_crop=ocr_region_crop,
+                                stats=ocr_stats,
+                            )
+                        ) as ocr_pages:
+                            fields = extract_fields_streaming(recorded_pages(ocr_pages, ocr_seen), state=fields)
+                    auditor, confidence = fields["external_auditor"], fields["confidence"]
+                    audit_fee = fields["audit_fee"]
+                    currency, fee_unit = fields["currency"], fields["fee_unit"]
+                    year = fields["year"] or parse_year(filing_date, "")
+                else:
+                    text_pages = list(iter_pdf_pages_sampled(pdf_path)) if has_text_layer else []
+                    text = "\n\n".join(t for _, t in text_pages)
+                    fields = extract_fields(text, filing_date)
+                    auditor, confidence = fields["external_auditor"], fields["confidence"]
+                    audit_fee, fee_method = fields["audit_fee"], fields["fee_method"]
+                    currency, fee_unit = fields["currency"], fields["fee_unit"]
+                    year = fields["year"]
+                    if has_text_layer and pdf_tables and fee_method != "table":
+                        table = extract_remuneration_table(pdf_path)
+                        if table:
+                            audit_fee = table["audit_fee"]
+                            currency = table["currency"] or currency
+                            fee_unit = table["fee_unit"] or fee_unit
+
+                    need_ocr = enable_ocr_fallback and (
+                        not auditor or not audit_fee or not currency or not fee_unit
+                    )
+                    if need_ocr:
+                        ocr_seen = list(
+                            iter_ocr_targeted_pages(
+                                pdf_path,
+                                max_pages=ocr_max_pages,
+                                adaptive=ocr_adaptive,
+                                min_confidence=ocr_min_confidence,
+                                region_crop=ocr_region_crop,
+                                stats=ocr_stats,
+                            )
+                        )
+                        ocr_text = "\n\n".join(t for _, t in ocr_seen)
+                        if ocr_text:
+                            ocr_fields = extract_fields(ocr_text, filing_date)
+                            ocr_auditor, ocr_conf = ocr_fields["external_auditor"], ocr_fields["confidence"]
+                            ocr_fee = ocr_fields["audit_fee"]
+                            ocr_currency, ocr_unit = ocr_fields["currency"], ocr_fields["fee_unit"]
+                            ocr_year = ocr_fields["year"]
+
+                            if ocr_auditor and not auditor:
+                                auditor = ocr_auditor
+                                confidence = ocr_conf
+                            if ocr_fee and not audit_fee:
+                                audit_fee = ocr_fee
+                            if ocr_currency and not currency:
+                                currency = ocr_currency
+                            if ocr_unit and not fee_unit:
+                                fee_unit = ocr_unit
+                            if ocr_year and not year:
+                                year = ocr_year
+            record_filing_pages(company_number, filing_date, "text", text_pages)
+            record_filing_pages(company_number, filing_date, "ocr", ocr_seen)
+            if ocr_stats:
+                print(
+                    f"[OCR] {pdf_path.name} pages={ocr_stats['pages']:.0f} "
+                    f"escalated={ocr_stats['escalated']:.0f} seconds={ocr_stats['seconds']:.2f} "
+                    f"saved_seconds={ocr_stats['seconds_saved']:.2f} "
+                    f"high_zoom_pixels={ocr_stats['high_zoom_pixels']:.0f}/{ocr_stats['full_page_pixels']:.0f}"
+                )
 
             history_rows.append(
                 make_row(
@@ -824,6 +2911,19 @@ def run_cli() -> int:
         ocr_max_pages=args.ocr_max_pages,
         history_csv=Path(args.history_csv),
         shortlist_csv=Path(args.shortlist_csv),
+        ocr_adaptive=args.ocr_adaptive,
+        ocr_min_confidence=args.ocr_min_confidence,
+        ocr_region_crop=args.ocr_region_crop,
+        streaming_extract=args.streaming_extract,
+        pdf_tables=args.pdf_tables,
+        ocr_cache_dir=Path(args.ocr_cache_dir) if args.ocr_cache_dir else None,
+        ocr_cache_max_mb=args.ocr_cache_max_mb,
+        pdf_index=Path(args.pdf_index) if args.pdf_index else None,
+        regex_engine=args.regex_engine,
+        extract_budget_s=args.extract_budget,
+        corpus_dir=Path(args.corpus_dir) if args.corpus_dir else None,
+        page_index=Path(args.page_index) if args.page_index else None,
+        auditor_registry=Path(args.auditor_registry) if args.auditor_registry else None,
     )
 
     print(f"[DONE] history CSV: {args.history_csv}")
@@ -0,0 +1,7 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+# The modules live at the repository root, not in an installed package.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import pytest
+
+import tender_radar
+from tender_radar import (
+    configure_auditor_registry,
+    extract_external_auditor,
+    normalize_auditor_name,
+    renormalize_auditors,
+    resolve_auditor_name,
+    resolve_auditor_names,
+)
+
+
+@pytest.fixture
+def registry():
+    saved = tender_radar._AUDITOR_REGISTRY["path"]
+    yield configure_auditor_registry
+    configure_auditor_registry(saved)
+
+
+@pytest.mark.parametrize(
+    "raw, firm",
+    [
+        ("PricewaterhouseCoopers LLP", "PwC"),
+        ("Ernst & Young LLP", "EY"),
+        ("KPMGLLP", "KPMG"),
+        ("Deloitte & Touche", "Deloitte"),
+        ("Baker Tilly UK Audit LLP", "RSM"),
+        ("Smith & Williamson LLP", "Evelyn Partners"),
+        ("Chiene + Tait LLP", "Chiene + Tait"),
+        ("Grant Thorton UK LLP", "Grant Thornton"),
+        ("Deloite LLP", "Deloitte"),
+    ],
+)
+def test_aliases_and_misspellings_resolve(raw, firm):
+    assert resolve_auditor_name(raw) == firm
+
+
+@pytest.mark.parametrize("raw", ["Jeffreys Property Ltd", "Honey & Co", "Journey Partners LLP", "The Board"])
+def test_aliases_must_be_whole_tokens(raw):
+    assert resolve_auditor_name(raw) == ""
+
+
+@pytest.mark.parametrize(
+    "raw, firm",
+    [
+        ("remunerationKPMG LLP", "KPMG"),
+        ("Ernst & YoungLLPauditor", "EY"),
+        ("KPMGauditor", "KPMG"),
+        ("remunerationMenzies LLP", "Menzies"),
+    ],
+)
+def test_alias_glued_to_a_neighbouring_word(raw, firm):
+    assert resolve_auditor_name(raw) == firm
+
+
+def test_glued_alias_needs_a_word_boundary_on_one_side():
+    assert resolve_auditor_name("xkpmgy") == ""
+
+
+@pytest.mark.parametrize(
+    "raw, firm",
+    [
+        ("Menzies", ""),
+        ("Menzies, Statutory Auditor", ""),
+        ("Menzies LLP", "Menzies"),
+        ("Dains Audit Limited", "Dains"),
+        ("Old Mill Audit LLP", "Old Mill"),
+        ("Thomas Westcott, Chartered Accountants", "Thomas Westcott"),
+        ("Thomas Westcott, director", ""),
+        ("Crowe", ""),
+        ("Crowe U.K. LLP", "Crowe"),
+    ],
+)
+def test_surname_firms_need_a_legal_form(raw, firm):
+    assert resolve_auditor_name(raw) == firm
+
+
+def test_extraction_confidence_follows_the_resolver():
+    assert extract_external_auditor("Auditor: remunerationKPMG LLP") == ("KPMG", "high")
+    assert extract_external_auditor("Signed for and on behalf of Menzies LLP, Statutory Auditor") == ("Menzies", "high")
+    assert extract_external_auditor("Signed for and on behalf of Menzies, Statutory Auditor") == ("", "low")
+    assert extract_external_auditor("Auditors: Bloggs & Co LLP") == ("Bloggs & Co LLP", "high")
+
+
+def test_normalize_keeps_unknown_names_cleaned():
+    assert normalize_auditor_name("  Bloggs & Co LLP, ") == "Bloggs & Co LLP"
+    assert resolve_auditor_names(["KPMG LLP", "", "KPMG LLP", "Menzies"]) == {"KPMG LLP": "KPMG", "": "", "Menzies": "Menzies"}
+
+
+def test_custom_registry_and_renormalize(tmp_path, registry):
+    csv_path = tmp_path / "firms.csv"
+    csv_path.write_text("name,aliases,needs_suffix\nAcme Audit,acme;acme partners,\nBrown,,yes\n", encoding="utf-8")
+    assert registry(csv_path) == 8 + 2
+    assert resolve_auditor_name("Acme Partners LLP") == "Acme Audit"
+    assert resolve_auditor_name("Brown") == ""
+    assert resolve_auditor_name("Brown LLP") == "Brown"
+    assert resolve_auditor_name("Menzies LLP") == ""
+
+    rows = [{"external_auditor": "ACME LLP"}, {"external_auditor": "KPMG"}, {"external_auditor": ""}]
+    assert renormalize_auditors(rows) == 1
+    assert [r["external_auditor"] for r in rows] == ["Acme Audit", "KPMG", ""]
+
+
+def test_missing_registry_keeps_built_in_firms(tmp_path, registry):
+    assert registry(tmp_path / "missing.csv") == 8
+    assert resolve_auditor_name("KPMG LLP") == "KPMG"
+    assert resolve_auditor_name("Menzies LLP") == ""
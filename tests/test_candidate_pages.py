@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import tender_radar
+from tender_radar import OCR_SPARSE_ZOOM, close_all_pdf_documents, find_candidate_pages, iter_ocr_targeted_pages
+
+fitz = pytest.importorskip("fitz")
+
+
+def _make_scan(path: Path, pages: int = 30, text_pages: int = 2) -> Path:
+    """First text_pages pages have a text layer; the rest are textless like a scan."""
+    doc = fitz.open()
+    for i in range(pages):
+        page = doc.new_page()
+        if i < text_pages:
+            page.insert_text((50, 100), f"Strategic report page {i} " * 8)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def ocr_calls(monkeypatch):
+    calls = []
+
+    def fake_ocr(doc, page_index, zoom=2.2):
+        calls.append((page_index, zoom))
+        return "Independent auditor's report to the members of Example plc" if page_index == 15 else "Notes"
+
+    monkeypatch.setattr(tender_radar, "_ocr_page_text", fake_ocr)
+    yield calls
+    close_all_pdf_documents()
+
+
+def test_textless_pages_are_sampled_on_the_ocr_stage_sparse_pages(tmp_path: Path, ocr_calls):
+    pdf = _make_scan(tmp_path / "scan.pdf")
+    pages = find_candidate_pages(pdf)
+
+    # Text-layer pages 0-1 are never OCRed; textless pages only where the OCR stage scans too.
+    assert ocr_calls == [(p, OCR_SPARSE_ZOOM) for p in (3, 5, 6, 9, 10, 12, 15, 18, 20, 25)]
+    assert pages == [0, 1, 2, 13, 14, 15, 16, 17]
+
+
+def test_sampled_renders_are_the_ocr_stage_renders(tmp_path: Path, ocr_calls):
+    pdf = _make_scan(tmp_path / "scan.pdf", pages=150, text_pages=0)
+    find_candidate_pages(pdf)
+    sampled = set(ocr_calls)
+    ocr_calls.clear()
+    list(iter_ocr_targeted_pages(pdf))
+    # Same pages at the same zoom: the OCR cache serves whichever of the two runs second.
+    assert sampled <= set(ocr_calls)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+import tender_radar
+from tender_radar import (
+    configure_corpus,
+    corpus_append,
+    iter_corpus,
+    load_corpus_index,
+    read_corpus_pages,
+    recorded_pages,
+)
+
+TEXT_PAGES = [(0, "Strategic report"), (3, "Independent auditor's report\nKPMG LLP"), (4, "")]
+OCR_PAGES = [(7, "Auditor's remuneration £000 — audit of the accounts 245 230")]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    path = configure_corpus(tmp_path / "corpus")
+    yield path
+    configure_corpus(None)
+
+
+def test_append_and_iterate_blocks_in_write_order(corpus):
+    assert corpus.name.startswith("corpus_") and corpus.suffix == ".trc"
+    assert corpus_append("01234567", "2023-06-30", "text", TEXT_PAGES)
+    assert corpus_append("01234567", "2023-06-30", "ocr", OCR_PAGES)
+    assert not corpus_append("07654321", "2023-06-30", "text", [(0, "")])
+
+    blocks = list(iter_corpus(corpus))
+    assert [key["source"] for key, _ in blocks] == ["text", "ocr"]
+    assert blocks[0][0] == {"company_number": "01234567", "filing_date": "2023-06-30", "source": "text"}
+    assert blocks[0][1] == TEXT_PAGES[:2]  # empty pages are not stored
+    assert blocks[1][1] == OCR_PAGES
+
+
+def test_index_sidecar_and_block_scan_agree(corpus):
+    corpus_append("01234567", "2023-06-30", "text", TEXT_PAGES)
+    corpus_append("SC123456", "2022-12-31", "mineru", OCR_PAGES)
+    configure_corpus(None)  # flush and close before reading
+
+    entries = load_corpus_index(corpus)
+    assert [(e["company_number"], e["source"]) for e in entries] == [("01234567", "text"), ("SC123456", "mineru")]
+    assert entries[0]["offset"] == 0
+    assert read_corpus_pages(corpus, entries[1]["offset"]) == OCR_PAGES
+
+    Path(f"{corpus}.idx").unlink()
+    assert load_corpus_index(corpus) == entries
+
+
+def test_torn_tail_and_index_line_are_skipped(corpus):
+    corpus_append("01234567", "2023-06-30", "text", TEXT_PAGES)
+    corpus_append("01234567", "2023-06-30", "ocr", OCR_PAGES)
+    configure_corpus(None)
+    data = corpus.read_bytes()
+    corpus.write_bytes(data[:-5])
+    with Path(f"{corpus}.idx").open("a", encoding="utf-8") as f:
+        f.write('{"company_number": "0123')
+
+    assert [key["source"] for key, _ in iter_corpus(corpus)] == ["text"]
+    assert len(load_corpus_index(corpus)) == 2
+    Path(f"{corpus}.idx").unlink()
+    assert [e["source"] for e in load_corpus_index(corpus)] == ["text"]
+    assert read_corpus_pages(corpus, len(data) + 10) == []
+
+
+def test_disabled_corpus_is_a_no_op(tmp_path):
+    configure_corpus(None)
+    assert not corpus_append("01234567", "2023-06-30", "text", TEXT_PAGES)
+    assert list(iter_corpus(tmp_path / "missing.trc")) == []
+    assert load_corpus_index(tmp_path / "missing.trc") == []
+
+
+def test_zstd_block_needs_zstandard(corpus):
+    if importlib.util.find_spec("zstandard") is not None:
+        pytest.skip("zstandard is installed")
+    key = json.dumps({"company_number": "1", "filing_date": "2023-01-01", "source": "text", "pages": [0], "lengths": [1]})
+    payload = b"\x28\xb5\x2f\xfd"
+    header = tender_radar._CORPUS_HEADER.pack(tender_radar._CORPUS_MAGIC, tender_radar._CORPUS_ZSTD, len(key), len(payload))
+    corpus.write_bytes(header + key.encode("utf-8") + payload)
+    with pytest.raises(RuntimeError, match="zstandard"):
+        list(iter_corpus(corpus))
+
+
+def test_recorded_pages_keeps_consumed_pages_and_closes_source():
+    closed = []
+
+    def pages():
+        try:
+            yield from TEXT_PAGES
+        finally:
+            closed.append(True)
+
+    sink = []
+    stream = recorded_pages(pages(), sink)
+    assert next(stream) == TEXT_PAGES[0]
+    stream.close()
+    assert sink == TEXT_PAGES[:1]
+    assert closed == [True]
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from tender_radar import (
+    detect_currency_and_unit,
+    extract_audit_fee,
+    extract_external_auditor,
+    extract_fields,
+    extract_fields_streaming,
+    parse_year,
+)
+
+# Expected fields from the per-field extractors as they stood before the single-pass
+# extract_fields, with today's auditor-name resolution.
+GOLDEN = json.loads((Path(__file__).parent / "data" / "field_extraction_golden.json").read_text(encoding="utf-8"))
+
+
+def _per_field(text: str, filing_date: str) -> dict:
+    auditor, confidence = extract_external_auditor(text)
+    fee, method = extract_audit_fee(text)
+    currency, unit = detect_currency_and_unit(text)
+    return {
+        "external_auditor": auditor,
+        "confidence": confidence,
+        "audit_fee": fee,
+        "fee_method": method,
+        "currency": currency,
+        "fee_unit": unit,
+        "year": parse_year(filing_date, text),
+    }
+
+
+@pytest.mark.parametrize("case", GOLDEN, ids=range(len(GOLDEN)))
+def test_extract_fields_matches_golden(case):
+    assert extract_fields(case["text"], case["filing_date"], budget_s=0) == case["expected"]
+
+
+@pytest.mark.parametrize("case", GOLDEN[:50], ids=range(50))
+def test_per_field_extractors_match_golden(case):
+    assert _per_field(case["text"], case["filing_date"]) == case["expected"]
+
+
+def test_nbsp_and_casefold_odd_text():
+    text = "Independent auditor's report\nKPMG LLP\nKK Auditor's remuneration\nAudit of the accounts 45 40"
+    assert extract_fields(text, budget_s=0) == _per_field(text, "")
+
+
+def test_streaming_finds_fields_split_across_pages():
+    pages = [
+        (0, "Strategic report"),
+        (1, "Independent auditor's report to the members of Example plc"),
+        (2, "Signed for and on behalf of KPMG LLP, Statutory Auditor\nFor the year ended 31 March 2023\nAuditor's remuneration £000"),
+        (3, "Audit of the company's annual accounts 245 230"),
+    ]
+    state = extract_fields_streaming(pages, budget_s=0)
+    assert (state["external_auditor"], state["confidence"]) == ("KPMG", "high")
+    assert (state["audit_fee"], state["fee_method"], state["year"]) == ("245", "table", "2023")
+
+
+def test_streaming_joins_fee_label_and_figure_on_the_next_page():
+    label = "Auditor's remuneration\nFees payable to the company's auditor for the audit of the"
+    figure = "company's annual accounts 310 295\nTax advisory services 40 35"
+    assert extract_fields_streaming([(7, label)], budget_s=0)["audit_fee"] == ""
+    assert extract_fields_streaming([(8, figure)], budget_s=0)["audit_fee"] == ""
+    state = extract_fields_streaming([(7, label), (8, figure)], budget_s=0)
+    assert (state["audit_fee"], state["fee_method"]) == ("310", "table")
+
+
+def test_streaming_stops_pulling_pages_once_fields_are_complete():
+    pulled = []
+
+    def pages():
+        texts = [
+            "Signed for and on behalf of KPMG LLP, Statutory Auditor\nFor the year ended 31 March 2023",
+            "Auditor's remuneration £000\nAudit of the company's annual accounts 245 230",
+            "Signed for and on behalf of Deloitte LLP, Statutory Auditor",
+            "Auditor's remuneration £000\nAudit of the company's annual accounts 999 998",
+        ]
+        for n, text in enumerate(texts):
+            pulled.append(n)
+            yield n, text
+
+    state = extract_fields_streaming(pages(), budget_s=0)
+    assert (state["external_auditor"], state["audit_fee"]) == ("KPMG", "245")
+    assert pulled == [0, 1]
+    # A state that is already complete reads no pages at all.
+    pulled.clear()
+    assert extract_fields_streaming(pages(), state=dict(state), budget_s=0) == state
+    assert pulled == []
+
+
+def test_keyword_dense_text_is_not_slower_than_per_field_extractors():
+    # Many failed regex anchors ("Independent auditor report" lacks the apostrophe the
+    # pattern needs) and thousands of fee-row lines: the single pass must not lose to the
+    # per-field extractors it replaces.
+    filing = (
+        "Independent auditor report to the members of Foo plc for the year ended 31 March 2023.\n\n"
+        "Signed for and on behalf of KPMG LLP, Statutory Auditor, Chartered Accountants. London\n\n"
+        "Auditor remuneration  £000\nFees payable to the company auditor for the audit of the annual accounts   250   240\n"
+    )
+    text = filing * 1500
+
+    def best(fn):
+        times = []
+        for _ in range(5):
+            t0 = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - t0)
+        return min(times)
+
+    assert extract_fields(text, budget_s=0) == _per_field(text, "")
+    assert best(lambda: extract_fields(text, budget_s=0)) < 2 * best(lambda: _per_field(text, ""))
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import random
+import re
+import time
+
+import pytest
+
+from tender_radar import _first_match, _keyword_stems, _offsets_align, keyword_hits
+
+
+def _all_offsets(low: str, kw: str):
+    return [i for i in range(len(low)) if low.startswith(kw, i)]
+
+
+def test_stems_group_keywords_under_their_shortest_prefix():
+    stems = _keyword_stems(["fees payable to the company", "audit", "fees payable", "fees payables", "audit"])
+    assert stems == {
+        "audit": {"": ("audit",)},
+        "fees payable": {
+            "": ("fees payable",),
+            " ": ("fees payable", "fees payable to the company"),
+            "s": ("fees payable", "fees payables"),
+        },
+    }
+
+
+def test_hits_include_overlaps_and_leave_out_missing_keywords():
+    assert keyword_hits("aaaa", ("aa", "b"), first_only=()) == {"aa": [0, 1, 2]}
+
+
+def test_prefix_sharing_keywords_are_told_apart():
+    low = "fees payable to the company; fees payable to the group; fees payable"
+    hits = keyword_hits(low, ("fees payable", "fees payable to the company", "fees payable to the group"), first_only=())
+    assert hits == {
+        "fees payable": [0, 29, 56],
+        "fees payable to the company": [0],
+        "fees payable to the group": [29],
+    }
+
+
+def test_first_only_keywords_keep_their_first_offset():
+    low = "kpmg audit, kpmg llp audit; audit of kpmg"
+    hits = keyword_hits(low, ("kpmg", "kpmg llp", "audit"), first_only=("kpmg", "kpmg llp"))
+    assert hits == {"kpmg": [0], "kpmg llp": [12], "audit": [5, 21, 28]}
+
+
+def test_hits_match_a_brute_force_scan():
+    rng = random.Random(7)
+    keywords = ("ab", "abc", "abd", "b", "bca", "cab")
+    for _ in range(200):
+        low = "".join(rng.choice("abcd ") for _ in range(rng.randint(0, 40)))
+        first_only = tuple(rng.sample(keywords, rng.randint(0, 3)))
+        expected = {}
+        for kw in keywords:
+            offsets = _all_offsets(low, kw)
+            if offsets:
+                expected[kw] = offsets[:1] if kw in first_only else offsets
+        assert keyword_hits(low, keywords, first_only) == expected, (low, first_only)
+
+
+@pytest.mark.parametrize(
+    "text, aligned",
+    [
+        ("Auditor's remuneration", True),
+        ("Café Straße £000", True),  # lower() keeps every offset
+        ("İSTANBUL audit", False),  # dotted I lower-cases to two code points
+        ("KPMG LLP", False),  # Kelvin sign: (?i) would match "k" where no "k" was found
+    ],
+)
+def test_offsets_align(text, aligned):
+    assert _offsets_align(text, text.lower()) is aligned
+
+
+def test_first_match_only_tries_the_given_starts():
+    pattern = re.compile(r"fee (\d+)")
+    text = "audit fee 12 and fee 34"
+    assert _first_match(pattern, text, None).group(1) == "12"
+    assert _first_match(pattern, text, [text.index("fee 34")]).group(1) == "34"
+    assert _first_match(pattern, text, [0, 1]) is None
+    assert _first_match(pattern, text, []) is None
+
+
+def test_first_match_raises_once_the_deadline_passed():
+    with pytest.raises(TimeoutError):
+        _first_match(re.compile("fee"), "fee", [0], deadline=time.perf_counter() - 1)
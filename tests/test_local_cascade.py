@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import run_tender_radar_mineru as runner
+from tender_radar import close_all_pdf_documents
+
+fitz = pytest.importorskip("fitz")
+
+AUDITOR = "Signed for and on behalf of KPMG LLP, Statutory Auditor\nFor the year ended 31 March 2023"
+FEE = "Auditor's remuneration £000\nAudit of the company's annual accounts 245 230"
+WEAK = "Strategic report\nThe auditor was appointed at the last general meeting"
+
+
+@pytest.fixture
+def pdf(tmp_path: Path):
+    doc = fitz.open()
+    doc.new_page()
+    doc.save(tmp_path / "01234567_2023-03-31.pdf")
+    doc.close()
+    yield tmp_path / "01234567_2023-03-31.pdf"
+    close_all_pdf_documents()
+
+
+def _stub_stages(monkeypatch, texts):
+    """Replace the text/ocr stages with fixed pages; returns the (backend, page) pairs pulled."""
+    pulled = []
+
+    def pages(backend, pdf_path, ocr_max_pages):
+        for n, text in enumerate(texts.get(backend, [])):
+            pulled.append((backend, n))
+            yield n, text
+
+    recorded = []
+    monkeypatch.setattr(runner, "_cascade_pages", pages)
+    monkeypatch.setattr(runner, "record_filing_pages", lambda *args: recorded.append(args[:3] + (len(args[3]),)))
+    return pulled, recorded
+
+
+@pytest.mark.parametrize(
+    "texts, resolved_by, stages_run",
+    [
+        ({"text": [AUDITOR, FEE], "ocr": [AUDITOR, FEE]}, "text", ["text"]),
+        ({"text": [AUDITOR, WEAK], "ocr": [FEE]}, "ocr", ["text", "ocr"]),
+        ({"text": [WEAK], "ocr": [WEAK]}, "", ["text", "ocr"]),
+    ],
+    ids=["text-layer", "ocr-fills-fee", "escalate-to-mineru"],
+)
+def test_cascade_resolves_at_the_first_sufficient_stage(monkeypatch, pdf, texts, resolved_by, stages_run):
+    pulled, _ = _stub_stages(monkeypatch, texts)
+    stats = runner.new_cascade_stats(["text", "ocr", "mineru"])
+    fields, backend = runner.run_local_cascade(pdf, ["text", "ocr", "mineru"], stats)
+
+    assert backend == resolved_by
+    assert sorted({stage for stage, _ in pulled}, key=["text", "ocr"].index) == stages_run
+    assert [stats[b]["runs"] for b in ("text", "ocr", "mineru")] == [int(b in stages_run) for b in ("text", "ocr", "mineru")]
+    assert [stats[b]["hits"] for b in ("text", "ocr")] == [int(b == resolved_by) for b in ("text", "ocr")]
+    assert runner.cascade_needs_escalation(fields) == (resolved_by == "")
+    if resolved_by == "ocr":
+        # The OCR stage only fills what the text layer missed.
+        assert (fields["external_auditor"], fields["audit_fee"]) == ("KPMG", "245")
+
+
+def test_stage_stops_pulling_pages_once_fields_are_complete(monkeypatch, pdf):
+    pulled, recorded = _stub_stages(monkeypatch, {"text": [WEAK], "ocr": [AUDITOR, FEE, WEAK, WEAK]})
+    stats = runner.new_cascade_stats(["text", "ocr"])
+    _, backend = runner.run_local_cascade(pdf, ["text", "ocr"], stats, corpus_key=("01234567", "2023-03-31"))
+
+    assert backend == "ocr"
+    assert pulled == [("text", 0), ("ocr", 0), ("ocr", 1)]
+    # Only the pages each stage read reach the corpus / page index.
+    assert recorded == [("01234567", "2023-03-31", "text", 1), ("01234567", "2023-03-31", "ocr", 2)]
+
+
+def test_mineru_first_skips_the_local_stages(monkeypatch, pdf):
+    pulled, _ = _stub_stages(monkeypatch, {"text": [AUDITOR, FEE]})
+    stats = runner.new_cascade_stats(["mineru", "text"])
+    assert runner.run_local_cascade(pdf, ["mineru", "text"], stats)[1] == ""
+    assert pulled == [] and stats["text"]["runs"] == 0
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import run_tender_radar_mineru as runner
+from tender_radar import close_all_pdf_documents
+
+fitz = pytest.importorskip("fitz")
+
+
+def _make_pdf(path: Path, scanned: bool = False) -> Path:
+    doc = fitz.open()
+    for i in range(3):
+        page = doc.new_page()
+        if not scanned:
+            page.insert_text((50, 100), f"Independent auditor's report page {i} " * 3)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _reset(tmp_path: Path):
+    runner.configure_mineru_mode_cache(tmp_path / "mineru_modes.json")
+    yield
+    runner.configure_mineru_mode_cache(None)
+    close_all_pdf_documents()
+
+
+def _arg(cmd, flag: str) -> str:
+    return cmd[cmd.index(flag) + 1]
+
+
+def test_batch_groups_by_mode_moves_output_back_and_retries_missing(tmp_path: Path, monkeypatch):
+    downloads, outputs = tmp_path / "downloads", tmp_path / "mineru_outputs"
+    downloads.mkdir()
+    names = ["01_2024-03-31", "02_2024-03-31", "03_2024-03-31"]
+    jobs = [
+        (_make_pdf(downloads / f"{name}.pdf", scanned=name.startswith("03")), outputs / name)
+        for name in names
+    ]
+    calls = []
+
+    def fake_mineru(cmd, **kwargs):
+        src, out, method = Path(_arg(cmd, "-p")), Path(_arg(cmd, "-o")), _arg(cmd, "-m")
+        staged = sorted(p.stem for p in src.glob("*.pdf")) if src.is_dir() else [src.stem]
+        calls.append({"batch": src.is_dir(), "method": method, "stems": staged, "env": kwargs.get("env")})
+        for stem in staged:
+            if src.is_dir() and stem == "02_2024-03-31":
+                continue  # MinerU dropped this document from the batch
+            target = out / stem / method
+            target.mkdir(parents=True)
+            (target / f"{stem}.md").write_text(f"Auditor text for {stem}", encoding="utf-8")
+        return runner.subprocess.CompletedProcess(cmd, 0, "", "")
+
+    monkeypatch.setattr(runner.subprocess, "run", fake_mineru)
+    results = runner.run_mineru_batch(
+        jobs,
+        staging_root=outputs / "_staging",
+        batch_size=10,
+        backend="pipeline",
+        method="auto",
+        lang="en",
+        force_refresh=False,
+        device="cpu",
+        threads=2,
+    )
+
+    batches = [c for c in calls if c["batch"]]
+    # Born-digital and scanned PDFs never share a chunk, and each chunk runs its own method.
+    assert sorted((c["method"], c["stems"]) for c in batches) == [
+        ("ocr", ["03_2024-03-31"]),
+        ("txt", ["01_2024-03-31", "02_2024-03-31"]),
+    ]
+    assert all(c["env"]["OMP_NUM_THREADS"] == "2" for c in calls)
+    # The document missing from the batch output was retried on its own.
+    assert [c["stems"] for c in calls if not c["batch"]] == [["02_2024-03-31"]]
+
+    for name in names:
+        assert results[outputs / name] == f"Auditor text for {name}"
+        assert (outputs / name / runner.MINERU_MANIFEST).exists()
+    assert (outputs / "01_2024-03-31" / "01_2024-03-31" / "txt" / "01_2024-03-31.md").exists()
+    assert (outputs / "03_2024-03-31" / "03_2024-03-31" / "ocr" / "03_2024-03-31.md").exists()
+    assert not list((outputs / "_staging").iterdir())
+    sha = runner.pdf_sha256(jobs[2][0])
+    assert runner.mineru_mode_record(sha)["method"] == "ocr"
+
+
+def test_batch_starts_from_the_recorded_mode(tmp_path: Path, monkeypatch):
+    pdf = _make_pdf(tmp_path / "01_2024-03-31.pdf")
+    runner.record_mineru_mode(runner.pdf_sha256(pdf), {"status": "ok", "method": "ocr", "formula": False, "table": False})
+    calls = []
+
+    def fake_mineru(cmd, **kwargs):
+        calls.append((_arg(cmd, "-m"), _arg(cmd, "-f"), _arg(cmd, "-t"), kwargs.get("env")))
+        return runner.subprocess.CompletedProcess(cmd, 1, "", "boom")
+
+    monkeypatch.setattr(runner.subprocess, "run", fake_mineru)
+    runner.run_mineru_batch(
+        [(pdf, tmp_path / "out" / "01_2024-03-31")],
+        staging_root=tmp_path / "_staging",
+        batch_size=4,
+        backend="pipeline",
+        method="auto",
+        lang="en",
+        force_refresh=False,
+        device="cpu",
+    )
+    assert calls[0] == ("ocr", "False", "False", None)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from run_tender_radar_mineru import (
+    MINERU_MANIFEST,
+    configure_mineru_mode_cache,
+    load_cached_mineru_text,
+    mineru_adoptable_mode,
+    mineru_options_key,
+    record_mineru_mode,
+    write_mineru_manifest,
+)
+
+SHA = "ab" * 32
+
+
+@pytest.fixture
+def mode_cache(tmp_path):
+    configure_mineru_mode_cache(tmp_path / "mineru_modes.json")
+    yield
+    configure_mineru_mode_cache(None)
+
+
+def _slot(root: Path, name: str, text: str = "Independent auditor's report\nKPMG LLP") -> Path:
+    slot = root / name
+    (slot / "filing" / "auto").mkdir(parents=True)
+    (slot / "filing" / "auto" / "filing.md").write_text(text, encoding="utf-8")
+    return slot
+
+
+def test_options_key_is_stable_and_option_aware():
+    key = mineru_options_key("pipeline", "auto", "en", False, True, True)
+    assert key == mineru_options_key("pipeline", "auto", "en", 0, 1, 1)
+    assert len(key) == 12
+    assert key != mineru_options_key("pipeline", "ocr", "en", False, True, True)
+    assert key != mineru_options_key("pipeline", "auto", "en", False, True, False)
+
+
+def test_manifest_hit_and_option_miss(tmp_path):
+    slot = _slot(tmp_path, "01234567_2023-06-30")
+    key = mineru_options_key("pipeline", "auto", "en", False, True, True)
+    write_mineru_manifest(slot, SHA, key, {"method": "auto"})
+    manifest = json.loads((slot / MINERU_MANIFEST).read_text(encoding="utf-8"))
+    assert manifest["text_file"] == str(Path("filing/auto/filing.md"))
+    assert manifest["kind"] == "md"
+
+    assert load_cached_mineru_text(slot, SHA, key).endswith("KPMG LLP")
+    assert load_cached_mineru_text(slot, SHA, "other") == ""
+    assert load_cached_mineru_text(slot, "cd" * 32, key) == ""
+
+
+def test_same_pdf_in_a_new_slot_uses_the_hash_index(tmp_path):
+    first = _slot(tmp_path, "01234567_2023-06-30")
+    (first / "filing" / "auto" / "filing_content_list.json").write_text("[]", encoding="utf-8")
+    write_mineru_manifest(first, SHA, "k1", {"method": "txt"})
+    first_manifest = (first / MINERU_MANIFEST).read_text(encoding="utf-8")
+    fresh = tmp_path / "01234567_2023-07-15"
+    assert load_cached_mineru_text(fresh, SHA, "k1").endswith("KPMG LLP")
+    assert (tmp_path / "_by_hash" / f"{SHA}_k1.json").exists()
+
+    # The cached files are linked into the new slot, which gets its own manifest.
+    assert (fresh / "filing" / "auto" / "filing_content_list.json").read_text(encoding="utf-8") == "[]"
+    manifest = json.loads((fresh / MINERU_MANIFEST).read_text(encoding="utf-8"))
+    assert manifest["mode"]["method"] == "txt"
+    assert manifest["mode"]["linked_from"] == str(first.resolve())
+    assert (first / MINERU_MANIFEST).read_text(encoding="utf-8") == first_manifest
+    assert load_cached_mineru_text(fresh, SHA, "k1").endswith("KPMG LLP")
+
+
+def test_output_without_manifest_needs_a_verified_mode(tmp_path, mode_cache):
+    slot = _slot(tmp_path, "01234567_2023-06-30")
+    assert mineru_adoptable_mode(SHA, "auto", False, True) is None
+    assert load_cached_mineru_text(slot, SHA, "k1") == ""
+    assert not (slot / MINERU_MANIFEST).exists()
+
+    record_mineru_mode(SHA, {"status": "ok", "method": "txt", "formula": False, "table": True})
+    adopt_mode = mineru_adoptable_mode(SHA, "auto", False, True)
+    assert adopt_mode == {"method": "txt", "formula": False, "table": True}
+    assert load_cached_mineru_text(slot, SHA, "k1", adopt_mode).endswith("KPMG LLP")
+    manifest = json.loads((slot / MINERU_MANIFEST).read_text(encoding="utf-8"))
+    assert manifest["mode"] == {**adopt_mode, "adopted": True}
+    # Adopted under k1 only: another option set misses instead of re-adopting.
+    assert load_cached_mineru_text(slot, SHA, "k2", adopt_mode) == ""
+
+
+def test_adoption_rejects_modes_the_options_could_not_produce(mode_cache):
+    record_mineru_mode(SHA, {"status": "ok", "method": "ocr", "formula": True, "table": True})
+    assert mineru_adoptable_mode(SHA, "ocr", True, True) is not None
+    assert mineru_adoptable_mode(SHA, "txt", True, True) is None
+    assert mineru_adoptable_mode(SHA, "auto", False, True) is None
+    assert mineru_adoptable_mode(SHA, "auto", True, False) is None
+    record_mineru_mode(SHA, {"status": "poison", "failure": "other", "attempts": 3})
+    assert mineru_adoptable_mode(SHA, "ocr", True, True) is None
+
+
+def test_empty_output_is_not_cached(tmp_path):
+    slot = _slot(tmp_path, "01234567_2023-06-30", text="  ")
+    write_mineru_manifest(slot, SHA, "k1", {})
+    assert not (slot / MINERU_MANIFEST).exists()
+    assert load_cached_mineru_text(slot, SHA, "k1") == ""
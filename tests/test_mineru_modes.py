@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+import run_tender_radar_mineru as runner
+from run_tender_radar_mineru import (
+    classify_mineru_failure,
+    clear_mineru_failures,
+    configure_mineru_mode_cache,
+    mineru_failure_record,
+    mineru_mode_record,
+    mineru_poisoned,
+    record_mineru_mode,
+)
+
+
+@pytest.fixture
+def mode_cache(tmp_path: Path):
+    path = tmp_path / "mineru_modes.json"
+    configure_mineru_mode_cache(path)
+    yield path
+    configure_mineru_mode_cache(None)
+
+
+@pytest.mark.parametrize(
+    "returncode, stderr, expected",
+    [
+        (1, "ValueError: Unknown file suffix: .bin", "reserialize"),
+        (1, "MFR predict: 'NoneType' object has no attribute 'shape'", "formula"),
+        (0, "", "empty"),
+        (1, "MinerU worker timed out after 900s", "transient"),
+        (1, "MinerU worker exited", "transient"),
+        (-9, "", "transient"),
+        (1, "RuntimeError: CUDA out of memory", "transient"),
+        (1, "IndexError: list index out of range", "other"),
+    ],
+)
+def test_failure_classes(returncode, stderr, expected):
+    assert classify_mineru_failure(returncode, "", stderr) == expected
+
+
+def test_deterministic_failures_poison_at_once():
+    record = mineru_failure_record({}, ["other", "empty"], 2)
+    assert record["status"] == "poison"
+
+
+def test_transient_failures_count_before_poison(monkeypatch):
+    monkeypatch.setattr(runner, "MINERU_MAX_TRANSIENT_FAILURES", 3)
+    record: dict = {}
+    statuses = []
+    for _ in range(3):
+        record = mineru_failure_record(record, ["transient", "other"], 2)
+        statuses.append(record["status"])
+    assert statuses == ["retry", "retry", "poison"]
+    assert not mineru_poisoned({"status": "retry", "at": time.time()})
+
+
+def test_poison_expires(monkeypatch):
+    monkeypatch.setattr(runner, "MINERU_POISON_TTL_DAYS", 30)
+    assert mineru_poisoned({"status": "poison", "at": time.time() - 86400})
+    assert not mineru_poisoned({"status": "poison", "at": time.time() - 31 * 86400})
+    monkeypatch.setattr(runner, "MINERU_POISON_TTL_DAYS", 0)
+    assert mineru_poisoned({"status": "poison", "at": 0})
+
+
+def test_clear_failures_keeps_working_modes(mode_cache: Path):
+    record_mineru_mode("a" * 64, {"status": "ok", "method": "txt", "formula": False, "table": True})
+    record_mineru_mode("b" * 64, {"status": "poison", "failure": "other", "attempts": 3})
+    record_mineru_mode("c" * 64, {"status": "retry", "failure": "transient", "attempts": 1, "failures": 1})
+    assert clear_mineru_failures() == 2
+    assert mineru_mode_record("a" * 64)["method"] == "txt"
+    assert mineru_mode_record("b" * 64) == {}
+    assert set(json.loads(mode_cache.read_text(encoding="utf-8"))) == {"a" * 64}
+
+
+def test_killed_run_is_retried_next_time(tmp_path: Path, mode_cache: Path, monkeypatch):
+    pdf = tmp_path / "01234567_2024-03-31.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n%%EOF\n")
+    calls = []
+
+    def killed(cmd, **kwargs):
+        calls.append(cmd)
+        return runner.subprocess.CompletedProcess(cmd, -9, "", "")
+
+    monkeypatch.setattr(runner.subprocess, "run", killed)
+    options = dict(backend="pipeline", method="txt", lang="en", force_refresh=False, device="cpu")
+    assert runner.run_mineru_extract(pdf, tmp_path / "out", **options) == ""
+    first_calls = len(calls)
+    assert first_calls >= 1
+    assert mineru_mode_record(runner.pdf_sha256(pdf))["status"] == "retry"
+
+    assert runner.run_mineru_extract(pdf, tmp_path / "out", **options) == ""
+    assert len(calls) == 2 * first_calls
+
+
+@pytest.mark.parametrize(
+    "failure, requested, current, expected",
+    [
+        ("transient", "auto", ("txt", True, True), []),
+        ("transient", "ocr", ("ocr", False, False), []),
+        ("formula", "auto", ("ocr", True, True), [("ocr", False, True)]),
+        # Formula already off: treated like any other crash.
+        ("formula", "auto", ("ocr", False, True), [("ocr", False, False), ("txt", False, False)]),
+        ("empty", "auto", ("txt", True, False), [("ocr", True, True)]),
+        ("empty", "auto", ("auto", True, True), [("ocr", True, True), ("txt", True, True)]),
+        ("empty", "auto", ("ocr", True, True), [("txt", True, True)]),
+        ("empty", "ocr", ("ocr", True, True), [("txt", True, True)]),
+        ("other", "auto", ("ocr", True, True), [("ocr", False, False), ("txt", False, False)]),
+        ("other", "auto", ("ocr", False, False), [("txt", False, False)]),
+        ("other", "txt", ("txt", False, False), []),
+    ],
+)
+def test_next_attempts_per_failure_class(failure, requested, current, expected):
+    method, formula, table = current
+    assert runner._next_mineru_attempts(failure, requested, True, method, formula, table) == expected
+
+
+def test_transient_failure_stops_the_ladder(tmp_path, monkeypatch, mode_cache):
+    pdf = tmp_path / "01234567_2023-06-30.pdf"
+    pdf.write_bytes(b"%PDF-1.4\n")
+    calls = []
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return runner.subprocess.CompletedProcess(cmd, -9, "", "Killed")
+
+    monkeypatch.setattr(runner.subprocess, "run", fake_run)
+    monkeypatch.setattr(runner, "predict_mineru_method", lambda path, method: "txt")
+    out = runner.run_mineru_extract(
+        pdf, tmp_path / "out", backend="pipeline", method="auto", lang="en", force_refresh=False, device="cpu"
+    )
+    assert out == "" and len(calls) == 1
+    assert mineru_mode_record(runner.pdf_sha256(pdf))["status"] == "retry"
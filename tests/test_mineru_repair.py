@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import run_tender_radar_mineru as runner
+from tender_radar import close_all_pdf_documents, configure_pdf_index, pdf_info
+
+fitz = pytest.importorskip("fitz")
+
+
+def _make_pdf(path: Path, pages: int = 20) -> Path:
+    doc = fitz.open()
+    for i in range(pages):
+        text = "Independent auditor's report to the members of Example plc " * 2 if i == 12 else f"Directors' report {i} " * 8
+        doc.new_page().insert_text((50, 100), text)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _reset():
+    yield
+    configure_pdf_index(None)
+    runner.configure_mineru_mode_cache(None)
+    close_all_pdf_documents()
+
+
+def test_reserialize_repairs_source_and_rebuilds_subset(tmp_path: Path, monkeypatch):
+    downloads, output_dir = tmp_path / "downloads", tmp_path / "mineru_outputs" / "01234567_2024-03-31"
+    downloads.mkdir()
+    pdf = _make_pdf(downloads / "01234567_2024-03-31.pdf")
+    parsed = []
+
+    def unknown_suffix(cmd, **kwargs):
+        parsed.append(next(Path(arg) for arg in cmd if str(arg).endswith(".pdf")))
+        return runner.subprocess.CompletedProcess(cmd, 1, "", "ValueError: Unknown file suffix")
+
+    monkeypatch.setattr(runner.subprocess, "run", unknown_suffix)
+    runner.run_mineru_extract(
+        pdf, output_dir, backend="pipeline", method="txt", lang="en", force_refresh=False, device="cpu", subset_pages=True
+    )
+
+    repaired = list((downloads / ".repaired").glob("*/*.pdf"))
+    assert len(repaired) == 1
+    assert not list(output_dir.rglob(".repaired"))
+    subset = output_dir / "_subset" / pdf.name
+    assert parsed[:2] == [subset, subset]
+    assert runner.json.loads((output_dir / "page_map.json").read_text())["source_pdf"] == str(repaired[0])
+
+
+def test_mineru_output_is_not_indexed(tmp_path: Path):
+    outputs = tmp_path / "mineru_outputs"
+    outputs.mkdir()
+    conn = configure_pdf_index(tmp_path / "pdf_index.sqlite", exclude_dirs=[outputs])
+    kept, skipped = _make_pdf(tmp_path / "a.pdf", 2), _make_pdf(outputs / "b.pdf", 3)
+    assert pdf_info(kept)["page_count"] == 2
+    assert pdf_info(skipped)["page_count"] == 3
+    assert [r["path"] for r in conn.execute("SELECT path FROM pdf_index")] == [str(kept.resolve())]
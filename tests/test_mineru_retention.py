@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+
+from run_tender_radar_mineru import MINERU_MANIFEST, load_cached_mineru_text, slim_mineru_output, write_mineru_manifest
+
+SHA = "ab" * 32
+
+
+def test_slim_keeps_gzipped_text_and_content_list(tmp_path):
+    slot = tmp_path / "01234567_2023-06-30"
+    auto = slot / "filing" / "auto"
+    (auto / "images").mkdir(parents=True)
+    (auto / "filing.md").write_text("Independent auditor's report\nKPMG LLP\n" * 50, encoding="utf-8")
+    (auto / "filing_content_list.json").write_text(json.dumps([{"type": "text", "text": "KPMG LLP"}]), encoding="utf-8")
+    (auto / "images" / "page_1.jpg").write_bytes(b"\xff" * 4096)
+    (auto / "filing_layout.pdf").write_bytes(b"%PDF" * 1024)
+    (auto / "filing_model.json").write_text("{}", encoding="utf-8")
+    (slot / "page_map.json").write_text("[3, 41]", encoding="utf-8")
+    write_mineru_manifest(slot, SHA, "k1", {})
+
+    saved = slim_mineru_output(slot)
+    assert saved["bytes_saved"] > 0 and saved["inodes_saved"] >= 4
+
+    files = sorted(str(p.relative_to(slot)) for p in slot.rglob("*") if p.is_file())
+    assert files == sorted(
+        [
+            MINERU_MANIFEST,
+            "page_map.json",
+            "filing/auto/filing.md.gz",
+            "filing/auto/filing_content_list.json.gz",
+        ]
+    )
+    manifest = json.loads((slot / MINERU_MANIFEST).read_text(encoding="utf-8"))
+    assert (manifest["text_file"], manifest["retention"]) == ("filing/auto/filing.md.gz", "slim")
+    assert load_cached_mineru_text(slot, SHA, "k1").startswith("Independent auditor's report")
+
+
+def test_slim_without_manifest_is_a_no_op(tmp_path):
+    (tmp_path / "filing.md").write_text("text", encoding="utf-8")
+    assert slim_mineru_output(tmp_path) == {"bytes_saved": 0, "inodes_saved": 0}
+    assert (tmp_path / "filing.md").exists()
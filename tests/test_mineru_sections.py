@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from run_tender_radar_mineru import extract_report_sections, split_markdown_sections
+
+MARKDOWN = """Cover page text
+
+# Strategic report
+Revenue grew.
+
+# Independent auditor's report to the members of Example plc
+![](images/logo.jpg)
+Opinion paragraph.
+<table><tr><td>Materiality</td><td>1.2m</td></tr></table>
+
+## Basis for opinion
+Signed for and on behalf of KPMG LLP, Statutory Auditor
+
+# Consolidated income statement
+Revenue 1,000
+
+# Notes to the financial statements
+
+## 7. Auditor's remuneration
+<table><tr><td>Audit of the annual accounts</td><td>245</td></tr></table>
+
+## 8. Staff costs
+Wages 500
+"""
+
+
+def test_split_markdown_sections():
+    sections = split_markdown_sections(MARKDOWN)
+    assert sections[0] == ("", "Cover page text\n\n")
+    assert [h for h, _ in sections][1:4] == [
+        "Strategic report",
+        "Independent auditor's report to the members of Example plc",
+        "Basis for opinion",
+    ]
+    assert split_markdown_sections("") == []
+
+
+def test_report_and_fee_note_are_cut_out():
+    picked = extract_report_sections(MARKDOWN)
+    assert picked.startswith("Independent auditor's report")
+    assert "Signed for and on behalf of KPMG LLP" in picked
+    assert "Materiality" not in picked  # report tables dropped
+    assert "images/logo.jpg" not in picked
+    assert "7. Auditor's remuneration\n<table>" in picked  # fee note keeps its table
+    for dropped in ("Strategic report", "Revenue 1,000", "Staff costs"):
+        assert dropped not in picked
+
+
+def test_report_is_capped_and_missing_sections_give_empty():
+    long_report = "# Independent auditor's report\n" + "x" * 50 + "\n## Key audit matters\nmore\n## Other\nrest\n"
+    assert "more" not in extract_report_sections(long_report, max_report_chars=20)
+    assert extract_report_sections("# Strategic report\nNothing here") == ""
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import gzip
+import json
+from pathlib import Path
+
+from run_tender_radar_mineru import extract_fee_from_mineru_tables, html_table_rows, load_content_list_tables
+
+FEE_TABLE = (
+    "<table><tr><td></td><td>2023<br>£000</td><td>2022<br>£000</td></tr>"
+    "<tr><td>Fees payable to the company&#x27;s auditor for the audit of the annual accounts</td>"
+    "<td>245</td><td>230</td></tr>"
+    "<tr><td colspan=\"2\">Tax advisory services</td><td>10</td></tr></table>"
+)
+CONTENT_LIST = [
+    {"type": "text", "text": "Strategic report", "page_idx": 0},
+    {"type": "table", "table_body": "<table><tr><td>Revenue</td><td>1,000</td></tr></table>", "page_idx": 1},
+    {"type": "text", "text": "7. Auditor's remuneration", "page_idx": 1},
+    {"type": "table", "table_body": FEE_TABLE, "page_idx": 1, "source_page_idx": 41, "table_caption": ["Group"]},
+    {"type": "table", "table_body": "", "page_idx": 2},
+    "not an item",
+]
+
+
+def _write(output_dir: Path, items, gz: bool = False) -> None:
+    auto = output_dir / "filing" / "auto"
+    auto.mkdir(parents=True)
+    data = json.dumps(items).encode("utf-8")
+    if gz:
+        (auto / "filing_content_list.json.gz").write_bytes(gzip.compress(data))
+    else:
+        (auto / "filing_content_list.json").write_bytes(data)
+
+
+def test_html_table_rows_unescapes_cells_and_pads_colspans():
+    rows = html_table_rows(FEE_TABLE)
+    assert rows[0] == ["", "2023 £000", "2022 £000"]
+    assert rows[1][0] == "Fees payable to the company's auditor for the audit of the annual accounts"
+    assert rows[2] == ["Tax advisory services", "", "10"]
+    assert html_table_rows("") == []
+
+
+def test_load_content_list_tables_keeps_page_and_context(tmp_path):
+    _write(tmp_path, CONTENT_LIST)
+    tables = load_content_list_tables(tmp_path)
+    assert [t["page"] for t in tables] == [1, 41]
+    assert tables[0]["context"] == "Strategic report"
+    assert tables[1]["context"] == "7. Auditor's remuneration\nGroup"
+
+
+def test_fee_from_gzipped_content_list(tmp_path):
+    _write(tmp_path, CONTENT_LIST, gz=True)
+    found = extract_fee_from_mineru_tables(tmp_path)
+    assert (found["audit_fee"], found["prior_audit_fee"]) == ("245", "230")
+    assert (found["page"], found["source"], found["currency"], found["fee_unit"]) == ("41", "content_list", "GBP", "thousand")
+
+
+def test_no_fee_table_or_unreadable_content_list(tmp_path):
+    _write(tmp_path, CONTENT_LIST[:2])
+    assert extract_fee_from_mineru_tables(tmp_path) == {}
+    (tmp_path / "filing" / "auto" / "filing_content_list.json").write_text("{not json", encoding="utf-8")
+    assert load_content_list_tables(tmp_path) == []
+    assert extract_fee_from_mineru_tables(tmp_path / "missing") == {}
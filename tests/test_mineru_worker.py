@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+import run_tender_radar_mineru as runner
+from run_tender_radar_mineru import mineru_worker_parse, start_mineru_worker, stop_mineru_worker
+
+
+class FakeProcess:
+    """Stands in for the spawned worker; the test answers its job queue by hand."""
+
+    started = []
+
+    def __init__(self, target, args, daemon):
+        self.jobs, self.results = args[0], args[1]
+        self.alive = False
+
+    def start(self):
+        self.alive = True
+        FakeProcess.started.append(self)
+
+    def is_alive(self):
+        return self.alive
+
+    def join(self, timeout=None):
+        pass
+
+    def terminate(self):
+        self.alive = False
+
+
+@pytest.fixture
+def worker(monkeypatch):
+    FakeProcess.started = []
+    ctx = SimpleNamespace(Queue=queue.Queue, Process=FakeProcess)
+    monkeypatch.setattr(runner.multiprocessing, "get_context", lambda method: ctx)
+    monkeypatch.setattr(runner, "_MINERU_WORKER_POLL_S", 0.02)
+    assert start_mineru_worker()
+    yield FakeProcess.started[0]
+    stop_mineru_worker(timeout=0)
+
+
+def _parse(name: str, timeout: float = 5.0):
+    return mineru_worker_parse(
+        f"{name}.pdf", f"out/{name}", backend="pipeline", method="auto", lang="en", formula=False, table=True, timeout=timeout
+    )
+
+
+def _answer(proc: FakeProcess, jobs: int, reverse: bool = False) -> threading.Thread:
+    def run():
+        received = [proc.jobs.get(timeout=5) for _ in range(jobs)]
+        for job in reversed(received) if reverse else received:
+            proc.results.put({"id": job["id"], "returncode": 0, "stdout": "", "stderr": job["pdf_path"]})
+
+    t = threading.Thread(target=run)
+    t.start()
+    return t
+
+
+def test_concurrent_callers_get_their_own_results(worker):
+    responder = _answer(worker, 4, reverse=True)
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(_parse, ["a", "b", "c", "d"]))
+    responder.join()
+    assert results == [(0, "", f"{n}.pdf") for n in "abcd"]
+    assert runner._MINERU_WORKER["pending"] == {}
+
+
+def test_result_for_another_job_is_stashed_not_dropped(worker):
+    worker.results.put({"id": 999, "returncode": 1, "stdout": "", "stderr": "late"})
+    responder = _answer(worker, 1)
+    assert _parse("a") == (0, "", "a.pdf")
+    responder.join()
+    assert runner._MINERU_WORKER["pending"][999]["stderr"] == "late"
+
+
+def test_timeout_restarts_the_worker(worker):
+    rc, _, stderr = _parse("a", timeout=0.1)
+    assert rc == 1 and "timed out" in stderr
+    assert len(FakeProcess.started) == 2 and not worker.alive
+    assert runner._MINERU_WORKER["process"] is FakeProcess.started[1]
+
+    responder = _answer(FakeProcess.started[1], 1)
+    assert _parse("b") == (0, "", "b.pdf")
+    responder.join()
+
+
+def test_job_lost_to_a_restart_fails_fast(worker):
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        slow = pool.submit(_parse, "slow", 0.1)
+        queued = pool.submit(_parse, "queued", 30.0)
+        assert "timed out" in slow.result(timeout=5)[2]
+        rc, _, stderr = queued.result(timeout=5)
+    assert rc == 1 and "worker exited" in stderr
+
+
+def test_exited_worker_is_reported(worker):
+    worker.alive = False
+    rc, _, stderr = _parse("a")
+    assert (rc, stderr) == (1, "MinerU worker exited")
+    assert runner.classify_mineru_failure(rc, "", stderr) == "transient"
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import tender_radar
+from tender_radar import close_all_pdf_documents, iter_ocr_targeted_pages
+
+fitz = pytest.importorskip("fitz")
+
+# Low-zoom word confidences per page: 1 is uniformly poor, 2 has a poor key token
+# ("auditor") among otherwise clean words, the rest read cleanly.
+LOW_CONFIDENCE = {
+    1: [("Directors", 40.0), ("report", 45.0)],
+    2: [("Independent", 96.0), ("auditor's", 52.0), ("report", 97.0), ("KPMG", 95.0)],
+}
+
+
+def _make_scan(path: Path, pages: int = 4) -> Path:
+    doc = fitz.open()
+    for _ in range(pages):
+        doc.new_page()
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def ocr_calls(monkeypatch):
+    calls = {"low": [], "high": []}
+
+    def fake_words(doc, page_index, zoom):
+        calls["low"].append((page_index, zoom))
+        words = LOW_CONFIDENCE.get(page_index, [("Strategic", 93.0), ("report", 91.0)])
+        return (f"low {page_index}", words, [])
+
+    def fake_text(doc, page_index, zoom=2.2):
+        calls["high"].append((page_index, zoom))
+        return f"high {page_index}"
+
+    monkeypatch.setattr(tender_radar, "_ocr_page_words", fake_words)
+    monkeypatch.setattr(tender_radar, "_ocr_page_text", fake_text)
+    yield calls
+    close_all_pdf_documents()
+
+
+def test_confident_pages_stay_at_low_zoom_and_poor_pages_escalate(tmp_path: Path, ocr_calls):
+    stats: dict = {}
+    pages = dict(
+        iter_ocr_targeted_pages(
+            _make_scan(tmp_path / "scan.pdf"), adaptive=True, low_zoom=1.6, high_zoom=2.3, min_confidence=70.0, stats=stats
+        )
+    )
+
+    assert pages == {0: "low 0", 1: "high 1", 2: "high 2", 3: "low 3"}
+    assert ocr_calls["high"] == [(1, 2.3), (2, 2.3)]
+    # Every page is OCRed once at low zoom; sparse-pass results are reused by the dense pass.
+    assert sorted(ocr_calls["low"]) == [(p, 1.6) for p in range(4)]
+    assert (stats["pages"], stats["escalated"]) == (4.0, 2.0)
+
+
+def test_without_adaptive_every_page_is_read_at_high_zoom(tmp_path: Path, ocr_calls):
+    pages = dict(iter_ocr_targeted_pages(_make_scan(tmp_path / "scan.pdf"), low_zoom=1.6, high_zoom=2.3))
+    assert pages == {p: f"high {p}" for p in range(4)}
+    assert ocr_calls["low"] == []
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import tender_radar
+from tender_radar import _tesseract_cached, configure_ocr_cache
+
+pytest.importorskip("PIL")
+
+
+class FakeTesseract:
+    Output = SimpleNamespace(DICT="dict")
+
+    def __init__(self):
+        self.calls = 0
+
+    def get_tesseract_version(self):
+        return "fake"
+
+    def image_to_string(self, img, lang="eng"):
+        self.calls += 1
+        return "Auditor's remuneration " * 20
+
+
+def _pix(n: int):
+    return SimpleNamespace(width=2, height=2, samples=bytes([n % 256, n // 256] * 6))
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path):
+    configure_ocr_cache(tmp_path, max_mb=0.02)
+    yield tmp_path
+    configure_ocr_cache(None)
+
+
+def test_hit_skips_tesseract(cache_dir: Path):
+    tess = FakeTesseract()
+    first = _tesseract_cached(tess, _pix(1), 2.0, "string")
+    assert _tesseract_cached(tess, _pix(1), 2.0, "string") == first
+    assert tess.calls == 1
+
+
+def test_concurrent_writes_keep_size_accounting(cache_dir: Path):
+    tess = FakeTesseract()
+    jobs = [n % 300 for n in range(1200)]  # overlapping keys race on the same file
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda n: _tesseract_cached(tess, _pix(n), 2.0, "string"), jobs))
+
+    files = list(cache_dir.glob("*/*.json"))
+    assert not list(cache_dir.glob("*/*.tmp"))
+    assert tender_radar._OCR_CACHE["size"] == sum(fp.stat().st_size for fp in files)
+    assert tender_radar._OCR_CACHE["size"] <= tender_radar._OCR_CACHE["max_bytes"]
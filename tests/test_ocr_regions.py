@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import sys
+from types import SimpleNamespace
+
+import fitz
+import pytest
+
+import tender_radar
+from tender_radar import _ocr_candidate_regions, _ocr_page_words, _render_page
+
+ZOOM = 1.5
+
+
+def _doc(rotation: int):
+    doc = fitz.open()
+    page = doc.new_page(width=595, height=842)
+    page.set_rotation(rotation)
+    # Text is drawn so it reads upright once /Rotate is applied, like a scanned landscape page.
+    for point, line in (((60, 450), "Signed for and on behalf of Smith & Co LLP"), ((60, 60), "Note 7 Auditor's remuneration")):
+        page.insert_text(fitz.Point(point) * page.derotation_matrix, line, fontsize=11, rotate=rotation)
+    return doc
+
+
+def _fake_tesseract(page):
+    """TSV data as Tesseract would report it for the rendered pixmap: pixel boxes of each word."""
+    data = {k: [] for k in ("text", "conf", "block_num", "par_num", "line_num", "left", "top", "width", "height")}
+    for x0, y0, x1, y1, word, block, line, _ in page.get_text("words"):
+        box = fitz.Rect(x0, y0, x1, y1) * page.rotation_matrix * fitz.Matrix(ZOOM, ZOOM)
+        for key, value in zip(data, (word, 95.0, block, 0, line, box.x0, box.y0, box.width, box.height)):
+            data[key].append(value)
+    return data
+
+
+def _ink(doc, clip) -> int:
+    pix = _render_page(doc, 0, 1.0, clip=clip)
+    return sum(1 for i in range(0, len(pix.samples), 3) if pix.samples[i] < 128)
+
+
+@pytest.mark.parametrize("rotation", [0, 90, 270])
+def test_candidate_regions_cover_the_lines_on_rotated_and_unrotated_pages(monkeypatch, rotation):
+    doc = _doc(rotation)
+    page = doc[0]
+    data = _fake_tesseract(page)
+    monkeypatch.setitem(sys.modules, "pytesseract", SimpleNamespace(pytesseract=SimpleNamespace()))
+    monkeypatch.setattr(tender_radar, "_tesseract_cached", lambda _pt, _pix, _zoom, _kind: data)
+
+    text, words, line_boxes = _ocr_page_words(doc, 0, ZOOM)
+    assert "on behalf of" in text and len(words) == len(data["text"])
+    for _, rect in line_boxes:
+        assert page.rect.contains(rect)
+
+    regions = _ocr_candidate_regions(page.rect, line_boxes)
+    assert len(regions) == 2
+    for clip in regions:
+        assert not clip.is_empty and page.rect.contains(clip)
+        assert _ink(doc, clip) > 0
+    # The signature crop is narrower than the page; the fee crop spans its full width.
+    fee, signature = sorted(regions, key=lambda r: r.width, reverse=True)
+    assert fee.width == page.rect.width
+    assert signature.width < page.rect.width
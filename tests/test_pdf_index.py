@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+import tender_radar
+from tender_radar import (
+    close_all_pdf_documents,
+    configure_pdf_index,
+    file_sha256,
+    index_pdf,
+    open_pdf_index,
+    pdf_info,
+    pdf_sha256,
+    refresh_pdf_index,
+    repaired_pdf_path,
+)
+
+fitz = pytest.importorskip("fitz")
+
+
+def _make_pdf(path: Path, pages=("Independent auditor's report " * 5,)) -> Path:
+    doc = fitz.open()
+    for text in pages:
+        page = doc.new_page()
+        if text:
+            page.insert_text((50, 100), text)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture
+def conn(tmp_path: Path):
+    conn = open_pdf_index(tmp_path / "pdf_index.sqlite")
+    yield conn
+    conn.close()
+    close_all_pdf_documents()
+
+
+def test_index_row_facts(tmp_path: Path, conn):
+    pdf = _make_pdf(tmp_path / "01234567_2024-03-31.pdf", pages=("Auditor's report " * 5, "", ""))
+    row = index_pdf(conn, pdf)
+    assert row["path"] == str(pdf.resolve())
+    assert row["page_count"] == 3
+    assert row["text_coverage"] == pytest.approx(0.333)
+    assert len(row["sha256"]) == 64
+
+
+def test_unchanged_file_is_not_reindexed(tmp_path: Path, conn):
+    pdf = _make_pdf(tmp_path / "a.pdf")
+    first = index_pdf(conn, pdf)
+    assert index_pdf(conn, pdf)["indexed_at"] == first["indexed_at"]
+    assert index_pdf(conn, pdf, force=True)["indexed_at"] > first["indexed_at"]
+
+
+def test_refresh_counts_changes_and_drops_deleted(tmp_path: Path, conn):
+    a, b = _make_pdf(tmp_path / "a.pdf"), _make_pdf(tmp_path / "b.pdf")
+    assert refresh_pdf_index(conn, [tmp_path]) == 2
+    assert refresh_pdf_index(conn, [tmp_path]) == 0
+
+    _make_pdf(a, pages=("one", "two"))
+    os.utime(a, ns=(a.stat().st_atime_ns, a.stat().st_mtime_ns + 10**9))
+    b.unlink()
+    assert refresh_pdf_index(conn, [tmp_path]) == 1
+    assert [r["path"] for r in conn.execute("SELECT path FROM pdf_index")] == [str(a.resolve())]
+
+
+def test_unreadable_pdf_is_not_indexed(tmp_path: Path, conn):
+    bad = tmp_path / "bad.pdf"
+    bad.write_bytes(b"not a pdf")
+    assert index_pdf(conn, bad) == {}
+    assert index_pdf(conn, tmp_path / "missing.pdf") == {}
+
+
+def test_pdf_info_reads_configured_index(tmp_path: Path):
+    pdf = _make_pdf(tmp_path / "a.pdf", pages=("", ""))
+    configure_pdf_index(tmp_path / "idx.sqlite")
+    try:
+        info = pdf_info(pdf)
+        assert (info["page_count"], info["text_coverage"]) == (2, 0.0)
+    finally:
+        configure_pdf_index(None)
+        close_all_pdf_documents()
+
+
+def test_sha_without_index_is_hashed_once_per_file_version(tmp_path: Path, monkeypatch):
+    pdf = _make_pdf(tmp_path / "a.pdf")
+    hashed = []
+    monkeypatch.setattr(tender_radar, "file_sha256", lambda path: hashed.append(path) or file_sha256(path))
+    try:
+        sha = pdf_sha256(pdf)
+        assert repaired_pdf_path(pdf).parent.name == sha == pdf_sha256(pdf)
+        assert len(hashed) == 1
+        _make_pdf(pdf, pages=("Directors' report " * 5,))
+        os.utime(pdf, ns=(1, 1))
+        assert pdf_sha256(pdf) != sha
+        assert len(hashed) == 2
+        assert pdf_sha256(tmp_path / "missing.pdf") == ""
+    finally:
+        close_all_pdf_documents()
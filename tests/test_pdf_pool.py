@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+import tender_radar
+from tender_radar import close_all_pdf_documents, get_pdf_document, pdf_document, release_pdf_document
+
+fitz = pytest.importorskip("fitz")
+
+
+def _make_pdf(path: Path, text: str = "Auditor's remuneration") -> Path:
+    doc = fitz.open()
+    doc.new_page().insert_text((50, 100), text)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _empty_pool():
+    close_all_pdf_documents()
+    yield
+    close_all_pdf_documents()
+    tender_radar._PDF_POOL_RETIRED.clear()
+
+
+def test_nested_scopes_share_and_owner_closes(tmp_path: Path):
+    pdf = _make_pdf(tmp_path / "a.pdf")
+    with pdf_document(pdf) as outer:
+        with pdf_document(pdf) as inner:
+            assert inner is outer
+        assert not outer.is_closed
+    assert outer.is_closed
+    assert not tender_radar._PDF_POOL
+
+
+def test_owner_exit_waits_for_other_holders(tmp_path: Path):
+    pdf = _make_pdf(tmp_path / "a.pdf")
+    with pdf_document(pdf) as doc:
+        held = get_pdf_document(pdf)  # e.g. a worker thread mid-read
+    assert held is doc and not doc.is_closed
+    assert doc.get_page_text(0).startswith("Auditor")
+    release_pdf_document(pdf, held)
+    assert doc.is_closed
+
+
+def test_eviction_skips_referenced_handles(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(tender_radar, "PDF_POOL_MAX_OPEN", 1)
+    a, b = _make_pdf(tmp_path / "a.pdf"), _make_pdf(tmp_path / "b.pdf")
+    doc_a = get_pdf_document(a)
+    doc_b = get_pdf_document(b)
+    assert not doc_a.is_closed and not doc_b.is_closed
+    release_pdf_document(a, doc_a)
+    doc_c = get_pdf_document(_make_pdf(tmp_path / "c.pdf"))
+    assert doc_a.is_closed  # idle and least recently used
+    assert not doc_b.is_closed and not doc_c.is_closed
+
+
+def test_changed_file_reopens_without_closing_held_handle(tmp_path: Path):
+    pdf = _make_pdf(tmp_path / "a.pdf")
+    old = get_pdf_document(pdf)
+    _make_pdf(tmp_path / "b.pdf", "Independent auditor's report").replace(pdf)
+    with pdf_document(pdf) as new:
+        assert new is not old
+        assert new.get_page_text(0).startswith("Independent")
+    assert not old.is_closed
+    release_pdf_document(pdf, old)
+    assert old.is_closed and not tender_radar._PDF_POOL_RETIRED
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from tender_radar import extract_fee_from_table_rows, extract_remuneration_table
+
+fitz = pytest.importorskip("fitz")
+
+
+def test_single_row_fee_with_year_header():
+    rows = [
+        ["", "2023", "2022"],
+        ["Fees payable to the company's auditor for the audit of the annual accounts", "245", "230"],
+        ["Tax advisory services", "12", "10"],
+    ]
+    found = extract_fee_from_table_rows(rows)
+    assert (found["audit_fee"], found["year"], found["prior_audit_fee"], found["prior_year"]) == ("245", "2023", "230", "2022")
+
+
+def test_wrapped_fee_label_joins_next_row():
+    rows = [
+        ["Fees payable to the company's auditor for the audit"],
+        ["of the company's annual accounts", "245", "230"],
+    ]
+    found = extract_fee_from_table_rows(rows)
+    assert found["audit_fee"] == "245"
+    assert found["label"].endswith("annual accounts")
+
+
+def test_wrapped_label_does_not_join_excluded_row():
+    rows = [["Fees payable to the company's auditor for the audit"], ["Tax advisory services", "12", "10"]]
+    assert extract_fee_from_table_rows(rows) == {}
+
+
+def test_wrapped_label_from_pdf_words(tmp_path: Path):
+    doc = fitz.open()
+    page = doc.new_page()
+    page.insert_text((50, 100), "Note 6 Auditor's remuneration")
+    page.insert_text((300, 120), "2023")
+    page.insert_text((380, 120), "2022")
+    page.insert_text((300, 134), "£000")
+    page.insert_text((380, 134), "£000")
+    page.insert_text((50, 152), "Fees payable to the company's auditor for the audit")
+    page.insert_text((50, 166), "of the company's annual accounts")
+    page.insert_text((300, 166), "245")
+    page.insert_text((380, 166), "230")
+    pdf = tmp_path / "wrapped.pdf"
+    doc.save(pdf)
+
+    found = extract_remuneration_table(pdf)
+    assert (found["audit_fee"], found["year"], found["currency"], found["fee_unit"]) == ("245", "2023", "GBP", "thousand")
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from run_tender_radar_mineru import mineru_thread_env
+from tender_radar import (
+    close_all_pdf_documents,
+    find_candidate_pages,
+    iter_pdf_pages_sampled,
+    pdf_document,
+    pdf_text_coverage,
+    write_pdf_subset,
+)
+
+fitz = pytest.importorskip("fitz")
+
+
+def _make_pdf(path: Path, pages: int = 30) -> Path:
+    doc = fitz.open()
+    for i in range(pages):
+        text = "Independent auditor's report to the members of Example plc " * 2 if i % 7 == 3 else f"Strategic report page {i} " * 8
+        doc.new_page().insert_text((50, 100), text)
+    doc.save(path)
+    doc.close()
+    return path
+
+
+def test_other_threads_open_pdfs_inside_a_pdf_document_scope(tmp_path: Path):
+    held, other = _make_pdf(tmp_path / "a.pdf", pages=1), _make_pdf(tmp_path / "b.pdf", pages=3)
+
+    def read_other():
+        with pdf_document(other) as doc:
+            return doc.page_count, len(list(iter_pdf_pages_sampled(held)))
+
+    with pdf_document(held):
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            assert pool.submit(read_other).result(timeout=5) == (3, 1)
+    close_all_pdf_documents()
+
+
+def test_suspended_page_generator_does_not_block_other_threads(tmp_path: Path):
+    pdf = _make_pdf(tmp_path / "a.pdf", pages=4)
+    pages = iter_pdf_pages_sampled(pdf)
+    assert next(pages)[0] == 0
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        assert pool.submit(pdf_text_coverage, pdf).result(timeout=5) == 1.0
+    assert [p for p, _ in pages] == [1, 2, 3]
+    close_all_pdf_documents()
+
+
+def test_pool_pre_work_alongside_main_thread_reads(tmp_path: Path):
+    pdfs = [_make_pdf(tmp_path / f"{n}.pdf") for n in range(4)]
+    expected = [list(iter_pdf_pages_sampled(pdf)) for pdf in pdfs]
+
+    def pre_work(n: int) -> bool:
+        pdf = pdfs[n % len(pdfs)]
+        pages = find_candidate_pages(pdf)
+        pdf_text_coverage(pdf)
+        return write_pdf_subset(pdf, pages, tmp_path / f"subset_{n}.pdf")
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        futures = [pool.submit(pre_work, n) for n in range(16)]
+        for _ in range(4):
+            for pdf, pages in zip(pdfs, expected):
+                with pdf_document(pdf):
+                    assert list(iter_pdf_pages_sampled(pdf)) == pages
+        assert all(f.result(timeout=60) for f in futures)
+    close_all_pdf_documents()
+
+
+def test_thread_env_caps_openmp_and_blas_only():
+    env = mineru_thread_env(2)
+    assert env["OMP_NUM_THREADS"] == env["MKL_NUM_THREADS"] == "2"
+    assert env.get("TORCH_NUM_THREADS") == os.environ.get("TORCH_NUM_THREADS")
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import csv
+from pathlib import Path
+
+import pytest
+
+import run_tender_radar_mineru as runner
+from tender_radar import configure_corpus, corpus_append, load_corpus_index
+
+AUDITOR = "Signed for and on behalf of KPMG LLP, Statutory Auditor\nFor the year ended 31 March 2023"
+FEE = "Auditor's remuneration £000\nAudit of the company's annual accounts 245 230"
+HISTORY_FIELDS = ["company_number", "company", "year", "external_auditor", "audit_fee", "filing_date", "pdf_path"]
+
+
+@pytest.fixture
+def corpus(tmp_path: Path):
+    path = configure_corpus(tmp_path / "corpus")
+    yield path
+    configure_corpus(None)
+
+
+def _mineru_slot(root: Path, name: str, text: str) -> Path:
+    slot = root / name
+    (slot / name / "auto").mkdir(parents=True)
+    (slot / name / "auto" / f"{name}.md").write_text(text, encoding="utf-8")
+    return slot
+
+
+def _job(corpus=(), output_dir: str = "") -> dict:
+    return {
+        "company_number": "01234567",
+        "company": "Example plc",
+        "filing_date": "2023-06-30",
+        "pdf_path": "downloads/01234567_2023-06-30.pdf",
+        "output_dir": output_dir,
+        "corpus": list(corpus),
+    }
+
+
+def test_filing_replays_corpus_pages_and_skips_mineru_once_resolved(tmp_path: Path, corpus):
+    corpus_append("01234567", "2023-06-30", "text", [(2, AUDITOR), (3, FEE)])
+    (entry,) = load_corpus_index(corpus)
+    slot = _mineru_slot(tmp_path / "mineru_outputs", "01234567_2023-06-30", "Signed for and on behalf of Deloitte LLP")
+
+    row = runner._re_extract_filing(_job([(str(corpus), entry["offset"])], str(slot)))
+    assert (row["external_auditor"], row["audit_fee"], row["year"]) == ("KPMG", "245", "2023")
+    assert (row["company"], row["pdf_path"]) == ("Example plc", "downloads/01234567_2023-06-30.pdf")
+
+
+def test_filing_falls_back_to_the_mineru_slot(tmp_path: Path):
+    slot = _mineru_slot(tmp_path / "mineru_outputs", "01234567_2023-06-30", f"{AUDITOR}\n\n{FEE}")
+    row = runner._re_extract_filing(_job(output_dir=str(slot)))
+    assert (row["external_auditor"], row["audit_fee"]) == ("KPMG", "245")
+
+
+def test_filing_without_stored_text_returns_none(tmp_path: Path):
+    (tmp_path / "empty_slot").mkdir()
+    assert runner._re_extract_filing(_job(output_dir=str(tmp_path / "empty_slot"))) is None
+    assert runner._re_extract_filing(_job()) is None
+
+
+def test_history_is_rebuilt_from_stored_text_and_keeps_rows_without_it(tmp_path: Path, corpus):
+    outputs = tmp_path / "mineru_outputs"
+    _mineru_slot(outputs, "01234567_2023-06-30", f"{AUDITOR}\n\n{FEE}")
+    (outputs / "_by_hash").mkdir()  # not a filing slot
+    corpus_append("07654321", "2022-12-31", "ocr", [(5, AUDITOR.replace("KPMG", "Mazars")), (6, FEE)])
+    history = tmp_path / "tender_history.csv"
+    with history.open("w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=HISTORY_FIELDS)
+        writer.writeheader()
+        writer.writerow({"company_number": "01234567", "company": "Example plc", "filing_date": "2023-06-30",
+                         "external_auditor": "Old Auditor", "pdf_path": "elsewhere/a.pdf"})
+        writer.writerow({"company_number": "09999999", "company": "Untouched Ltd", "filing_date": "2021-03-31",
+                         "external_auditor": "BDO", "audit_fee": "50"})
+
+    rows, stats = runner.re_extract_history(
+        outputs, history, tmp_path / "downloads", corpus_dir=tmp_path / "corpus", workers=1, auditor_registry=None
+    )
+    by_key = {(r["company_number"], r["filing_date"]): r for r in rows}
+    assert stats == {"filings": 2, "re_extracted": 2, "kept": 1}
+    assert by_key[("01234567", "2023-06-30")]["external_auditor"] == "KPMG"
+    assert by_key[("01234567", "2023-06-30")]["company"] == "Example plc"
+    assert by_key[("01234567", "2023-06-30")]["pdf_path"] == "elsewhere/a.pdf"
+    assert by_key[("07654321", "2022-12-31")]["external_auditor"] == "Mazars"
+    assert by_key[("07654321", "2022-12-31")]["pdf_path"] == str(tmp_path / "downloads" / "07654321_2022-12-31.pdf")
+    assert by_key[("09999999", "2021-03-31")]["external_auditor"] == "BDO"
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import json
+import re
+import time
+from pathlib import Path
+
+import pytest
+
+import tender_radar
+from tender_radar import _first_match, configure_field_extraction, extract_fields
+
+# Every line offers auditor and fee anchors ("independent auditor", "for and on behalf of",
+# "audit of the") that fail to match, the shape that made per-anchor re2 calls quadratic.
+FAILED_ANCHORS = "Independent auditor report for and on behalf of the board. Audit of the accounts noted.\n"
+
+
+@pytest.fixture
+def engine():
+    saved = dict(tender_radar._FIELD_EXTRACTION)
+    yield configure_field_extraction
+    configure_field_extraction(str(saved["engine"]), budget_s=float(saved["budget_s"]))
+
+
+class _CountingPattern:
+    """Non-re pattern object (as re2 returns) recording the calls made on it."""
+
+    def __init__(self, source: str) -> None:
+        self._pattern = re.compile(source)
+        self.calls = []
+
+    def match(self, text, pos=0):
+        self.calls.append(("match", pos))
+        return self._pattern.match(text, pos)
+
+    def search(self, text, pos=0):
+        self.calls.append(("search", pos))
+        return self._pattern.search(text, pos)
+
+
+def test_non_re_pattern_runs_one_whole_text_search():
+    text = "audit " * 200 + "audit fee 5"
+    pattern = _CountingPattern(r"audit fee (\d)")
+    m = _first_match(pattern, text, range(0, len(text), 6))
+    assert m.group(1) == "5"
+    assert pattern.calls == [("search", 0)]
+
+
+def test_re_pattern_falls_back_to_search_after_anchor_limit():
+    text = "audit " * 200 + "audit fee 5"
+    starts = list(range(0, len(text), 6))
+    m = _first_match(re.compile(r"audit fee (\d)"), text, starts)
+    assert m.start() == text.index("audit fee")
+
+
+def test_re2_matches_golden_fields(engine):
+    pytest.importorskip("re2")
+    assert engine("re2", budget_s=0) == "re2"
+    golden = json.loads((Path(__file__).parent / "data" / "field_extraction_golden.json").read_text(encoding="utf-8"))
+    for case in golden:
+        assert extract_fields(case["text"], case["filing_date"]) == case["expected"]
+
+
+def test_re2_is_not_slower_on_failed_anchors(engine):
+    pytest.importorskip("re2")
+    text = FAILED_ANCHORS * 4000
+
+    def best(name):
+        engine(name, budget_s=0)
+        times = []
+        for _ in range(3):
+            t0 = time.perf_counter()
+            fields = extract_fields(text)
+            times.append(time.perf_counter() - t0)
+        return min(times), fields
+
+    re_time, re_fields = best("re")
+    re2_time, re2_fields = best("re2")
+    assert re2_fields == re_fields
+    assert re2_time <= re_time
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import sqlite3
+import sys
+
+import pytest
+
+import search_filings
+from search_filings import amounts_near, backfill
+from tender_radar import (
+    configure_corpus,
+    corpus_append,
+    index_filing_pages,
+    open_page_index,
+    parse_filing_stem,
+    search_pages,
+)
+
+FEE_NOTE = (
+    "Auditor's remuneration. Fees payable to the company's auditor for the audit of the "
+    "annual accounts were £2m (2022: £1.8m)."
+)
+FEE_TABLE = "Auditor's remuneration £000 2023 2022\nAudit of the company's annual accounts 245 230"
+
+
+@pytest.fixture
+def conn(tmp_path):
+    conn = open_page_index(tmp_path / "page_index.sqlite")
+    index_filing_pages(conn, "01234567", "2023-06-30", "text", [(0, "Strategic report"), (5, FEE_NOTE)])
+    index_filing_pages(conn, "SC123456", "2022-12-31", "ocr", [(9, FEE_TABLE)])
+    yield conn
+    conn.close()
+
+
+def _row(text: str, token: str):
+    start = text.index(token)
+    return {"text": text, "hits": [(start, start + len(token))]}
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Audit fee £2m for the year", [2_000_000.0]),
+        ("Audit fee £5 million", [5_000_000.0]),
+        ("Audit fee £12m (2022: £1.5bn)", [12_000_000.0, 1_500_000_000.0]),
+        ("Audit fee 250k", [250_000.0]),
+        ("Audit fee £45", [45.0]),
+        ("Audit fee £1,250,000", [1_250_000.0]),
+    ],
+)
+def test_amounts_near_reads_pound_and_suffix_amounts(text, expected):
+    assert amounts_near(_row(text, "fee"), 40) == expected
+
+
+def test_amounts_near_skips_years_and_note_numbers_and_uses_page_unit():
+    text = "Note 7 Auditor's remuneration £000 2023 2022 audit fee 245 230"
+    assert amounts_near(_row(text, "audit fee"), 20) == [245_000.0, 230_000.0]
+
+
+def test_amounts_near_only_looks_inside_the_window():
+    text = "audit fee" + " " * 50 + "£2m"
+    assert amounts_near(_row(text, "audit fee"), 10) == []
+    assert amounts_near(_row(text, "audit fee"), 60) == [2_000_000.0]
+
+
+def test_search_pages_ranks_filters_and_reports_hits(conn):
+    rows = search_pages('"audit of the" AND auditor*', conn=conn)
+    assert {(r["company_number"], r["page"]) for r in rows} == {("01234567", 5), ("SC123456", 9)}
+    for row in rows:
+        assert row["hits"]
+        for start, end in row["hits"]:
+            assert row["text"][start:end].lower() in {"audit of the", "auditor"}
+
+    only = search_pages("remuneration", company_number="SC123456", conn=conn)
+    assert [(r["filing_date"], r["source"], r["text"]) for r in only] == [("2022-12-31", "ocr", FEE_TABLE)]
+    assert search_pages("remuneration", filing_date="2023-06-30", conn=conn)[0]["page"] == 5
+    assert len(search_pages("remuneration", limit=1, conn=conn)) == 1
+
+
+def test_search_pages_near_and_prefix_queries(conn):
+    assert [r["page"] for r in search_pages("NEAR(fees auditor, 6)", conn=conn)] == [5]
+    assert [r["page"] for r in search_pages("strateg*", conn=conn)] == [0]
+
+
+def test_reindexing_a_filing_replaces_its_pages(conn):
+    assert index_filing_pages(conn, "01234567", "2023-06-30", "text", [(2, "Directors' report")]) == 1
+    assert search_pages("remuneration", company_number="01234567", conn=conn) == []
+    assert [r["page"] for r in search_pages("directors", conn=conn)] == [2]
+    assert index_filing_pages(conn, "01234567", "2023-06-30", "text", [(3, "")]) == 0
+
+
+def test_invalid_query_raises_operational_error(conn):
+    with pytest.raises(sqlite3.OperationalError):
+        search_pages('"unterminated', conn=conn)
+
+
+def test_main_reports_invalid_query_in_one_line(tmp_path, monkeypatch):
+    monkeypatch.setattr(sys, "argv", ["search_filings.py", "NEAR(", "--index", str(tmp_path / "idx.sqlite")])
+    with pytest.raises(SystemExit) as exc:
+        search_filings.main()
+    message = str(exc.value.code)
+    assert message.startswith("[ERROR] invalid FTS5 query 'NEAR('")
+    assert "\n" not in message
+
+
+def test_main_filters_by_min_gbp(tmp_path, monkeypatch, capsys):
+    conn = open_page_index(tmp_path / "idx.sqlite")
+    index_filing_pages(conn, "01234567", "2023-06-30", "text", [(5, FEE_NOTE)])
+    index_filing_pages(conn, "SC123456", "2022-12-31", "ocr", [(9, FEE_TABLE)])
+    conn.close()
+    argv = ["search_filings.py", "remuneration", "--index", str(tmp_path / "idx.sqlite"), "--min-gbp", "1000000"]
+    monkeypatch.setattr(sys, "argv", argv)
+    search_filings.main()
+    out = capsys.readouterr().out.splitlines()
+    assert out[0].startswith("01234567 2023-06-30 text p5 £2,000,000")
+    assert out[-1] == "[DONE] pages: 1"
+
+
+def test_backfill_indexes_corpus_blocks(tmp_path, conn):
+    corpus = configure_corpus(tmp_path / "corpus")
+    try:
+        corpus_append("07654321", "2021-03-31", "mineru", [(4, "Auditor: Menzies LLP, Chartered Accountants")])
+    finally:
+        configure_corpus(None)
+    assert backfill(corpus.parent, conn) == 1
+    assert [(r["company_number"], r["page"]) for r in search_pages("menzies", conn=conn)] == [("07654321", 4)]
+
+
+@pytest.mark.parametrize(
+    "name, expected",
+    [
+        ("01234567_2023-06-30", ("01234567", "2023-06-30")),
+        ("SC123456_2022-12-31", ("SC123456", "2022-12-31")),
+        ("01234567_2023-06-30_repaired", None),
+        ("01234567", None),
+        ("01234567_20230630", None),
+    ],
+)
+def test_parse_filing_stem(name, expected):
+    assert parse_filing_stem(name) == expected